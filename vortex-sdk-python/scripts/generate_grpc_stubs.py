@@ -1,51 +1,179 @@
 """
 Generates Python gRPC stubs from .proto files for the Vortex SDK.
 """
-import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
+import importlib.resources
+import json
+import mmap
 import sys
 from pathlib import Path
-import shutil
 import os
 import re
+from typing import Optional, Set
 
-def post_process_generated_files(target_dir: Path):
+# Set VORTEX_GEN_VERBOSE=1 to log every file touched by post-processing.
+VERBOSE = os.environ.get("VORTEX_GEN_VERBOSE") == "1"
+
+# Absolute imports emitted by protoc that must become package-relative:
+# 'from vortex.api.v1 import module' (group 1) or
+# 'import vortex.api.v1.module as alias' (groups 2 and 3).
+# Generated stubs are ASCII, so the rewrite operates on bytes and skips decoding.
+_ABS_IMPORT_RE = re.compile(
+    rb"from vortex\.api\.v1 import (\w+_pb2(?:_grpc)?)"
+    rb"|import vortex\.api\.v1\.(\w+_pb2(?:_grpc)?)\s+as\s+(\w+)"
+)
+
+_ABS_IMPORT_PREFIX = b"vortex.api.v1"
+
+# Below this size, mapping a file costs more than simply reading it.
+_MMAP_MIN_SIZE = 32 * 1024
+
+def _relative_import(match: re.Match) -> bytes:
+    if match.group(1):
+        return b"from . import " + match.group(1)
+    return b"from . import " + match.group(2) + b" as " + match.group(3)
+
+# Sidecar recording, per .proto file, the fingerprint the current stubs were
+# generated from, plus a fingerprint of the toolchain that generated them. It lives
+# next to this script (and is gitignored) so it never ships inside the package.
+BUILDINFO_FILENAME = ".proto_buildinfo.json"
+
+# 'import "vortex/api/v1/<name>.proto";' lines; other imports (e.g. the
+# well-known types) are not part of this build.
+_PROTO_IMPORT_RE = re.compile(rb'^\s*import\s+(?:public\s+|weak\s+)?"(vortex/api/v1/[^"]+\.proto)"\s*;', re.M)
+
+def _imported_protos(proto_source_dir: Path, proto_files: list) -> Set[str]:
+    """Returns the protos in `proto_files` that another proto of the build imports."""
+    imported: Set[str] = set()
+    for rel_path in proto_files:
+        imported.update(m.decode() for m in _PROTO_IMPORT_RE.findall((proto_source_dir / rel_path).read_bytes()))
+    return imported & set(proto_files)
+
+def _toolchain_fingerprint(protoc_version: str) -> str:
+    """
+    Fingerprints what every generated stub depends on besides its own .proto:
+    the grpcio-tools version and this script (which post-processes the output).
+    """
+    h = hashlib.sha256(protoc_version.encode())
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+def _proto_fingerprint(proto_path: Path, previous: Optional[dict]) -> dict:
+    """
+    Returns the {mtime_ns, sha256} fingerprint of a .proto file, reusing the
+    previous hash when the modification time has not moved.
+    """
+    mtime_ns = proto_path.stat().st_mtime_ns
+    if previous and previous.get("mtime_ns") == mtime_ns:
+        return previous
+    return {"mtime_ns": mtime_ns, "sha256": hashlib.sha256(proto_path.read_bytes()).hexdigest()}
+
+def _load_buildinfo(buildinfo_path: Path) -> dict:
+    try:
+        return json.loads(buildinfo_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+GENERATED_SUFFIXES = ("_pb2.py", "_pb2.pyi", "_pb2_grpc.py")
+
+def _generated_filenames(proto_file: str) -> Set[str]:
+    """Files protoc emits into the v1 package for 'vortex/api/v1/<name>.proto'."""
+    stem = Path(proto_file).stem
+    return {stem + suffix for suffix in GENERATED_SUFFIXES}
+
+def _has_all_outputs(v1_dir: Path, proto_file: str) -> bool:
+    """Whether every file protoc emits for `proto_file` is present in `v1_dir`."""
+    return all((v1_dir / name).is_file() for name in _generated_filenames(proto_file))
+
+def _remove_stale_stubs(v1_dir: Path, proto_files: list) -> None:
+    """Deletes generated files in `v1_dir` whose source .proto has been removed."""
+    if not v1_dir.is_dir():
+        return
+    expected = set().union(*(_generated_filenames(p) for p in proto_files))
+    for entry in os.scandir(v1_dir):
+        if entry.name.endswith(GENERATED_SUFFIXES) and entry.name not in expected:
+            print(f"Removing stale generated file: {entry.name}")
+            os.unlink(entry.path)
+
+# The generated tree always needs exactly these (empty) package markers.
+PACKAGE_INIT_FILES = ("vortex/__init__.py", "vortex/api/__init__.py", "vortex/api/v1/__init__.py")
+
+def _ensure_init(init_path: Path) -> None:
+    """Creates the empty file `init_path` unless it already exists."""
+    # A single exclusive open: no stat beforehand and, unlike Path.touch,
+    # no utime() call when the file is already there.
+    try:
+        fd = os.open(init_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return
+    os.close(fd)
+
+def _run_protoc(args: list) -> int:
+    import grpc_tools.protoc # type: ignore
+    return grpc_tools.protoc.main(args)
+
+def _compile_protos(protoc_args: list, proto_files: list) -> int:
+    """
+    Compiles `proto_files` and returns protoc's exit status.
+
+    protoc is single-threaded and each .proto produces its own output files, so
+    several protos are split into shards compiled by concurrent protoc runs. A
+    single shard runs in-process, reusing the already-loaded grpc_tools instead
+    of paying for a new interpreter.
+    """
+    num_shards = min(len(proto_files), os.cpu_count() or 1)
+    if num_shards <= 1:
+        return _run_protoc(protoc_args + proto_files)
+    shards = [proto_files[i::num_shards] for i in range(num_shards)]
+    with ProcessPoolExecutor(max_workers=num_shards) as executor:
+        return max(executor.map(_run_protoc, [protoc_args + shard for shard in shards]))
+
+def _rewrite_imports(path: str) -> None:
+    """Rewrites the absolute imports of a single generated file in place."""
+    if VERBOSE:
+        # A single write keeps lines from different worker threads intact
+        sys.stdout.write(f"  Processing {os.path.basename(path)}\n")
+    # Read and rewrite in place through a single file descriptor
+    with open(path, "r+b") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            # Scan large files straight from the page cache instead of copying
+            # them into a bytes object first. The mapping is closed before writing.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(_ABS_IMPORT_PREFIX) == -1:
+                    return
+                content, replaced = _ABS_IMPORT_RE.subn(_relative_import, mm)
+        else:
+            content = f.read()
+            # Both import forms contain this literal; a substring scan is far cheaper
+            # than running the regex over files that have nothing to rewrite.
+            if _ABS_IMPORT_PREFIX not in content:
+                return
+            content, replaced = _ABS_IMPORT_RE.subn(_relative_import, content)
+        if replaced:
+            f.seek(0)
+            f.write(content)
+            f.truncate()
+
+def post_process_generated_files(target_dir: Path, filenames: Optional[Set[str]] = None):
     """
     Converts absolute imports in generated gRPC files to relative imports.
     e.g., 'from vortex.api.v1 import xxx_pb2' becomes 'from . import xxx_pb2'
+    If `filenames` is given, only those files in `target_dir` are processed.
     """
     print(f"Post-processing files in {target_dir}...")
-    for filepath in target_dir.glob("*.py"):
-        print(f"  Processing {filepath.name}")
-        content = filepath.read_text()
-        # Regex for 'from vortex.api.v1 import module'
-        content = re.sub(
-            r"from vortex\.api\.v1 import (\w+_pb2(?:_grpc)?)",
-            r"from . import \1",
-            content
-        )
-        # Regex for 'import vortex.api.v1.module as alias'
-        content = re.sub(
-            r"import vortex\.api\.v1\.(\w+_pb2(?:_grpc)?)\s+as\s+(\w+)",
-            r"from . import \1 as \2",
-            content
-        )
-        filepath.write_text(content)
-
-    for filepath in target_dir.glob("*.pyi"): # Also process .pyi files
-        print(f"  Processing {filepath.name} (stub)")
-        content = filepath.read_text()
-        content = re.sub(
-            r"from vortex\.api\.v1 import (\w+_pb2(?:_grpc)?)",
-            r"from . import \1",
-            content
-        )
-        content = re.sub(
-            r"import vortex\.api\.v1\.(\w+_pb2(?:_grpc)?)\s+as\s+(\w+)",
-            r"from . import \1 as \2",
-            content
-        )
-        filepath.write_text(content)
-    print("Post-processing complete.")
+    # One directory scan covers both the modules and their .pyi stubs. Paths stay
+    # plain strings from here on; pathlib is only used at the function boundary.
+    paths = [
+        entry.path for entry in os.scandir(os.fspath(target_dir))
+        if entry.name.endswith((".py", ".pyi")) and entry.is_file()
+        and (filenames is None or entry.name in filenames)
+    ]
+    if paths:
+        # Files are independent of each other, so overlap their reads and writes
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            list(executor.map(_rewrite_imports, paths))
+    print(f"Post-processing complete ({len(paths)} files).")
 
 def main():
     """Main function to generate gRPC stubs."""
@@ -61,79 +189,118 @@ def main():
         print(f"Error: Proto source directory not found: {proto_source_dir}")
         sys.exit(1)
 
-    # Ensure the base output directory exists, and clean it if it does
-    if output_dir.exists():
-        print(f"Cleaning existing output directory: {output_dir}")
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     # Path to protoc plugin from grpc_tools
     try:
         import grpc_tools.protoc # type: ignore
+        from grpc_tools import grpc_version # type: ignore
     except ImportError:
         print("Error: grpcio-tools is not installed. Please install it (`poetry install --with dev`).")
         sys.exit(1)
 
-    proto_files_to_compile = [
-        str(p.relative_to(proto_source_dir)) for p in proto_source_dir.glob("vortex/api/v1/*.proto")
-    ]
+    # The protos live at a fixed depth, so list that directory directly
+    # rather than going through pathlib's generic glob matcher. Sorting makes
+    # protoc invocations and shard assignment independent of directory order.
+    proto_v1_dir = proto_source_dir / "vortex" / "api" / "v1"
+    proto_files_to_compile = []
+    if proto_v1_dir.is_dir():
+        proto_files_to_compile = sorted(
+            f"vortex/api/v1/{entry.name}"
+            for entry in os.scandir(proto_v1_dir)
+            if entry.name.endswith(".proto") and entry.is_file()
+        )
 
     if not proto_files_to_compile:
-        print(f"No .proto files found in {proto_source_dir / 'vortex/api/v1'}")
+        print(f"No .proto files found in {proto_v1_dir}")
         sys.exit(1)
 
     print(f"Found proto files: {proto_files_to_compile}")
+
+    # Only recompile the protos whose contents changed since the last run, or whose
+    # generated files are missing. A new toolchain, or a change to a proto that other
+    # protos import, falls back to recompiling everything.
+    buildinfo_path = Path(__file__).parent / BUILDINFO_FILENAME
+    previous_buildinfo = _load_buildinfo(buildinfo_path)
+    toolchain = _toolchain_fingerprint(grpc_version.VERSION)
+    v1_dir = output_dir / "vortex" / "api" / "v1"
+    previous_protos = {
+        rel_path: fingerprint
+        for rel_path, fingerprint in previous_buildinfo.get("protos", {}).items()
+        if _has_all_outputs(v1_dir, rel_path)
+    }
+    full_rebuild = previous_buildinfo.get("toolchain") != toolchain
+    if full_rebuild:
+        previous_protos = {}
+
+    # Stubs of protos that no longer exist are the only files that need removing;
+    # everything else is overwritten in place by protoc.
+    _remove_stale_stubs(v1_dir, proto_files_to_compile)
+
+    current_protos = {
+        rel_path: _proto_fingerprint(proto_source_dir / rel_path, previous_protos.get(rel_path))
+        for rel_path in proto_files_to_compile
+    }
+    buildinfo = {"toolchain": toolchain, "protos": current_protos}
+    changed_protos = [
+        rel_path for rel_path in proto_files_to_compile
+        if previous_protos.get(rel_path, {}).get("sha256") != current_protos[rel_path]["sha256"]
+    ]
+    if not full_rebuild and set(changed_protos) & _imported_protos(proto_source_dir, proto_files_to_compile):
+        print("An imported proto changed; recompiling every proto file.")
+        full_rebuild = True
+    else:
+        proto_files_to_compile = changed_protos
+    if not proto_files_to_compile:
+        print(f"gRPC stubs in {output_dir} are up to date.")
+        if buildinfo != previous_buildinfo: # Refresh mtimes so the next run can skip hashing
+            buildinfo_path.write_text(json.dumps(buildinfo, indent=2, sort_keys=True))
+        return
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if not full_rebuild:
+        print(f"Recompiling changed proto files: {proto_files_to_compile}")
+
     print(f"Proto include path: {proto_source_dir}")
     print(f"Output base directory: {output_dir}")
 
-    protoc_command = [
-        sys.executable,  # Use the current Python interpreter
-        "-m", "grpc_tools.protoc",
+    # protoc is invoked in-process, so the well-known types (google/protobuf/*.proto)
+    # that `python -m grpc_tools.protoc` would add to the include path are added here.
+    well_known_protos_dir = importlib.resources.files("grpc_tools") / "_proto"
+    protoc_args = [
+        "grpc_tools.protoc",  # argv[0], ignored by protoc
         f"-I{proto_source_dir}",
+        f"-I{well_known_protos_dir}",
         f"--python_out={output_dir}",
         f"--pyi_out={output_dir}",  # For .pyi stub files
         f"--grpc_python_out={output_dir}",
-    ] + proto_files_to_compile
+    ]
 
-    print(f"Running command: {' '.join(protoc_command)}")
-    
-    try:
-        process = subprocess.run(protoc_command, capture_output=True, text=True, check=True)
-        print("gRPC stubs generated successfully.")
-        if process.stdout:
-            print("protoc stdout:\n", process.stdout)
-        if process.stderr:
-            print("protoc stderr:\n", process.stderr) # protoc often outputs to stderr even on success
-            
-        # Create __init__.py files to make the generated directories packages
-        # The output structure will be output_dir/vortex/api/v1/*.py
-        # So we need __init__.py in output_dir/vortex and output_dir/vortex/api
-        (output_dir / "vortex").mkdir(parents=True, exist_ok=True) # Ensure vortex dir exists if not created by protoc
-        (output_dir / "vortex" / "__init__.py").touch(exist_ok=True)
-        (output_dir / "vortex" / "api").mkdir(parents=True, exist_ok=True) # Ensure api dir exists
-        (output_dir / "vortex" / "api" / "__init__.py").touch(exist_ok=True)
-        
-        # Ensure the specific v1 directory exists before trying to touch __init__.py or post-process
-        v1_dir = output_dir / "vortex" / "api" / "v1"
-        if not v1_dir.exists():
-            # This case might happen if no protos were actually compiled into this specific path
-            # or if protoc output structure is different than expected.
-            # However, protoc should create it if there are files.
-            print(f"Warning: Expected directory {v1_dir} not found after protoc. Skipping __init__.py and post-processing for it.")
-        else:
-            (v1_dir / "__init__.py").touch(exist_ok=True)
-            print(f"Created __init__.py files in {output_dir / 'vortex'}")
-            # Post-process the generated files in the v1 directory
-            post_process_generated_files(v1_dir)
-
-    except subprocess.CalledProcessError as e:
-        print(f"Error generating gRPC stubs: {e}")
-        print("stdout:\n", e.stdout)
-        print("stderr:\n", e.stderr)
-        sys.exit(1)
-    except FileNotFoundError:
-        print("Error: python or grpc_tools.protoc not found. Make sure Python and grpcio-tools are in your PATH.")
+    print(f"Running protoc with arguments: {' '.join(protoc_args[1:] + proto_files_to_compile)}")
+
+    # protoc writes its diagnostics straight to the stdout/stderr file descriptors
+    # as it runs, so nothing is buffered; flush our own output first so it is not
+    # reordered after protoc's when stdout is a pipe.
+    sys.stdout.flush()
+    if _compile_protos(protoc_args, proto_files_to_compile) != 0:
+        print("Error generating gRPC stubs: protoc exited with a non-zero status (see output above).")
         sys.exit(1)
+    print("gRPC stubs generated successfully.")
+
+    # Ensure the specific v1 directory exists before creating __init__.py files or post-processing
+    if not v1_dir.exists():
+        # This case might happen if no protos were actually compiled into this specific path
+        # or if protoc output structure is different than expected.
+        # However, protoc should create it if there are files.
+        print(f"Warning: Expected directory {v1_dir} not found after protoc. Skipping __init__.py and post-processing for it.")
+    else:
+        # protoc emits modules only, so create the package markers. Since v1_dir
+        # exists, so do the parent directories of all of them.
+        for rel_path in PACKAGE_INIT_FILES:
+            _ensure_init(output_dir / rel_path)
+        print(f"Created __init__.py files in {output_dir / 'vortex'}")
+        # Post-process the generated files in the v1 directory
+        regenerated = set().union(*(_generated_filenames(p) for p in proto_files_to_compile))
+        post_process_generated_files(v1_dir, regenerated)
+        buildinfo_path.write_text(json.dumps(buildinfo, indent=2, sort_keys=True))
 
 if __name__ == "__main__":
     main()
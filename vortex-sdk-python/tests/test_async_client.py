@@ -1,176 +1,239 @@
 """
 Unit tests for the AsyncVortexClient.
 """
+import asyncio
+import sys
+from types import SimpleNamespace
 import pytest
 import grpc.aio # type: ignore
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock, call, patch
 
-from vortex_sdk import AsyncVortexClient, models
+from vortex_sdk import AsyncVortexClient, conversions, models
+from vortex_sdk.client import _DEFAULT_GRPC_OPTIONS
 from vortex_sdk.exceptions import VortexApiError, VortexConnectionError, VortexException, VortexClientConfigurationError
-from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2
-from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2
-from vortex_sdk._grpc.vortex.api.v1 import common_pb2
 
-@pytest.fixture
+if sys.platform != "win32":
+    try:
+        import uvloop # type: ignore
+    except ImportError: # uvloop is an optional dev dependency
+        uvloop = None
+else:
+    uvloop = None
+
+# Under `pytest -n auto --dist=loadgroup` the whole module runs on one worker, so the
+# session-scoped client and mocks below are built once rather than once per worker.
+pytestmark = pytest.mark.xdist_group("async_client")
+
+# --- Enum members used throughout, bound once ---
+
+_SC_UNAVAILABLE = grpc.StatusCode.UNAVAILABLE
+_SC_RESOURCE_EXHAUSTED = grpc.StatusCode.RESOURCE_EXHAUSTED
+_SC_INVALID_ARG = grpc.StatusCode.INVALID_ARGUMENT
+_SC_INTERNAL = grpc.StatusCode.INTERNAL
+_SC_DATA_LOSS = grpc.StatusCode.DATA_LOSS
+_DM_COSINE = models.DistanceMetric.COSINE
+_DM_L2 = models.DistanceMetric.EUCLIDEAN_L2
+
+# --- Errors built once for the whole module ---
+
+def _aio_rpc_error(code: grpc.StatusCode, details: str) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(code, initial_metadata=None, trailing_metadata=None, details=details)
+
+_INTERNAL_ERR = _aio_rpc_error(_SC_INTERNAL, "Async Internal Error")
+_UNAVAILABLE_ERR = _aio_rpc_error(_SC_UNAVAILABLE, "Async Unavailable")
+_RESOURCE_EXHAUSTED_ERR = _aio_rpc_error(_SC_RESOURCE_EXHAUSTED, "Async Resource exhausted")
+_INVALID_ARG_ERR = _aio_rpc_error(_SC_INVALID_ARG, "Async Invalid argument")
+
+def _raise_then_return(err, n_raises, final_value):
+    """Side effect that raises `err` for the first `n_raises` calls, then returns `final_value`."""
+    counter = {"n": 0}
+    def side(*args, **kwargs):
+        if counter["n"] < n_raises:
+            counter["n"] += 1
+            raise err
+        return final_value
+    return side
+
+def _expected_backoff_schedule(initial_ms, mult, max_ms, jitter_fraction, n):
+    """Sleep durations in seconds for `n` retries, with jitter fixed at `jitter_fraction` of the bound."""
+    return [min(max_ms, initial_ms * mult ** attempt) * jitter_fraction / 1000.0 for attempt in range(n)]
+
+def _check_awaited_once(m, expected_arg=None):
+    """Asserts `m` was awaited exactly once and returns the request it was awaited with."""
+    assert m.await_count == 1
+    request = m.call_args.args[0] if m.call_args.args else None
+    if expected_arg is not None:
+        assert request == expected_arg
+    return request
+
+@pytest.fixture(scope="session")
+def pb2():
+    """Protobuf modules, RPC names and canned responses, built on first use rather than at collection."""
+    from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2 as c
+    from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2 as p
+    from vortex_sdk._grpc.vortex.api.v1 import common_pb2 as common
+
+    return SimpleNamespace(
+        c=c, p=p, common=common,
+        # The generated stubs only create their RPC attributes in __init__, so autospeccing
+        # the class finds nothing; the RPC names come from the service descriptors instead.
+        COLLECTIONS_RPCS=tuple(c.DESCRIPTOR.services_by_name["CollectionsService"].methods_by_name),
+        POINTS_RPCS=tuple(p.DESCRIPTOR.services_by_name["PointsService"].methods_by_name),
+        EMPTY_CREATE_RESP=c.CreateCollectionResponse(),
+        GET_INFO_RESP=c.GetCollectionInfoResponse(
+            collection_name="info_coll_async",
+            status=c.CollectionStatus.GREEN,
+            vector_count=100,
+            config=common.HnswConfigParams(m=8, ef_construction=50, ef_search=20, ml=0.3, vector_dim=64, m_max0=16),
+            distance_metric=common.DistanceMetric.EUCLIDEAN_L2
+        ),
+        UPSERT_RESP=p.UpsertPointsResponse(
+            statuses=[common.PointOperationStatus(point_id="ap1", status_code=common.StatusCode.OK)]
+        ),
+        SEARCH_RESP=p.SearchPointsResponse(
+            results=[common.ScoredPoint(id="asp1", score=0.9, vector=common.Vector(elements=[0.51, 0.61]))]
+        ),
+        SEARCH_EF_RESP=p.SearchPointsResponse(
+            results=[common.ScoredPoint(id="asp_ef", score=0.95)]
+        ),
+        SEARCH_EMPTY_EF_RESP=p.SearchPointsResponse(
+            results=[common.ScoredPoint(id="asp_empty_ef", score=0.93)]
+        ),
+    )
+
+# The gRPC mocks and the client below are built once per session; the autouse
+# `_reset_async_mocks` fixture restores them to a clean state before every test.
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Runs the async tests on uvloop when it is available."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+@pytest.fixture(scope="session")
 def mock_aio_grpc_channel():
-    # For grpc.aio.Channel, methods like close are coroutines
-    channel = MagicMock(spec=grpc.aio.Channel)
+    # close() is the only grpc.aio.Channel coroutine the client uses
+    channel = MagicMock(spec_set=["close"])
     channel.close = AsyncMock() 
     return channel
 
-@pytest.fixture
-def mock_aio_collections_stub():
+def _aio_stub_mock(rpcs):
     # For stubs used with grpc.aio.Channel, RPC methods are coroutines
-    stub = MagicMock()
-    stub.CreateCollection = AsyncMock()
-    stub.GetCollectionInfo = AsyncMock()
-    stub.ListCollections = AsyncMock()
-    stub.DeleteCollection = AsyncMock()
+    stub = MagicMock(spec_set=rpcs)
+    for rpc in rpcs:
+        setattr(stub, rpc, AsyncMock())
     return stub
 
-@pytest.fixture
-def mock_aio_points_stub():
-    stub = MagicMock()
-    stub.UpsertPoints = AsyncMock()
-    stub.GetPoints = AsyncMock()
-    stub.DeletePoints = AsyncMock()
-    stub.SearchPoints = AsyncMock()
-    return stub
+@pytest.fixture(scope="session")
+def mock_aio_collections_stub(pb2):
+    return _aio_stub_mock(pb2.COLLECTIONS_RPCS)
 
-@pytest.fixture
-async def async_client(mocker, mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub):
-    """Fixture to create an AsyncVortexClient with mocked gRPC stubs."""
-    mocker.patch('grpc.aio.insecure_channel', return_value=mock_aio_grpc_channel)
-    
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
-    
-    # Mock the connect method to prevent real connection attempts during test setup
-    # and to allow manual assignment of stubs.
-    mocker.patch('vortex_sdk.client.AsyncVortexClient.connect', AsyncMock())
+@pytest.fixture(scope="session")
+def mock_aio_points_stub(pb2):
+    return _aio_stub_mock(pb2.POINTS_RPCS)
 
+@pytest.fixture(scope="session")
+def session_async_client(mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub):
+    """An AsyncVortexClient wired to the mocked channel and stubs."""
+    # Stubs are assigned directly, so the client methods never call connect().
     aclient = AsyncVortexClient(host="mockhost", port=12345)
-    # Manually assign stubs as connect is mocked
     aclient._channel = mock_aio_grpc_channel
     aclient._collections_stub = mock_aio_collections_stub
     aclient._points_stub = mock_aio_points_stub
-    
-    # We don't call await aclient.connect() here because the test methods
-    # themselves will trigger it if stubs are None, or we can call it explicitly.
-    # For tests that assume connection, we can call it.
-    # Let's assume tests will ensure connection or it's handled by __aenter__ if used.
     return aclient
 
-# --- Async Connection Tests ---
-
-@pytest.mark.asyncio
-async def test_async_client_connect_insecure(mocker, mock_aio_collections_stub, mock_aio_points_stub):
-    """Test insecure async channel creation."""
-    mock_insecure_channel = mocker.patch('grpc.aio.insecure_channel', return_value=MagicMock(spec=grpc.aio.Channel))
-    # Ensure the channel's close method is an AsyncMock
-    mock_insecure_channel.return_value.close = AsyncMock()
+@pytest.fixture(scope="module", autouse=True)
+def _patch_stub_classes(mock_aio_collections_stub, mock_aio_points_stub):
+    """Makes connect() build the session stub mocks instead of real stubs, for the whole module."""
+    # Module scope rather than session scope, so the patch is undone before test_client.py runs.
+    with patch("vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub", return_value=mock_aio_collections_stub) as collections_cls, \
+            patch("vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub", return_value=mock_aio_points_stub) as points_cls:
+        yield collections_cls, points_cls
+
+@pytest.fixture(autouse=True)
+def _reset_async_mocks(pb2, session_async_client, mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub):
+    """Clears recorded calls, return values and side effects, and undoes client reconfiguration."""
+    # Only the coroutine methods get their configuration wiped; resetting the parent
+    # mocks' return values would also clear defaults such as __bool__.
+    for parent, methods in (
+        (mock_aio_grpc_channel, ("close",)),
+        (mock_aio_collections_stub, pb2.COLLECTIONS_RPCS),
+        (mock_aio_points_stub, pb2.POINTS_RPCS),
+    ):
+        parent.reset_mock()
+        for method in methods:
+            getattr(parent, method).reset_mock(return_value=True, side_effect=True)
+    client_state = vars(session_async_client).copy()
+    yield
+    vars(session_async_client).clear()
+    vars(session_async_client).update(client_state)
+
+@pytest.fixture(autouse=True)
+def fast_asyncio_sleep(mocker):
+    """Makes every backoff sleep return immediately; tests can request it to inspect the awaits."""
+    return mocker.patch("asyncio.sleep", new_callable=AsyncMock)
 
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
-
-    options = [("grpc.lb_policy_name", "pick_first")]
-    aclient = AsyncVortexClient(host="test_host_async", port=123, secure=False, grpc_options=options)
-    await aclient.connect() # Explicitly connect
-    
-    mock_insecure_channel.assert_called_once_with("test_host_async:123", options=options)
-    assert aclient._channel == mock_insecure_channel.return_value
-    assert aclient._collections_stub is not None
-    assert aclient._points_stub is not None
-    await aclient.close()
+@pytest.fixture
+def fast_random_uniform(mocker):
+    """Pins the retry jitter to the midpoint of its range."""
+    return mocker.patch("random.uniform", side_effect=lambda low, high: high / 2)
 
-@pytest.mark.asyncio
-async def test_async_client_connect_secure_server_auth(mocker, mock_aio_collections_stub, mock_aio_points_stub):
-    """Test secure async channel creation with server authentication."""
-    mock_secure_channel = mocker.patch('grpc.aio.secure_channel', return_value=MagicMock(spec=grpc.aio.Channel))
-    mock_secure_channel.return_value.close = AsyncMock()
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials)) # Corrected path
-    
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
+@pytest.fixture
+def async_client(session_async_client):
+    """Fixture to provide an AsyncVortexClient with mocked gRPC stubs."""
+    return session_async_client
 
-    root_certs_data = b"test_root_certs_async"
-    options = [("grpc.ssl_target_name_override", "server.name.async")]
-    
-    aclient = AsyncVortexClient(
-        host="secure_host_async", port=443, secure=True, 
-        root_certs=root_certs_data, grpc_options=options
-    )
-    await aclient.connect()
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=root_certs_data,
-        private_key=None,
-        certificate_chain=None
-    )
-    mock_secure_channel.assert_called_once_with(
-        "secure_host_async:443", mock_ssl_creds.return_value, options=options
-    )
-    assert aclient._channel == mock_secure_channel.return_value
-    await aclient.close()
+# --- Async Connection Tests ---
 
 @pytest.mark.asyncio
-async def test_async_client_connect_secure_mtls(mocker, mock_aio_collections_stub, mock_aio_points_stub):
-    """Test secure async channel creation with mutual TLS."""
-    mock_secure_channel = mocker.patch('grpc.aio.secure_channel', return_value=MagicMock(spec=grpc.aio.Channel))
-    mock_secure_channel.return_value.close = AsyncMock()
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials)) # Corrected path
-    
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
+@pytest.mark.parametrize("secure,root_certs,private_key,cert_chain,options", [
+    (False, None, None, None, [("grpc.lb_policy_name", "pick_first")]),
+    (True, b"test_root_certs_async", None, None, [("grpc.ssl_target_name_override", "server.name.async")]),
+    (True, b"test_root_certs_mtls_async", b"test_private_key_mtls_async", b"test_cert_chain_mtls_async", None),
+    (True, None, None, None, None),
+], ids=["insecure", "secure_server_auth", "secure_mtls", "secure_system_ca"])
+async def test_async_client_connect(mocker, secure, root_certs, private_key, cert_chain, options):
+    """Test async channel creation for insecure, server-auth, mTLS and system-CA setups."""
+    mock_insecure_channel = mocker.patch('grpc.aio.insecure_channel', return_value=MagicMock())
+    mock_secure_channel = mocker.patch('grpc.aio.secure_channel', return_value=MagicMock())
+    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock())
+    expected_channel = mock_secure_channel if secure else mock_insecure_channel
+    # Ensure the channel's close method is an AsyncMock
+    expected_channel.return_value.close = AsyncMock()
 
-    root_certs_data = b"test_root_certs_mtls_async"
-    private_key_data = b"test_private_key_mtls_async"
-    cert_chain_data = b"test_cert_chain_mtls_async"
-    
     aclient = AsyncVortexClient(
-        host="mtls_host_async", port=443, secure=True, 
-        root_certs=root_certs_data, private_key=private_key_data, certificate_chain=cert_chain_data
-    )
-    await aclient.connect()
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=root_certs_data,
-        private_key=private_key_data,
-        certificate_chain=cert_chain_data
+        host="test_host_async", port=443, secure=secure,
+        root_certs=root_certs, private_key=private_key, certificate_chain=cert_chain,
+        grpc_options=options
     )
-    mock_secure_channel.assert_called_once_with(
-        "mtls_host_async:443", mock_ssl_creds.return_value, options=None
-    )
-    await aclient.close()
+    await aclient.connect() # Explicitly connect
+    expected_options = list(_DEFAULT_GRPC_OPTIONS) + (options or [])
 
-@pytest.mark.asyncio
-async def test_async_client_connect_secure_system_ca(mocker, mock_aio_collections_stub, mock_aio_points_stub):
-    """Test secure async channel using system CAs."""
-    mock_secure_channel = mocker.patch('grpc.aio.secure_channel', return_value=MagicMock(spec=grpc.aio.Channel))
-    mock_secure_channel.return_value.close = AsyncMock()
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials)) # Corrected path
-    
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
-    
-    aclient = AsyncVortexClient(host="systemca_host_async", port=443, secure=True)
-    await aclient.connect()
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=None, private_key=None, certificate_chain=None
-    )
-    mock_secure_channel.assert_called_once_with(
-        "systemca_host_async:443", mock_ssl_creds.return_value, options=None
-    )
+    if secure:
+        mock_ssl_creds.assert_called_once_with(
+            root_certificates=root_certs,
+            private_key=private_key,
+            certificate_chain=cert_chain
+        )
+        mock_secure_channel.assert_called_once_with(
+            "test_host_async:443", mock_ssl_creds.return_value, options=expected_options
+        )
+        mock_insecure_channel.assert_not_called()
+    else:
+        mock_insecure_channel.assert_called_once_with("test_host_async:443", options=expected_options)
+        mock_secure_channel.assert_not_called()
+        mock_ssl_creds.assert_not_called()
+    assert aclient._channel == expected_channel.return_value
+    assert aclient._collections_stub is not None
+    assert aclient._points_stub is not None
     await aclient.close()
 
 
 @pytest.mark.asyncio
-async def test_async_client_context_manager(mocker, mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub):
+async def test_async_client_context_manager(mocker, mock_aio_grpc_channel):
     """Test the async client's async context manager."""
     mocker.patch('grpc.aio.insecure_channel', return_value=mock_aio_grpc_channel)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
 
     connect_spy = mocker.spy(AsyncVortexClient, 'connect')
     close_spy = mocker.spy(AsyncVortexClient, 'close')
@@ -185,80 +248,195 @@ async def test_async_client_context_manager(mocker, mock_aio_grpc_channel, mock_
     assert mock_aio_grpc_channel.close.called # Ensure the underlying channel's close was awaited
 
 
+@pytest.mark.asyncio
+async def test_async_client_connects_once_on_first_use(mocker, mock_aio_grpc_channel, mock_aio_collections_stub, pb2):
+    """Concurrent first calls share a single connect(); later calls skip it."""
+    mock_insecure_channel = mocker.patch('grpc.aio.insecure_channel', return_value=mock_aio_grpc_channel)
+    mock_aio_collections_stub.ListCollections.return_value = pb2.c.ListCollectionsResponse()
+    aclient = AsyncVortexClient(host="h", port=1)
+
+    await asyncio.gather(aclient.list_collections(), aclient.list_collections())
+    await aclient.list_collections()
+
+    mock_insecure_channel.assert_called_once()
+    assert mock_aio_collections_stub.ListCollections.await_count == 3
+    await aclient.close()
+
+def test_async_client_constructed_outside_loop(mocker, mock_aio_grpc_channel, mock_aio_collections_stub, pb2):
+    """The connect lock is made on first use, so a client built before its loop exists still works."""
+    mocker.patch('grpc.aio.insecure_channel', return_value=mock_aio_grpc_channel)
+    mock_aio_collections_stub.ListCollections.return_value = pb2.c.ListCollectionsResponse()
+    aclient = AsyncVortexClient(host="h", port=1)
+    assert aclient._connect_lock is None
+
+    async def use_client():
+        await asyncio.gather(aclient.list_collections(), aclient.list_collections())
+        await aclient.close()
+
+    asyncio.run(use_client())
+    assert mock_aio_collections_stub.ListCollections.await_count == 2
+
+@pytest.mark.asyncio
+async def test_async_client_channel_pool(mocker, pb2):
+    """pool_size opens one aio channel per slot and rotates RPCs across them."""
+    channels = [MagicMock(spec_set=["close"], close=AsyncMock()) for _ in range(2)]
+    mock_insecure_channel = mocker.patch('grpc.aio.insecure_channel', side_effect=channels)
+    coll_stubs = [_aio_stub_mock(pb2.COLLECTIONS_RPCS) for _ in channels]
+    mocker.patch("vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub", side_effect=coll_stubs)
+    for stub in coll_stubs:
+        stub.ListCollections.return_value = pb2.c.ListCollectionsResponse()
+
+    aclient = AsyncVortexClient(host="h", port=1, pool_size=2)
+    await aclient.connect()
+    assert mock_insecure_channel.call_args_list == [call("h:1", options=list(_DEFAULT_GRPC_OPTIONS) + [("grpc.use_local_subchannel_pool", 1)])] * 2
+
+    for _ in range(4):
+        await aclient.list_collections()
+    assert [stub.ListCollections.await_count for stub in coll_stubs] == [2, 2]
+
+    await aclient.close()
+    assert all(channel.close.await_count == 1 for channel in channels)
+
+
 # --- Async CollectionsService Method Tests ---
 
 @pytest.mark.asyncio
-async def test_async_create_collection_success(async_client, mock_aio_collections_stub):
-    mock_aio_collections_stub.CreateCollection.return_value = collections_service_pb2.CreateCollectionResponse()
+async def test_async_create_collection_success(async_client, mock_aio_collections_stub, pb2):
+    mock_aio_collections_stub.CreateCollection.return_value = pb2.EMPTY_CREATE_RESP
     
-    client_instance = await async_client # Await the fixture
-    await client_instance.create_collection(
+    await async_client.create_collection(
         collection_name="test_coll_async",
         vector_dimensions=128,
-        distance_metric=models.DistanceMetric.COSINE,
+        distance_metric=_DM_COSINE,
         hnsw_config=models.HnswConfigParams(m=16, ef_construction=100, ef_search=50, ml=0.5, vector_dim=128, m_max0=32)
     )
-    mock_aio_collections_stub.CreateCollection.assert_awaited_once()
+    _check_awaited_once(mock_aio_collections_stub.CreateCollection)
 
 @pytest.mark.asyncio
 async def test_async_create_collection_api_error(async_client, mock_aio_collections_stub):
-    # Create a mock AioRpcError object
-    mock_error = grpc.aio.AioRpcError(grpc.StatusCode.INTERNAL, initial_metadata=None, trailing_metadata=None, details="Mock gRPC async error")
-    mock_aio_collections_stub.CreateCollection.side_effect = mock_error
+    mock_aio_collections_stub.CreateCollection.side_effect = _INTERNAL_ERR
     
-    client_instance = await async_client # Await the fixture
     with pytest.raises(VortexApiError, match="Failed to create collection 'test_coll_async_fail'"):
-        await client_instance.create_collection(
+        await async_client.create_collection(
             collection_name="test_coll_async_fail",
             vector_dimensions=128,
-            distance_metric=models.DistanceMetric.EUCLIDEAN_L2
+            distance_metric=_DM_L2
         )
 
 @pytest.mark.asyncio
-async def test_async_get_collection_info_success(async_client, mock_aio_collections_stub):
-    mock_response = collections_service_pb2.GetCollectionInfoResponse(
-        collection_name="info_coll_async",
-        status=collections_service_pb2.CollectionStatus.GREEN,
-        vector_count=100,
-        config=common_pb2.HnswConfigParams(m=8, ef_construction=50, ef_search=20, ml=0.3, vector_dim=64, m_max0=16),
-        distance_metric=common_pb2.DistanceMetric.EUCLIDEAN_L2
-    )
-    mock_aio_collections_stub.GetCollectionInfo.return_value = mock_response
+async def test_async_get_collection_info_success(async_client, mock_aio_collections_stub, pb2):
+    mock_aio_collections_stub.GetCollectionInfo.return_value = pb2.GET_INFO_RESP
     
-    client_instance = await async_client # Await the fixture
-    info = await client_instance.get_collection_info("info_coll_async")
+    info = await async_client.get_collection_info("info_coll_async")
     
     assert info.collection_name == "info_coll_async"
     assert info.status == models.CollectionStatus.GREEN
-    mock_aio_collections_stub.GetCollectionInfo.assert_awaited_once()
+    _check_awaited_once(mock_aio_collections_stub.GetCollectionInfo)
 
 # --- Async PointsService Method Tests ---
 
 @pytest.mark.asyncio
-async def test_async_upsert_points_success(async_client, mock_aio_points_stub):
+async def test_async_upsert_points_success(async_client, mock_aio_points_stub, pb2):
     points_to_upsert = [models.PointStruct(id="ap1", vector=models.Vector(elements=[0.1, 0.2]))]
-    mock_response = points_service_pb2.UpsertPointsResponse(
-        statuses=[common_pb2.PointOperationStatus(point_id="ap1", status_code=common_pb2.StatusCode.OK)]
-    )
-    mock_aio_points_stub.UpsertPoints.return_value = mock_response
+    mock_aio_points_stub.UpsertPoints.return_value = pb2.UPSERT_RESP
 
-    client_instance = await async_client # Await the fixture
-    statuses = await client_instance.upsert_points(collection_name="upsert_coll_async", points=points_to_upsert)
+    statuses = await async_client.upsert_points(collection_name="upsert_coll_async", points=points_to_upsert)
 
     assert len(statuses) == 1
     assert statuses[0].point_id == "ap1"
-    mock_aio_points_stub.UpsertPoints.assert_awaited_once()
+    _check_awaited_once(mock_aio_points_stub.UpsertPoints)
 
 @pytest.mark.asyncio
-async def test_async_search_points_success(async_client, mock_aio_points_stub):
-    query_vec = models.Vector(elements=[0.5, 0.6])
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[common_pb2.ScoredPoint(id="asp1", score=0.9, vector=common_pb2.Vector(elements=[0.51, 0.61]))]
+async def test_async_upsert_points_many(async_client, mock_aio_points_stub, pb2):
+    """upsert_points_many sends one RPC per batch, bounded by max_in_flight, in input order."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def upsert(request, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        # asyncio.sleep is patched out for every test, so yield to the loop through a future
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+        in_flight["now"] -= 1
+        return pb2.p.UpsertPointsResponse(statuses=[
+            pb2.common.PointOperationStatus(point_id=pt.id, status_code=pb2.common.StatusCode.OK) for pt in request.points
+        ])
+
+    mock_aio_points_stub.UpsertPoints.side_effect = upsert
+    batches = [[models.PointStruct(id=f"b{i}", vector=models.Vector(elements=[0.1]))] for i in range(5)]
+
+    results = await async_client.upsert_points_many("many_coll", batches, max_in_flight=2)
+
+    assert [statuses[0].point_id for statuses in results] == [f"b{i}" for i in range(5)]
+    assert mock_aio_points_stub.UpsertPoints.await_count == 5
+    assert in_flight["peak"] == 2
+    with pytest.raises(VortexClientConfigurationError):
+        await async_client.upsert_points_many("many_coll", batches, max_in_flight=0)
+
+@pytest.mark.asyncio
+async def test_async_upsert_points_many_failure_cancels_rest(async_client, mock_aio_points_stub, pb2):
+    """The first failed batch raises, and batches still queued or in flight are cancelled."""
+    started, finished = [], []
+
+    async def upsert(request, **kwargs):
+        point_id = request.points[0].id
+        started.append(point_id)
+        loop = asyncio.get_running_loop()
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+        finished.append(point_id)
+        if point_id == "b1":
+            return pb2.p.UpsertPointsResponse(overall_error="disk full")
+        return pb2.p.UpsertPointsResponse(statuses=[
+            pb2.common.PointOperationStatus(point_id=point_id, status_code=pb2.common.StatusCode.OK)
+        ])
+
+    mock_aio_points_stub.UpsertPoints.side_effect = upsert
+    batches = [[models.PointStruct(id=f"b{i}", vector=models.Vector(elements=[0.1]))] for i in range(6)]
+
+    with pytest.raises(VortexApiError, match="disk full"):
+        await async_client.upsert_points_many("many_coll", batches, max_in_flight=2)
+
+    # Give any batch left running the chance to finish before checking that none did
+    loop = asyncio.get_running_loop()
+    for _ in range(10):
+        yielded = loop.create_future()
+        loop.call_soon(yielded.set_result, None)
+        await yielded
+    assert finished == ["b0", "b1"]
+    assert "b5" not in started
+
+@pytest.mark.asyncio
+async def test_async_iter_collections(async_client, mock_aio_collections_stub, pb2):
+    mock_aio_collections_stub.ListCollections.return_value = pb2.c.ListCollectionsResponse(
+        collections=[pb2.c.CollectionDescription(name="ac1"), pb2.c.CollectionDescription(name="ac2")]
     )
-    mock_aio_points_stub.SearchPoints.return_value = mock_response
 
-    client_instance = await async_client # Await the fixture
-    results = await client_instance.search_points(
+    descriptions = await async_client.iter_collections()
+
+    _check_awaited_once(mock_aio_collections_stub.ListCollections)
+    assert [d.name for d in descriptions] == ["ac1", "ac2"]
+    assert [d.name for d in await async_client.list_collections()] == ["ac1", "ac2"]
+
+@pytest.mark.asyncio
+async def test_async_list_collections_conversion_error_is_wrapped(async_client, mock_aio_collections_stub, pb2, mocker):
+    mock_aio_collections_stub.ListCollections.return_value = pb2.c.ListCollectionsResponse(
+        collections=[pb2.c.CollectionDescription(name="ac1")]
+    )
+    mocker.patch.object(conversions, "grpc_to_pydantic_collection_description", side_effect=ValueError("bad description"))
+
+    with pytest.raises(VortexException, match="converting the result of listing collections: bad description"):
+        await async_client.list_collections()
+
+@pytest.mark.asyncio
+async def test_async_search_points_success(async_client, mock_aio_points_stub, pb2):
+    query_vec = models.Vector(elements=[0.5, 0.6])
+    mock_aio_points_stub.SearchPoints.return_value = pb2.SEARCH_RESP
+
+    results = await async_client.search_points(
         collection_name="search_coll_async", 
         query_vector=query_vec, 
         k_limit=5,
@@ -266,58 +444,45 @@ async def test_async_search_points_success(async_client, mock_aio_points_stub):
     )
     assert len(results) == 1
     assert results[0].id == "asp1"
-    assert results[0].score == pytest.approx(0.9)
-    mock_aio_points_stub.SearchPoints.assert_awaited_once()
-    call_args = mock_aio_points_stub.SearchPoints.call_args[0][0]
-    assert not call_args.HasField("params")
+    assert results[0].score == pytest.approx(0.9) # score is a float32 field, so 0.9 is not exact
+    req = _check_awaited_once(mock_aio_points_stub.SearchPoints)
+    assert not req.HasField("params")
 
 
 @pytest.mark.asyncio
-async def test_async_search_points_with_search_params(async_client, mock_aio_points_stub):
+async def test_async_search_points_with_search_params(async_client, mock_aio_points_stub, pb2):
     """Test async point search with SearchParams."""
     query_vec = models.Vector(elements=[0.7, 0.8])
     search_p = models.SearchParams(ef_search=150)
-    
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[common_pb2.ScoredPoint(id="asp_ef", score=0.95)]
-    )
-    mock_aio_points_stub.SearchPoints.return_value = mock_response
+    mock_aio_points_stub.SearchPoints.return_value = pb2.SEARCH_EF_RESP
 
-    client_instance = await async_client
-    results = await client_instance.search_points(
+    results = await async_client.search_points(
         collection_name="search_params_coll_async",
         query_vector=query_vec,
         k_limit=3,
         search_params=search_p
     )
     assert len(results) == 1
-    mock_aio_points_stub.SearchPoints.assert_awaited_once()
-    call_args = mock_aio_points_stub.SearchPoints.call_args[0][0]
-    assert call_args.collection_name == "search_params_coll_async"
-    assert call_args.HasField("params")
-    assert call_args.params.ef_search == 150
+    req = _check_awaited_once(mock_aio_points_stub.SearchPoints)
+    assert req.collection_name == "search_params_coll_async"
+    assert req.HasField("params")
+    assert req.params.ef_search == 150
 
 @pytest.mark.asyncio
-async def test_async_search_points_with_empty_search_params(async_client, mock_aio_points_stub):
+async def test_async_search_points_with_empty_search_params(async_client, mock_aio_points_stub, pb2):
     """Test async point search with SearchParams that results in None after conversion."""
     query_vec = models.Vector(elements=[0.7, 0.8])
     search_p_empty = models.SearchParams() # ef_search is None
-    
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[common_pb2.ScoredPoint(id="asp_empty_ef", score=0.93)]
-    )
-    mock_aio_points_stub.SearchPoints.return_value = mock_response
+    mock_aio_points_stub.SearchPoints.return_value = pb2.SEARCH_EMPTY_EF_RESP
 
-    client_instance = await async_client
-    await client_instance.search_points(
+    await async_client.search_points(
         collection_name="search_empty_params_coll_async",
         query_vector=query_vec,
         k_limit=2,
         search_params=search_p_empty
     )
-    mock_aio_points_stub.SearchPoints.assert_awaited_once()
-    call_args = mock_aio_points_stub.SearchPoints.call_args[0][0]
-    assert not call_args.HasField("params")
+    req = _check_awaited_once(mock_aio_points_stub.SearchPoints)
+    assert not req.HasField("params")
 
 
 # TODO: Add more async tests for list_collections, delete_collection, get_points, delete_points
@@ -329,191 +494,133 @@ async def test_async_search_points_with_empty_search_params(async_client, mock_a
 def mock_async_grpc_call():
     return AsyncMock() # For async methods
 
+@pytest.fixture
+def retry_only_client(mocker):
+    """A bare AsyncVortexClient for tests that only drive _execute_with_retry_async."""
+    mocker.patch("vortex_sdk.client.AsyncVortexClient.connect", AsyncMock())
+    return AsyncVortexClient(host="h", port=1)
+
+# Each row: client retry settings, (error, times raised, final return value) for the
+# call, then the expected result or VortexApiError message, call count, sleep count
+# and, where the schedule matters, the exact sleep durations in seconds.
 @pytest.mark.asyncio
-async def test_async_retry_disabled_successful_call(async_client, mock_async_grpc_call):
-    """Test successful async call when retries are disabled."""
-    client_instance = await async_client
-    client_instance.retries_enabled = False
-    mock_async_grpc_call.return_value = "async_success"
-    
-    result = await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op", "arg1", kwarg1="kwval1")
-    
-    assert result == "async_success"
-    mock_async_grpc_call.assert_awaited_once_with("arg1", kwarg1="kwval1")
-
-@pytest.mark.asyncio
-async def test_async_retry_disabled_grpc_error(async_client, mock_async_grpc_call):
-    """Test async gRPC error when retries are disabled."""
-    client_instance = await async_client
-    client_instance.retries_enabled = False
-    # Use grpc.aio.AioRpcError for async client
-    mock_error = grpc.aio.AioRpcError(grpc.StatusCode.INTERNAL, initial_metadata=None, trailing_metadata=None, details="Async gRPC failure")
-    mock_async_grpc_call.side_effect = mock_error
-    
-    with pytest.raises(VortexApiError, match="Failed to test_async_op_fail"):
-        await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_fail")
-    
-    mock_async_grpc_call.assert_awaited_once()
-
-@pytest.mark.asyncio
-async def test_async_retry_successful_on_first_attempt(async_client, mock_async_grpc_call):
-    """Test successful async call on the first attempt when retries are enabled."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
-    mock_async_grpc_call.return_value = "async_success_first_try"
-    
-    result = await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_first")
-    
-    assert result == "async_success_first_try"
-    mock_async_grpc_call.assert_awaited_once()
+@pytest.mark.parametrize("retry_config,side_effect,expect_result,expect_raises,expect_awaits,expect_sleeps,expected_sleep_values", [
+    ({"retries_enabled": False},
+     (None, 0, "async_success"), "async_success", None, 1, 0, None),
+    ({"retries_enabled": False},
+     (_INTERNAL_ERR, 1, None), None, "Failed to test_async_op", 1, 0, None),
+    ({"retries_enabled": True},
+     (None, 0, "async_success_first_try"), "async_success_first_try", None, 1, 0, None),
+    ({"retries_enabled": True, "max_retries": 1, "initial_backoff_ms": 100,
+      "retryable_status_codes": [_SC_UNAVAILABLE]},
+     (_UNAVAILABLE_ERR, 1, "async_success_after_retry"), "async_success_after_retry", None, 2, 1, None),
+    ({"retries_enabled": True, "max_retries": 2, "initial_backoff_ms": 50, "backoff_multiplier": 2.0,
+      "retry_jitter": True, "retryable_status_codes": [_SC_RESOURCE_EXHAUSTED]},
+     (_RESOURCE_EXHAUSTED_ERR, 3, None), None,
+     r"Failed to test_async_op \(Status Code: RESOURCE_EXHAUSTED\) Details: Async Resource exhausted",
+     3, 2, _expected_backoff_schedule(50, 2.0, float("inf"), 0.5, 2)),
+    ({"retries_enabled": True, "retryable_status_codes": [_SC_UNAVAILABLE]},
+     (_INVALID_ARG_ERR, 1, None), None, "Failed to test_async_op", 1, 0, None),
+    ({"retries_enabled": True, "max_retries": 3, "initial_backoff_ms": 1000, "max_backoff_ms": 2500,
+      "backoff_multiplier": 2.0, "retry_jitter": False, "retryable_status_codes": [_SC_UNAVAILABLE]},
+     (_UNAVAILABLE_ERR, 3, "async_success_capped_backoff"), "async_success_capped_backoff", None, 4, 3,
+     _expected_backoff_schedule(1000, 2.0, 2500, 1.0, 3)),
+], ids=[
+    "disabled_success", "disabled_grpc_error", "success_first_attempt", "success_after_one_retry",
+    "exhausted_all_attempts", "non_retryable_error", "backoff_capping",
+])
+async def test_async_retry(
+    fast_random_uniform, fast_asyncio_sleep, retry_only_client, mock_async_grpc_call,
+    retry_config, side_effect, expect_result, expect_raises, expect_awaits, expect_sleeps, expected_sleep_values
+):
+    """Test _execute_with_retry_async outcomes, attempt counts and backoff schedules."""
+    for name, value in retry_config.items():
+        setattr(retry_only_client, name, value)
+    mock_async_grpc_call.side_effect = _raise_then_return(*side_effect)
+
+    if expect_raises is None:
+        result = await retry_only_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op", "arg1", kwarg1="kwval1")
+        assert result == expect_result
+    else:
+        with pytest.raises(VortexApiError, match=expect_raises):
+            await retry_only_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op", "arg1", kwarg1="kwval1")
+
+    assert mock_async_grpc_call.await_count == expect_awaits
+    assert all(c == call("arg1", kwarg1="kwval1") for c in mock_async_grpc_call.await_args_list)
+    assert fast_asyncio_sleep.await_count == expect_sleeps
+    if expected_sleep_values is not None:
+        assert [c.args[0] for c in fast_asyncio_sleep.await_args_list] == expected_sleep_values # same arithmetic as the client, so exact
+    if expect_sleeps and retry_only_client.retry_jitter:
+        fast_random_uniform.assert_any_call(0, retry_only_client.initial_backoff_ms)
 
 @pytest.mark.asyncio
-@patch('asyncio.sleep', new_callable=AsyncMock) # Mock asyncio.sleep
-async def test_async_retry_succeeds_after_one_retryable_error(mock_async_sleep, async_client, mock_async_grpc_call):
-    """Test successful async call after one retryable gRPC error."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
-    client_instance.max_retries = 1
-    client_instance.initial_backoff_ms = 100
-    client_instance.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
-
-    mock_unavailable_error = grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, initial_metadata=None, trailing_metadata=None, details="Async Unavailable")
-    
-    mock_async_grpc_call.side_effect = [mock_unavailable_error, "async_success_after_retry"]
-    
-    result = await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_retry_once")
-    
-    assert result == "async_success_after_retry"
-    assert mock_async_grpc_call.await_count == 2
-    mock_async_sleep.assert_awaited_once()
+async def test_async_retry_respects_overall_timeout(fast_asyncio_sleep, retry_only_client, mock_async_grpc_call):
+    """Retries stop once the backoff would overrun the timeout; retries get the remaining budget."""
+    for name, value in {"retries_enabled": True, "max_retries": 5, "initial_backoff_ms": 800,
+                        "backoff_multiplier": 1.5, "retry_jitter": False,
+                        "retryable_status_codes": [_SC_UNAVAILABLE]}.items():
+        setattr(retry_only_client, name, value)
+    mock_async_grpc_call.side_effect = _UNAVAILABLE_ERR
+
+    with pytest.raises(VortexApiError, match="UNAVAILABLE"):
+        await retry_only_client._execute_with_retry_async(mock_async_grpc_call, "test_async_deadline", timeout=1.0)
+
+    assert [c.args[0] for c in fast_asyncio_sleep.await_args_list] == [0.8]
+    first, second = mock_async_grpc_call.await_args_list
+    assert first.kwargs["timeout"] == 1.0
+    assert second.kwargs["timeout"] == pytest.approx(0.2, abs=0.05) # the real loop clock keeps running
 
 @pytest.mark.asyncio
-@patch('asyncio.sleep', new_callable=AsyncMock)
-@patch('random.uniform', return_value=0.05) # Mock jitter
-async def test_async_retry_exhausted_all_attempts(mock_uniform, mock_async_sleep, async_client, mock_async_grpc_call):
-    """Test VortexApiError after all async retries are exhausted."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
-    client_instance.max_retries = 2
-    client_instance.initial_backoff_ms = 50
-    client_instance.backoff_multiplier = 2.0
-    client_instance.retry_jitter = True
-    client_instance.retryable_status_codes = [grpc.StatusCode.RESOURCE_EXHAUSTED]
-
-    mock_exhausted_error = grpc.aio.AioRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED, initial_metadata=None, trailing_metadata=None, details="Async Resource exhausted")
-    
-    mock_async_grpc_call.side_effect = [mock_exhausted_error] * (client_instance.max_retries + 1)
-    
-    with pytest.raises(VortexApiError, match=r"Failed to test_async_op_exhausted \(Status Code: RESOURCE_EXHAUSTED\) Details: Async Resource exhausted"):
-        await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_exhausted")
-        
-    assert mock_async_grpc_call.await_count == client_instance.max_retries + 1
-    assert mock_async_sleep.await_count == client_instance.max_retries
-    
-    expected_sleep_1 = (50 * (1 + 0.05)) / 1000.0
-    expected_sleep_2 = (50 * 2.0 * (1 + 0.05)) / 1000.0
-    
-    assert mock_async_sleep.call_args_list[0][0][0] == pytest.approx(expected_sleep_1)
-    assert mock_async_sleep.call_args_list[1][0][0] == pytest.approx(expected_sleep_2)
-    mock_uniform.assert_any_call(-0.1, 0.1)
-
-@pytest.mark.asyncio
-async def test_async_retry_non_retryable_grpc_error(async_client, mock_async_grpc_call):
-    """Test non-retryable async gRPC errors are not retried."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
-    client_instance.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
-
-    mock_invalid_arg_error = grpc.aio.AioRpcError(grpc.StatusCode.INVALID_ARGUMENT, initial_metadata=None, trailing_metadata=None, details="Async Invalid argument")
-    
-    mock_async_grpc_call.side_effect = mock_invalid_arg_error
-    
-    with pytest.raises(VortexApiError, match="Failed to test_async_op_non_retryable"):
-        await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_non_retryable")
-        
-    mock_async_grpc_call.assert_awaited_once()
-
-@pytest.mark.asyncio
-async def test_async_retry_unexpected_exception(async_client, mock_async_grpc_call):
+async def test_async_retry_unexpected_exception(retry_only_client, mock_async_grpc_call):
     """Test handling of unexpected non-gRPC exceptions during an async call."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
+    retry_only_client.retries_enabled = True
     mock_async_grpc_call.side_effect = ValueError("Unexpected Python error in async")
     
     with pytest.raises(VortexException, match="An unexpected error occurred during test_async_op_unexpected_py_err: Unexpected Python error in async"):
-        await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_unexpected_py_err")
+        await retry_only_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_unexpected_py_err")
         
-    mock_async_grpc_call.assert_awaited_once()
+    _check_awaited_once(mock_async_grpc_call)
 
 @pytest.mark.asyncio
-@patch('asyncio.sleep', new_callable=AsyncMock)
-async def test_async_retry_backoff_capping(mock_async_sleep, async_client, mock_async_grpc_call):
-    """Test async backoff duration is capped by max_backoff_ms."""
-    client_instance = await async_client
-    client_instance.retries_enabled = True
-    client_instance.max_retries = 3
-    client_instance.initial_backoff_ms = 1000
-    client_instance.max_backoff_ms = 2500 # Cap
-    client_instance.backoff_multiplier = 2.0
-    client_instance.retry_jitter = False # Disable jitter
-    client_instance.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
-
-    mock_error = grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, initial_metadata=None, trailing_metadata=None, details="Async Unavailable Capped")
-    
-    mock_async_grpc_call.side_effect = [mock_error, mock_error, mock_error, "async_success_capped_backoff"]
-    
-    await client_instance._execute_with_retry_async(mock_async_grpc_call, "test_async_op_capped")
-    
-    assert mock_async_grpc_call.await_count == 4
-    assert mock_async_sleep.await_count == 3
-    
-    assert mock_async_sleep.call_args_list[0][0][0] == 1.0
-    assert mock_async_sleep.call_args_list[1][0][0] == 2.0
-    assert mock_async_sleep.call_args_list[2][0][0] == 2.5
+async def test_async_retry_vortex_exception_passes_through(retry_only_client, mock_async_grpc_call, pb2):
+    """A VortexException raised inside the call keeps its type rather than being re-wrapped."""
+    retry_only_client.retries_enabled = True
+    error = VortexApiError("Raised by an interceptor", status_code=pb2.common.StatusCode.ERROR)
+    mock_async_grpc_call.side_effect = error
+
+    with pytest.raises(VortexApiError) as exc_info:
+        await retry_only_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_vortex_err")
+    assert exc_info.value is error
+    _check_awaited_once(mock_async_grpc_call)
 
 @pytest.mark.asyncio
-async def test_async_retry_with_custom_retryable_codes(async_client_fixture_factory, mock_async_grpc_call):
+@pytest.mark.parametrize("configurable_async_client", [
+    {"retries_enabled": True, "max_retries": 1, "retryable_status_codes": [_SC_INTERNAL, _SC_DATA_LOSS]},
+], indirect=True)
+async def test_async_retry_with_custom_retryable_codes(configurable_async_client, mock_async_grpc_call, fast_asyncio_sleep):
     """Test async retry logic with custom retryable status codes."""
-    factory_fn = async_client_fixture_factory # Get the factory function
-    custom_async_client = await factory_fn( # Call and await the factory
-        retries_enabled=True,
-        max_retries=1,
-        retryable_status_codes=[grpc.StatusCode.INTERNAL, grpc.StatusCode.DATA_LOSS]
-    )
-    
-    mock_internal_error = grpc.aio.AioRpcError(grpc.StatusCode.INTERNAL, initial_metadata=None, trailing_metadata=None, details="Async Internal Error")
-    
-    mock_async_grpc_call.side_effect = [mock_internal_error, "async_success_custom_code"]
+    mock_async_grpc_call.side_effect = _raise_then_return(_INTERNAL_ERR, 1, "async_success_custom_code")
     
-    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_async_sleep_custom:
-        result = await custom_async_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_custom_codes")
+    result = await configurable_async_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_custom_codes")
     
     assert result == "async_success_custom_code"
     assert mock_async_grpc_call.await_count == 2
-    mock_async_sleep_custom.assert_awaited_once()
+    fast_asyncio_sleep.assert_awaited_once()
 
-    mock_async_grpc_call.reset_mock() # Reset for next part of test
-    mock_unavailable_error = grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, initial_metadata=None, trailing_metadata=None, details="Async Unavailable Custom")
-    mock_async_grpc_call.side_effect = mock_unavailable_error
+    # UNAVAILABLE is retryable by default but not in the custom set, so it fails on the first attempt.
+    mock_async_grpc_call.side_effect = _UNAVAILABLE_ERR
 
     with pytest.raises(VortexApiError, match="Failed to test_async_op_default_not_custom"):
-        await custom_async_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_default_not_custom")
-    assert mock_async_grpc_call.await_count == 1
+        await configurable_async_client._execute_with_retry_async(mock_async_grpc_call, "test_async_op_default_not_custom")
+    assert mock_async_grpc_call.await_count == 3
 
 
-# Helper fixture to create an AsyncVortexClient with specific retry parameters
+# Helper fixture to create an AsyncVortexClient with retry parameters passed via indirect parametrization
 @pytest.fixture
-def async_client_fixture_factory(mocker, mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub): # Not async
-    async def _factory(**retry_kwargs): # Inner factory is async
-        mocker.patch('grpc.aio.insecure_channel', return_value=mock_aio_grpc_channel)
-        mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_aio_collections_stub)
-        mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_aio_points_stub)
-        mocker.patch('vortex_sdk.client.AsyncVortexClient.connect', AsyncMock())
-
-        aclient = AsyncVortexClient(host="mockhost_async_factory", port=12345, **retry_kwargs)
-        aclient._channel = mock_aio_grpc_channel
-        aclient._collections_stub = mock_aio_collections_stub
-        aclient._points_stub = mock_aio_points_stub
-        # No await aclient.connect() here, assume it's handled by test or context manager
-        return aclient
-    return _factory
+def configurable_async_client(request, mock_aio_grpc_channel, mock_aio_collections_stub, mock_aio_points_stub):
+    retry_kwargs = getattr(request, "param", {})
+    aclient = AsyncVortexClient(host="mockhost_async_factory", port=12345, **retry_kwargs)
+    aclient._channel = mock_aio_grpc_channel
+    aclient._collections_stub = mock_aio_collections_stub
+    aclient._points_stub = mock_aio_points_stub
+    return aclient
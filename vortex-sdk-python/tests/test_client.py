@@ -1,149 +1,324 @@
 """
 Unit tests for the VortexClient.
 """
+import array
+import contextlib
+import copy
 import pytest
 import grpc # type: ignore
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from vortex_sdk import VortexClient, models
+from vortex_sdk import VortexClient, conversions, models
+from vortex_sdk._channel_cache import ChannelCache
+from vortex_sdk.client import _DEFAULT_GRPC_OPTIONS
 from vortex_sdk.exceptions import VortexApiError, VortexConnectionError, VortexException, VortexClientConfigurationError
 from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2
 from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2
 from vortex_sdk._grpc.vortex.api.v1 import common_pb2
+from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2_grpc as _coll_grpc
+from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2_grpc as _pts_grpc
+
+# Every test gets freshly reset mocks (see `_reset_mocks`), so tests can be spread across
+# pytest-xdist workers; the group keeps this module on one worker so the session-scoped
+# mocks and client are built once rather than once per worker.
+pytestmark = pytest.mark.xdist_group("client")
+
+# Stand-ins for the objects grpc returns; the connection tests only check identity and
+# call arguments, so plain mocks built once replace per-test spec'd mocks.
+_CHANNEL_SENTINEL = MagicMock()
+_CREDS_SENTINEL = MagicMock()
+
+# --- Canned responses, built once for the whole module ---
+
+_CREATE_COLL_RESP = collections_service_pb2.CreateCollectionResponse()
+_GET_COLL_INFO_RESP = collections_service_pb2.GetCollectionInfoResponse(
+    collection_name="info_coll",
+    status=collections_service_pb2.CollectionStatus.GREEN,
+    vector_count=100,
+    config=common_pb2.HnswConfigParams(m=8, ef_construction=50, ef_search=20, ml=0.3, vector_dim=64, m_max0=16),
+    distance_metric=common_pb2.DistanceMetric.EUCLIDEAN_L2
+)
+_LIST_COLL_RESP = collections_service_pb2.ListCollectionsResponse(
+    collections=[
+        collections_service_pb2.CollectionDescription(name="coll1", vector_count=10, status=collections_service_pb2.CollectionStatus.GREEN, dimensions=128, distance_metric=common_pb2.DistanceMetric.COSINE),
+        collections_service_pb2.CollectionDescription(name="coll2", vector_count=20, status=collections_service_pb2.CollectionStatus.YELLOW, dimensions=64, distance_metric=common_pb2.DistanceMetric.EUCLIDEAN_L2),
+    ]
+)
+_DELETE_COLL_RESP = collections_service_pb2.DeleteCollectionResponse()
+_UPSERT_OK_RESP = points_service_pb2.UpsertPointsResponse(
+    statuses=[common_pb2.PointOperationStatus(point_id="p1", status_code=common_pb2.StatusCode.OK)]
+)
+_UPSERT_WAL_FULL_RESP = points_service_pb2.UpsertPointsResponse(overall_error="WAL is full")
+_GET_POINTS_RESP = points_service_pb2.GetPointsResponse(
+    points=[
+        common_pb2.PointStruct(id="gp1", vector=common_pb2.Vector(elements=[0.3, 0.4]))
+    ]
+)
+_DELETE_POINTS_RESP = points_service_pb2.DeletePointsResponse(
+    statuses=[common_pb2.PointOperationStatus(point_id="dp1", status_code=common_pb2.StatusCode.OK)]
+)
+_SEARCH_RESP = points_service_pb2.SearchPointsResponse(
+    results=[
+        common_pb2.ScoredPoint(id="sp1", score=0.9, vector=common_pb2.Vector(elements=[0.51, 0.61]))
+    ]
+)
+_SEARCH_EF_RESP = points_service_pb2.SearchPointsResponse(
+    results=[
+        common_pb2.ScoredPoint(id="sp_ef", score=0.95)
+    ]
+)
+_SEARCH_EMPTY_EF_RESP = points_service_pb2.SearchPointsResponse(
+    results=[common_pb2.ScoredPoint(id="sp_empty_ef", score=0.93)]
+)
 
-@pytest.fixture
+class _NdarrayLike(array.array):
+    """A float array that, like numpy.ndarray, refuses to be used as a bool."""
+    def __bool__(self):
+        raise ValueError("The truth value of an array with more than one element is ambiguous.")
+
+class _FakeRpcError(grpc.RpcError):
+    """A grpc.RpcError with real code()/details() methods, like the errors grpc raises."""
+    __slots__ = ("_code", "_msg")
+
+    def __init__(self, code: grpc.StatusCode, msg: str = ""):
+        super().__init__(msg)
+        self._code = code
+        self._msg = msg
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._msg
+
+_RPC_ERR_CACHE: dict = {}
+
+def make_rpc_error(code: grpc.StatusCode) -> grpc.RpcError:
+    """Returns a shared grpc.RpcError for `code`; its details are the status code name."""
+    err = _RPC_ERR_CACHE.get(code)
+    if err is None:
+        err = _RPC_ERR_CACHE[code] = _FakeRpcError(code, code.name)
+    return err
+
+# The generated stubs only create their RPC attributes in __init__, so autospeccing the
+# class finds nothing; the RPC names come from the service descriptors instead.
+_COLLECTIONS_RPCS = tuple(collections_service_pb2.DESCRIPTOR.services_by_name["CollectionsService"].methods_by_name)
+_POINTS_RPCS = tuple(points_service_pb2.DESCRIPTOR.services_by_name["PointsService"].methods_by_name)
+
+# The channel and stub mocks are built once per session; the autouse `_reset_mocks`
+# fixture clears them before every test and `client` hands out a copy of a session client.
+
+@pytest.fixture(scope="session")
 def mock_grpc_channel():
-    return MagicMock(spec=grpc.Channel)
+    return MagicMock()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_collections_stub(mock_grpc_channel):
-    stub = MagicMock()
+    stub = MagicMock(spec_set=_COLLECTIONS_RPCS)
     # Attach to a mock channel if VortexClient's _connect tries to use it
     mock_grpc_channel.collections_stub = stub 
     return stub
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_points_stub(mock_grpc_channel):
-    stub = MagicMock()
+    stub = MagicMock(spec_set=_POINTS_RPCS)
     mock_grpc_channel.points_stub = stub
     return stub
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_stub_classes(mock_collections_stub, mock_points_stub):
+    """Makes _connect build the session stub mocks instead of real stubs, for the whole module."""
+    # Module scope rather than session scope, so the patch is undone before other test files run.
+    with patch.object(_coll_grpc, "CollectionsServiceStub", return_value=mock_collections_stub) as collections_cls, \
+            patch.object(_pts_grpc, "PointsServiceStub", return_value=mock_points_stub) as points_cls:
+        yield collections_cls, points_cls
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_grpc_channel, mock_collections_stub, mock_points_stub):
+    """Clears recorded calls, return values and side effects left by the previous test."""
+    # Only the RPC methods get their configuration wiped; resetting the parent mocks'
+    # return values would also clear defaults such as __bool__.
+    mock_grpc_channel.reset_mock()
+    for stub, rpcs in ((mock_collections_stub, _COLLECTIONS_RPCS), (mock_points_stub, _POINTS_RPCS)):
+        stub.reset_mock()
+        for rpc in rpcs:
+            getattr(stub, rpc).reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture(autouse=True)
+def _no_sleep(mocker):
+    """Makes every backoff sleep return immediately; tests can request it to inspect the calls."""
+    return mocker.patch('time.sleep', return_value=None)
+
+@pytest.fixture
+def _fixed_jitter(mocker):
+    """Mocks jitter to be predictable (the midpoint of its range)."""
+    return mocker.patch('random.uniform', side_effect=lambda low, high: high / 2)
+
+@pytest.fixture(scope="session")
+def _session_client(mock_grpc_channel, mock_collections_stub, mock_points_stub):
+    # _connect is skipped and the stubs assigned by hand.
+    with patch.object(VortexClient, "_connect"):
+        vc = VortexClient(host="mockhost", port=12345)
+    vc._channel = mock_grpc_channel
+    vc._collections_stub = mock_collections_stub
+    vc._points_stub = mock_points_stub
+    return vc
+
 @pytest.fixture
-def client(mocker, request, mock_grpc_channel, mock_collections_stub, mock_points_stub): # Added 'request'
+def client(mocker, request, _session_client, mock_grpc_channel): # Added 'request'
     """Fixture to create a VortexClient with mocked gRPC stubs."""
-    mocker.patch('grpc.insecure_channel', return_value=mock_grpc_channel)
-    
-    # Mock the stubs that would be created in _connect
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
-    
-    # For most tests, we mock _connect to avoid actual channel creation.
-    # For connection-specific tests, we'll mock grpc.insecure_channel/secure_channel directly.
-    if 'skip_connect_mock' not in request.keywords:
-        mocker.patch('vortex_sdk.client.VortexClient._connect', MagicMock())
+    # For connection-specific tests, build a client that goes through the real _connect.
+    if 'skip_connect_mock' in request.keywords:
+        mocker.patch('grpc.insecure_channel', return_value=mock_grpc_channel)
+        return VortexClient(host="mockhost", port=12345)
+    # A shallow copy shares the mocks but keeps retry settings changed by a test to that test.
+    return copy.copy(_session_client)
 
-    vc = VortexClient(host="mockhost", port=12345)
-    
-    if 'skip_connect_mock' not in request.keywords:
-        # Manually assign stubs if _connect is fully mocked
-        vc._channel = mock_grpc_channel
-        vc._collections_stub = mock_collections_stub
-        vc._points_stub = mock_points_stub
+@pytest.fixture
+def client_coll_only(_session_client):
+    """A client wired to the collections stub only; points calls would fail as not connected."""
+    vc = copy.copy(_session_client)
+    vc._points_stub = None
+    return vc
+
+@pytest.fixture
+def client_pts_only(_session_client):
+    """A client wired to the points stub only; collections calls would fail as not connected."""
+    vc = copy.copy(_session_client)
+    vc._collections_stub = None
     return vc
 
 # --- Connection Tests ---
 
 @pytest.mark.skip_connect_mock # Custom marker to skip the _connect mock in the client fixture
-def test_client_connect_insecure(mocker, mock_collections_stub, mock_points_stub):
-    """Test insecure channel creation."""
-    mock_insecure_channel = mocker.patch('grpc.insecure_channel', return_value=MagicMock(spec=grpc.Channel))
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
-
-    options = [("grpc.lb_policy_name", "pick_first")]
-    client = VortexClient(host="test_host", port=123, secure=False, grpc_options=options)
-    
-    mock_insecure_channel.assert_called_once_with("test_host:123", options=options)
-    assert client._channel == mock_insecure_channel.return_value
+@pytest.mark.parametrize("secure,root,pk,cert,options", [
+    pytest.param(False, None, None, None, [("grpc.lb_policy_name", "pick_first")], id="insecure"),
+    pytest.param(True, b"test_root_certs", None, None, [("grpc.ssl_target_name_override", "server.name")], id="secure_server_auth"),
+    pytest.param(True, b"test_root_certs_mtls", b"test_private_key_mtls", b"test_cert_chain_mtls", None, id="secure_mtls"),
+    pytest.param(True, None, None, None, None, id="secure_system_ca"), # System CAs: no certs provided
+])
+def test_client_connect(mocker, secure, root, pk, cert, options):
+    """Test channel creation for insecure, server-auth, mTLS and system-CA setups."""
+    mock_insecure_channel = mocker.patch('grpc.insecure_channel', return_value=_CHANNEL_SENTINEL)
+    mock_secure_channel = mocker.patch('grpc.secure_channel', return_value=_CHANNEL_SENTINEL)
+    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=_CREDS_SENTINEL)
+
+    client = VortexClient(
+        host="test_host", port=443, secure=secure,
+        root_certs=root, private_key=pk, certificate_chain=cert, grpc_options=options
+    )
+    expected_options = list(_DEFAULT_GRPC_OPTIONS) + (options or [])
+
+    if secure:
+        mock_ssl_creds.assert_called_once_with(
+            root_certificates=root,
+            private_key=pk,
+            certificate_chain=cert
+        )
+        mock_secure_channel.assert_called_once_with(
+            "test_host:443", mock_ssl_creds.return_value, options=expected_options
+        )
+        mock_insecure_channel.assert_not_called()
+        assert client._channel == mock_secure_channel.return_value
+    else:
+        mock_insecure_channel.assert_called_once_with("test_host:443", options=expected_options)
+        mock_secure_channel.assert_not_called()
+        mock_ssl_creds.assert_not_called()
+        assert client._channel == mock_insecure_channel.return_value
     assert client._collections_stub is not None
     assert client._points_stub is not None
 
-@pytest.mark.skip_connect_mock
-def test_client_connect_secure_server_auth(mocker, mock_collections_stub, mock_points_stub):
-    """Test secure channel creation with server authentication (root_certs)."""
-    mock_secure_channel = mocker.patch('grpc.secure_channel', return_value=MagicMock(spec=grpc.Channel))
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials))
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
+def test_client_channel_pool(mocker):
+    """pool_size opens one channel per slot and rotates RPCs across them."""
+    channels = [MagicMock(name=f"channel{i}") for i in range(3)]
+    mock_insecure_channel = mocker.patch('grpc.insecure_channel', side_effect=channels)
+    points_stubs = [MagicMock(spec_set=_POINTS_RPCS) for _ in channels]
+    mocker.patch.object(_pts_grpc, "PointsServiceStub", side_effect=points_stubs)
+    for stub in points_stubs:
+        stub.DeletePoints.return_value = _DELETE_POINTS_RESP
+
+    client = VortexClient(host="h", port=1, pool_size=3, grpc_options=[("grpc.lb_policy_name", "pick_first")])
+
+    expected_options = list(_DEFAULT_GRPC_OPTIONS) + [("grpc.lb_policy_name", "pick_first"), ("grpc.use_local_subchannel_pool", 1)]
+    assert mock_insecure_channel.call_args_list == [mocker.call("h:1", options=expected_options)] * 3
+    assert client._channel is channels[0]
+
+    for _ in range(6):
+        client.delete_points("c", ["p"])
+    assert [stub.DeletePoints.call_count for stub in points_stubs] == [2, 2, 2]
+
+    client.close()
+    assert all(channel.close.called for channel in channels)
+    assert client._points_stub is None
+
+    with pytest.raises(VortexClientConfigurationError):
+        VortexClient(host="h", port=1, pool_size=0)
+
+def test_client_shared_channels(mocker):
+    """shared_channels reuses cached channels and only the cache closes them."""
+    cache = ChannelCache(ttl=0.0)
+    mocker.patch.object(ChannelCache, "instance", return_value=cache)
+    mocker.patch.object(ChannelCache, "_reap")
+    channel = MagicMock(name="channel")
+    mock_insecure_channel = mocker.patch('grpc.insecure_channel', return_value=channel)
+
+    first = VortexClient(host="h", port=1, shared_channels=True)
+    second = VortexClient(host="h", port=1, shared_channels=True)
+    mock_insecure_channel.assert_called_once_with("h:1", options=list(_DEFAULT_GRPC_OPTIONS))
+    assert first._channel is second._channel is channel
+
+    first.close()
+    second.close()
+    assert not channel.close.called
+    assert first._channel is None
+
+    cache._close_expired(float("inf"))
+    channel.close.assert_called_once()
+    VortexClient(host="h", port=1, shared_channels=True)
+    assert mock_insecure_channel.call_count == 2
+
+def test_client_shared_channels_released_on_connect_failure(mocker):
+    """A connect that fails part-way releases the shared channels it already acquired."""
+    cache = ChannelCache(ttl=0.0)
+    mocker.patch.object(ChannelCache, "instance", return_value=cache)
+    mocker.patch.object(ChannelCache, "_reap")
+    channels = [MagicMock(name=f"channel{i}") for i in range(2)]
+    mocker.patch('grpc.insecure_channel', side_effect=channels)
+    cause = RuntimeError("stub failed")
+    mocker.patch.object(_coll_grpc, "CollectionsServiceStub", side_effect=[MagicMock(), cause])
+
+    with pytest.raises(VortexConnectionError, match="stub failed") as exc_info:
+        VortexClient(host="h", port=1, pool_size=2, shared_channels=True)
+    assert exc_info.value.__cause__ is cause
+
+    assert [entry.refcount for entry in cache._entries.values()] == [0, 0]
+    cache._close_expired(float("inf"))
+    assert all(channel.close.called for channel in channels)
+
+def test_client_channel_defaults_and_compression(mocker):
+    """User grpc_options override the defaults by key; compression is passed on every call."""
+    mock_insecure_channel = mocker.patch('grpc.insecure_channel', return_value=_CHANNEL_SENTINEL)
+    points_stub = MagicMock(spec_set=_POINTS_RPCS)
+    points_stub.DeletePoints.return_value = _DELETE_POINTS_RESP
+    mocker.patch.object(_pts_grpc, "PointsServiceStub", return_value=points_stub)
 
-    root_certs_data = b"test_root_certs"
-    options = [("grpc.ssl_target_name_override", "server.name")]
-    
-    client = VortexClient(
-        host="secure_host", port=443, secure=True, 
-        root_certs=root_certs_data, grpc_options=options
-    )
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=root_certs_data,
-        private_key=None,
-        certificate_chain=None
-    )
-    mock_secure_channel.assert_called_once_with(
-        "secure_host:443", mock_ssl_creds.return_value, options=options
-    )
-    assert client._channel == mock_secure_channel.return_value
-
-@pytest.mark.skip_connect_mock
-def test_client_connect_secure_mtls(mocker, mock_collections_stub, mock_points_stub):
-    """Test secure channel creation with mutual TLS."""
-    mock_secure_channel = mocker.patch('grpc.secure_channel', return_value=MagicMock(spec=grpc.Channel))
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials))
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
-
-    root_certs_data = b"test_root_certs_mtls"
-    private_key_data = b"test_private_key_mtls"
-    cert_chain_data = b"test_cert_chain_mtls"
-    
     client = VortexClient(
-        host="mtls_host", port=443, secure=True, 
-        root_certs=root_certs_data, private_key=private_key_data, certificate_chain=cert_chain_data
-    )
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=root_certs_data,
-        private_key=private_key_data,
-        certificate_chain=cert_chain_data
-    )
-    mock_secure_channel.assert_called_once_with(
-        "mtls_host:443", mock_ssl_creds.return_value, options=None # No options passed here
+        host="h", port=1, compression=grpc.Compression.Gzip,
+        grpc_options=[("grpc.keepalive_time_ms", 60000)],
     )
 
-@pytest.mark.skip_connect_mock
-def test_client_connect_secure_system_ca(mocker, mock_collections_stub, mock_points_stub):
-    """Test secure channel creation using system CAs (secure=True, no certs provided)."""
-    mock_secure_channel = mocker.patch('grpc.secure_channel', return_value=MagicMock(spec=grpc.Channel))
-    mock_ssl_creds = mocker.patch('grpc.ssl_channel_credentials', return_value=MagicMock(spec=grpc.ChannelCredentials))
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-    mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
-    
-    client = VortexClient(host="systemca_host", port=443, secure=True)
-    
-    mock_ssl_creds.assert_called_once_with(
-        root_certificates=None, private_key=None, certificate_chain=None
-    )
-    mock_secure_channel.assert_called_once_with(
-        "systemca_host:443", mock_ssl_creds.return_value, options=None
-    )
+    options = dict(mock_insecure_channel.call_args.kwargs["options"])
+    assert options == {**dict(_DEFAULT_GRPC_OPTIONS), "grpc.keepalive_time_ms": 60000}
+    client.delete_points("c", ["p"])
+    assert points_stub.DeletePoints.call_args.kwargs["compression"] is grpc.Compression.Gzip
 
 # --- CollectionsService Method Tests ---
 
-def test_create_collection_success(client, mock_collections_stub):
+def test_create_collection_success(client_coll_only, mock_collections_stub):
     """Test successful collection creation."""
-    mock_collections_stub.CreateCollection.return_value = collections_service_pb2.CreateCollectionResponse()
+    mock_collections_stub.CreateCollection.return_value = _CREATE_COLL_RESP
     
-    client.create_collection(
+    client_coll_only.create_collection(
         collection_name="test_coll",
         vector_dimensions=128,
         distance_metric=models.DistanceMetric.COSINE,
@@ -157,31 +332,22 @@ def test_create_collection_success(client, mock_collections_stub):
     assert call_args.distance_metric == common_pb2.DistanceMetric.COSINE
     assert call_args.hnsw_config.m == 16
 
-def test_create_collection_api_error(client, mock_collections_stub):
+def test_create_collection_api_error(client_coll_only, mock_collections_stub):
     """Test collection creation failure with RpcError."""
-    mock_error = grpc.RpcError("Mock gRPC error")
-    mock_error.code = lambda: grpc.StatusCode.INTERNAL # Add code() method
-    mock_collections_stub.CreateCollection.side_effect = mock_error
+    mock_collections_stub.CreateCollection.side_effect = make_rpc_error(grpc.StatusCode.INTERNAL)
     
     with pytest.raises(VortexApiError, match="Failed to create collection 'test_coll_fail'"):
-        client.create_collection(
+        client_coll_only.create_collection(
             collection_name="test_coll_fail",
             vector_dimensions=128,
             distance_metric=models.DistanceMetric.EUCLIDEAN_L2
         )
 
-def test_get_collection_info_success(client, mock_collections_stub):
+def test_get_collection_info_success(client_coll_only, mock_collections_stub):
     """Test successfully getting collection info."""
-    mock_response = collections_service_pb2.GetCollectionInfoResponse(
-        collection_name="info_coll",
-        status=collections_service_pb2.CollectionStatus.GREEN,
-        vector_count=100,
-        config=common_pb2.HnswConfigParams(m=8, ef_construction=50, ef_search=20, ml=0.3, vector_dim=64, m_max0=16),
-        distance_metric=common_pb2.DistanceMetric.EUCLIDEAN_L2
-    )
-    mock_collections_stub.GetCollectionInfo.return_value = mock_response
+    mock_collections_stub.GetCollectionInfo.return_value = _GET_COLL_INFO_RESP
     
-    info = client.get_collection_info("info_coll")
+    info = client_coll_only.get_collection_info("info_coll")
     
     assert info.collection_name == "info_coll"
     assert info.status == models.CollectionStatus.GREEN
@@ -193,17 +359,11 @@ def test_get_collection_info_success(client, mock_collections_stub):
         timeout=None 
     )
 
-def test_list_collections_success(client, mock_collections_stub):
+def test_list_collections_success(client_coll_only, mock_collections_stub):
     """Test successfully listing collections."""
-    mock_response = collections_service_pb2.ListCollectionsResponse(
-        collections=[
-            collections_service_pb2.CollectionDescription(name="coll1", vector_count=10, status=collections_service_pb2.CollectionStatus.GREEN, dimensions=128, distance_metric=common_pb2.DistanceMetric.COSINE),
-            collections_service_pb2.CollectionDescription(name="coll2", vector_count=20, status=collections_service_pb2.CollectionStatus.YELLOW, dimensions=64, distance_metric=common_pb2.DistanceMetric.EUCLIDEAN_L2),
-        ]
-    )
-    mock_collections_stub.ListCollections.return_value = mock_response
+    mock_collections_stub.ListCollections.return_value = _LIST_COLL_RESP
     
-    descriptions = client.list_collections()
+    descriptions = client_coll_only.list_collections()
     
     assert len(descriptions) == 2
     assert descriptions[0].name == "coll1"
@@ -212,11 +372,11 @@ def test_list_collections_success(client, mock_collections_stub):
     assert descriptions[1].distance_metric == models.DistanceMetric.EUCLIDEAN_L2
     mock_collections_stub.ListCollections.assert_called_once()
 
-def test_delete_collection_success(client, mock_collections_stub):
+def test_delete_collection_success(client_coll_only, mock_collections_stub):
     """Test successful collection deletion."""
-    mock_collections_stub.DeleteCollection.return_value = collections_service_pb2.DeleteCollectionResponse()
+    mock_collections_stub.DeleteCollection.return_value = _DELETE_COLL_RESP
     
-    client.delete_collection("delete_me")
+    client_coll_only.delete_collection("delete_me")
     
     mock_collections_stub.DeleteCollection.assert_called_once_with(
         collections_service_pb2.DeleteCollectionRequest(collection_name="delete_me"),
@@ -225,17 +385,14 @@ def test_delete_collection_success(client, mock_collections_stub):
 
 # --- PointsService Method Tests (Basic Placeholders) ---
 
-def test_upsert_points_success(client, mock_points_stub):
+def test_upsert_points_success(client_pts_only, mock_points_stub):
     """Test successful point upsertion."""
     points_to_upsert = [
         models.PointStruct(id="p1", vector=models.Vector(elements=[0.1, 0.2]))
     ]
-    mock_response = points_service_pb2.UpsertPointsResponse(
-        statuses=[common_pb2.PointOperationStatus(point_id="p1", status_code=common_pb2.StatusCode.OK)]
-    )
-    mock_points_stub.UpsertPoints.return_value = mock_response
+    mock_points_stub.UpsertPoints.return_value = _UPSERT_OK_RESP
 
-    statuses = client.upsert_points(collection_name="upsert_coll", points=points_to_upsert)
+    statuses = client_pts_only.upsert_points(collection_name="upsert_coll", points=points_to_upsert)
 
     assert len(statuses) == 1
     assert statuses[0].point_id == "p1"
@@ -246,30 +403,24 @@ def test_upsert_points_success(client, mock_points_stub):
     assert len(call_args.points) == 1
     assert call_args.points[0].id == "p1"
 
-def test_upsert_points_overall_error(client, mock_points_stub):
+def test_upsert_points_overall_error(client_pts_only, mock_points_stub):
     """Test point upsertion with an overall error."""
     points_to_upsert = [models.PointStruct(id="p1", vector=models.Vector(elements=[0.1, 0.2]))]
-    mock_response = points_service_pb2.UpsertPointsResponse(overall_error="WAL is full")
-    mock_points_stub.UpsertPoints.return_value = mock_response
+    mock_points_stub.UpsertPoints.return_value = _UPSERT_WAL_FULL_RESP
 
     with pytest.raises(VortexApiError, match="Overall error during upsert: WAL is full"):
-        client.upsert_points(collection_name="upsert_coll_fail", points=points_to_upsert)
+        client_pts_only.upsert_points(collection_name="upsert_coll_fail", points=points_to_upsert)
 
 
-def test_get_points_success(client, mock_points_stub):
+def test_get_points_success(client_pts_only, mock_points_stub):
     """Test successfully getting points."""
-    mock_response = points_service_pb2.GetPointsResponse(
-        points=[
-            common_pb2.PointStruct(id="gp1", vector=common_pb2.Vector(elements=[0.3, 0.4]))
-        ]
-    )
-    mock_points_stub.GetPoints.return_value = mock_response
+    mock_points_stub.GetPoints.return_value = _GET_POINTS_RESP
 
-    points = client.get_points(collection_name="get_coll", ids=["gp1"], with_vector=True)
+    points = client_pts_only.get_points(collection_name="get_coll", ids=["gp1"], with_vector=True)
     
     assert len(points) == 1
     assert points[0].id == "gp1"
-    assert points[0].vector.elements == pytest.approx([0.3, 0.4])
+    assert points[0].vector.elements == pytest.approx([0.3, 0.4]) # Vector.elements is float32 on the wire
     mock_points_stub.GetPoints.assert_called_once()
     call_args = mock_points_stub.GetPoints.call_args[0][0]
     assert call_args.collection_name == "get_coll"
@@ -277,30 +428,75 @@ def test_get_points_success(client, mock_points_stub):
     assert call_args.with_vector is True
     assert call_args.with_payload is True # Default
 
-def test_delete_points_success(client, mock_points_stub):
+def test_bind_search(client_pts_only, mock_points_stub):
+    """A bound search sends the same request as search_points, from raw floats."""
+    mock_points_stub.SearchPoints.return_value = _SEARCH_RESP
+    search = client_pts_only.bind_search("search_coll", dim=2, with_payload=False)
+
+    results = search([0.5, 0.6], k_limit=3)
+
+    assert [r.id for r in results] == ["sp1"]
+    client_pts_only.search_points("search_coll", models.Vector(elements=[0.5, 0.6]), k_limit=3, with_payload=False)
+    bound_call, method_call = mock_points_stub.SearchPoints.call_args_list
+    assert bound_call == method_call
+
+    # A numpy-style array, which refuses to be truth-tested, works as the query
+    assert [r.id for r in search(_NdarrayLike("f", [0.5, 0.6]), k_limit=3)] == ["sp1"]
+    assert mock_points_stub.SearchPoints.call_args == method_call
+
+    with pytest.raises(VortexException, match="Query vector has 3 dimensions, expected 2"):
+        search([0.1, 0.2, 0.3], k_limit=3)
+
+def test_unexpected_pre_call_error_is_wrapped(client_pts_only, mocker):
+    """Errors raised while building a request surface as VortexException, chained to the cause."""
+    cause = ValueError("bad vector")
+    mocker.patch.object(conversions, "pydantic_to_grpc_search_request", side_effect=cause)
+
+    with pytest.raises(VortexException, match="pre-call error occurred while searching points in 'c': bad vector") as exc_info:
+        client_pts_only.search_points("c", models.Vector(elements=[0.1]), k_limit=1)
+    assert exc_info.value.__cause__ is cause
+
+def test_iter_points_converts_lazily(client_pts_only, mock_points_stub, mocker):
+    """iter_points calls the RPC up front but converts each point only when reached."""
+    mock_points_stub.GetPoints.return_value = _GET_POINTS_RESP
+    convert = mocker.spy(conversions, "grpc_to_pydantic_point_struct")
+
+    points = client_pts_only.iter_points(collection_name="get_coll", ids=["gp1"])
+
+    mock_points_stub.GetPoints.assert_called_once()
+    assert convert.call_count == 0
+    assert [p.id for p in points] == ["gp1"]
+    assert convert.call_count == 1
+
+def test_iter_points_conversion_error_is_wrapped(client_pts_only, mock_points_stub, mocker):
+    """A point that fails to convert raises VortexException from both iter_points and get_points."""
+    mock_points_stub.GetPoints.return_value = _GET_POINTS_RESP
+    cause = ValueError("bad point")
+    mocker.patch.object(conversions, "grpc_to_pydantic_point_struct", side_effect=cause)
+
+    points = client_pts_only.iter_points(collection_name="get_coll", ids=["gp1"])
+    with pytest.raises(VortexException, match="converting the result of getting points from 'get_coll': bad point") as exc_info:
+        next(points)
+    assert exc_info.value.__cause__ is cause
+    with pytest.raises(VortexException, match="bad point"):
+        client_pts_only.get_points(collection_name="get_coll", ids=["gp1"])
+
+def test_delete_points_success(client_pts_only, mock_points_stub):
     """Test successful point deletion."""
-    mock_response = points_service_pb2.DeletePointsResponse(
-        statuses=[common_pb2.PointOperationStatus(point_id="dp1", status_code=common_pb2.StatusCode.OK)]
-    )
-    mock_points_stub.DeletePoints.return_value = mock_response
+    mock_points_stub.DeletePoints.return_value = _DELETE_POINTS_RESP
 
-    statuses = client.delete_points(collection_name="del_coll", ids=["dp1"])
+    statuses = client_pts_only.delete_points(collection_name="del_coll", ids=["dp1"])
 
     assert len(statuses) == 1
     assert statuses[0].point_id == "dp1"
     mock_points_stub.DeletePoints.assert_called_once()
 
-def test_search_points_success(client, mock_points_stub):
+def test_search_points_success(client_pts_only, mock_points_stub):
     """Test successful point search."""
     query_vec = models.Vector(elements=[0.5, 0.6])
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[
-            common_pb2.ScoredPoint(id="sp1", score=0.9, vector=common_pb2.Vector(elements=[0.51, 0.61]))
-        ]
-    )
-    mock_points_stub.SearchPoints.return_value = mock_response
+    mock_points_stub.SearchPoints.return_value = _SEARCH_RESP
 
-    results = client.search_points(
+    results = client_pts_only.search_points(
         collection_name="search_coll", 
         query_vector=query_vec, 
         k_limit=5,
@@ -309,7 +505,7 @@ def test_search_points_success(client, mock_points_stub):
 
     assert len(results) == 1
     assert results[0].id == "sp1"
-    assert results[0].score == pytest.approx(0.9)
+    assert results[0].score == pytest.approx(0.9) # score is float32 too
     assert results[0].vector.elements == pytest.approx([0.51, 0.61])
     mock_points_stub.SearchPoints.assert_called_once()
     call_args = mock_points_stub.SearchPoints.call_args[0][0]
@@ -319,19 +515,13 @@ def test_search_points_success(client, mock_points_stub):
     assert call_args.with_vector is True
     assert not call_args.HasField("params") # Ensure params is not set by default
 
-def test_search_points_with_search_params(client, mock_points_stub):
+def test_search_points_with_search_params(client_pts_only, mock_points_stub):
     """Test point search with SearchParams."""
     query_vec = models.Vector(elements=[0.7, 0.8])
     search_p = models.SearchParams(ef_search=150)
-    
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[
-            common_pb2.ScoredPoint(id="sp_ef", score=0.95)
-        ]
-    )
-    mock_points_stub.SearchPoints.return_value = mock_response
+    mock_points_stub.SearchPoints.return_value = _SEARCH_EF_RESP
 
-    results = client.search_points(
+    results = client_pts_only.search_points(
         collection_name="search_params_coll",
         query_vector=query_vec,
         k_limit=3,
@@ -344,17 +534,13 @@ def test_search_points_with_search_params(client, mock_points_stub):
     assert call_args.HasField("params")
     assert call_args.params.ef_search == 150
 
-def test_search_points_with_empty_search_params(client, mock_points_stub):
+def test_search_points_with_empty_search_params(client_pts_only, mock_points_stub):
     """Test point search with SearchParams that results in None after conversion."""
     query_vec = models.Vector(elements=[0.7, 0.8])
     search_p_empty = models.SearchParams() # ef_search is None
-    
-    mock_response = points_service_pb2.SearchPointsResponse(
-        results=[common_pb2.ScoredPoint(id="sp_empty_ef", score=0.93)]
-    )
-    mock_points_stub.SearchPoints.return_value = mock_response
+    mock_points_stub.SearchPoints.return_value = _SEARCH_EMPTY_EF_RESP
 
-    client.search_points(
+    client_pts_only.search_points(
         collection_name="search_empty_params_coll",
         query_vector=query_vec,
         k_limit=2,
@@ -389,106 +575,58 @@ def test_methods_raise_if_stubs_are_none(client):
 
 @pytest.fixture
 def mock_grpc_call():
-    return MagicMock()
-
-def test_retry_disabled_successful_call(client, mock_grpc_call):
-    """Test successful call when retries are disabled."""
-    client.retries_enabled = False
+    return Mock() # No magic methods needed; the retry helper only calls it
+
+@pytest.mark.parametrize("retries_enabled,side_effect,should_raise", [
+    pytest.param(False, None, False, id="disabled_success"),
+    pytest.param(False, make_rpc_error(grpc.StatusCode.UNKNOWN), True, id="disabled_grpc_error"),
+    pytest.param(True, None, False, id="success_first_attempt"),
+])
+def test_single_attempt_cases(client, mock_grpc_call, retries_enabled, side_effect, should_raise):
+    """Test calls that end after one attempt: retries disabled, or success on the first try."""
+    client.retries_enabled = retries_enabled
     mock_grpc_call.return_value = "success"
-    
-    result = client._execute_with_retry(mock_grpc_call, "test_op", "arg1", kwarg1="kwval1")
-    
-    assert result == "success"
-    mock_grpc_call.assert_called_once_with("arg1", kwarg1="kwval1")
-
-def test_retry_disabled_grpc_error(client, mock_grpc_call):
-    """Test gRPC error when retries are disabled."""
-    client.retries_enabled = False
-    mock_error = grpc.RpcError("gRPC failure")
-    mock_error.code = lambda: grpc.StatusCode.UNKNOWN # Add code() method
-    mock_grpc_call.side_effect = mock_error
-    
-    with pytest.raises(VortexApiError, match="Failed to test_op_fail"):
-        client._execute_with_retry(mock_grpc_call, "test_op_fail")
-    
-    mock_grpc_call.assert_called_once()
+    mock_grpc_call.side_effect = side_effect
 
-def test_retry_successful_on_first_attempt(client, mock_grpc_call):
-    """Test successful call on the first attempt when retries are enabled."""
-    client.retries_enabled = True
-    mock_grpc_call.return_value = "success_first_try"
-    
-    result = client._execute_with_retry(mock_grpc_call, "test_op_first")
-    
-    assert result == "success_first_try"
-    mock_grpc_call.assert_called_once()
+    expectation = pytest.raises(VortexApiError, match="Failed to test_op") if should_raise else contextlib.nullcontext()
+    with expectation:
+        result = client._execute_with_retry(mock_grpc_call, "test_op", "arg1", kwarg1="kwval1")
 
-@patch('time.sleep', return_value=None) # Mock time.sleep
-def test_retry_succeeds_after_one_retryable_error(mock_sleep, client, mock_grpc_call):
-    """Test successful call after one retryable gRPC error."""
-    client.retries_enabled = True
-    client.max_retries = 1
-    client.initial_backoff_ms = 100
-    client.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
+    if not should_raise:
+        assert result == "success"
+    mock_grpc_call.assert_called_once_with("arg1", kwarg1="kwval1")
 
-    # Simulate UNAVAILABLE error then success
-    mock_unavailable_error = grpc.RpcError("Unavailable")
-    mock_unavailable_error.code = lambda: grpc.StatusCode.UNAVAILABLE # Mock the code() method
-    
-    mock_grpc_call.side_effect = [mock_unavailable_error, "success_after_retry"]
-    
-    result = client._execute_with_retry(mock_grpc_call, "test_op_retry_once")
-    
-    assert result == "success_after_retry"
-    assert mock_grpc_call.call_count == 2
-    mock_sleep.assert_called_once() # Check that sleep was called
-    # We can also check the sleep duration if jitter is disabled or mocked
-    # For now, just checking it was called is sufficient.
-
-@patch('time.sleep', return_value=None)
-@patch('random.uniform', return_value=0.05) # Mock jitter to be predictable (e.g., +5%)
-def test_retry_exhausted_all_attempts(mock_uniform, mock_sleep, client, mock_grpc_call):
-    """Test that VortexApiError is raised after all retries are exhausted."""
+@pytest.mark.parametrize("codes_sequence,max_retries,expected_calls,expected_sleeps,expected_error", [
+    pytest.param([grpc.StatusCode.UNAVAILABLE, None], 1, 2, [(50 * 0.5) / 1000.0], None, id="retry_once_success"),
+    pytest.param(
+        [grpc.StatusCode.RESOURCE_EXHAUSTED] * 3, 2, 3,
+        [(50 * 0.5) / 1000.0, (50 * 2.0 * 0.5) / 1000.0], # bounds of 50ms, then 100ms, jittered to the midpoint
+        r"Failed to test_op \(Status Code: RESOURCE_EXHAUSTED\) Details: RESOURCE_EXHAUSTED",
+        id="exhausted",
+    ),
+    pytest.param([grpc.StatusCode.INVALID_ARGUMENT], 3, 1, [], "Failed to test_op", id="non_retryable"),
+])
+def test_retry_outcomes(_fixed_jitter, _no_sleep, client, mock_grpc_call, codes_sequence, max_retries, expected_calls, expected_sleeps, expected_error):
+    """Test retry outcomes, attempt counts and backoff sleeps for sequences of call results."""
     client.retries_enabled = True
-    client.max_retries = 2
+    client.max_retries = max_retries
     client.initial_backoff_ms = 50
     client.backoff_multiplier = 2.0
-    client.retry_jitter = True # Enable jitter
-    client.retryable_status_codes = [grpc.StatusCode.RESOURCE_EXHAUSTED]
+    client.retry_jitter = True
+    client.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.RESOURCE_EXHAUSTED]
 
-    mock_exhausted_error = grpc.RpcError("Resource exhausted")
-    mock_exhausted_error.code = lambda: grpc.StatusCode.RESOURCE_EXHAUSTED
-    
-    mock_grpc_call.side_effect = [mock_exhausted_error] * (client.max_retries + 1) # Fail all attempts
-    
-    with pytest.raises(VortexApiError, match=r"Failed to test_op_exhausted \(Status Code: RESOURCE_EXHAUSTED\) Details: Resource exhausted"):
-        client._execute_with_retry(mock_grpc_call, "test_op_exhausted")
-        
-    assert mock_grpc_call.call_count == client.max_retries + 1
-    assert mock_sleep.call_count == client.max_retries
-    
-    # Check sleep durations with jitter
-    expected_sleep_1 = (50 * (1 + 0.05)) / 1000.0 # 50ms + 5% jitter
-    expected_sleep_2 = (50 * 2.0 * (1 + 0.05)) / 1000.0 # 100ms + 5% jitter
-    
-    assert mock_sleep.call_args_list[0][0][0] == pytest.approx(expected_sleep_1)
-    assert mock_sleep.call_args_list[1][0][0] == pytest.approx(expected_sleep_2)
-    mock_uniform.assert_any_call(-0.1, 0.1) # Ensure random.uniform was called for jitter
+    mock_grpc_call.side_effect = [make_rpc_error(c) if c else "ok" for c in codes_sequence]
 
-def test_retry_non_retryable_grpc_error(client, mock_grpc_call):
-    """Test that non-retryable gRPC errors are not retried."""
-    client.retries_enabled = True
-    client.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
+    if expected_error is None:
+        assert client._execute_with_retry(mock_grpc_call, "test_op") == "ok"
+    else:
+        with pytest.raises(VortexApiError, match=expected_error):
+            client._execute_with_retry(mock_grpc_call, "test_op")
 
-    mock_invalid_arg_error = grpc.RpcError("Invalid argument")
-    mock_invalid_arg_error.code = lambda: grpc.StatusCode.INVALID_ARGUMENT # Non-retryable
-    
-    mock_grpc_call.side_effect = mock_invalid_arg_error
-    
-    with pytest.raises(VortexApiError, match="Failed to test_op_non_retryable"):
-        client._execute_with_retry(mock_grpc_call, "test_op_non_retryable")
-        
-    mock_grpc_call.assert_called_once() # Should only be called once
+    assert mock_grpc_call.call_count == expected_calls
+    assert [c[0][0] for c in _no_sleep.call_args_list] == expected_sleeps # same arithmetic as the client, so exact
+    if expected_sleeps:
+        _fixed_jitter.assert_any_call(0, 50) # Ensure random.uniform was called for jitter
 
 def test_retry_unexpected_exception(client, mock_grpc_call):
     """Test handling of unexpected non-gRPC exceptions during a call."""
@@ -500,8 +638,18 @@ def test_retry_unexpected_exception(client, mock_grpc_call):
         
     mock_grpc_call.assert_called_once()
 
-@patch('time.sleep', return_value=None)
-def test_retry_backoff_capping(mock_sleep, client, mock_grpc_call):
+def test_retry_vortex_exception_passes_through(client, mock_grpc_call):
+    """A VortexException raised inside the call keeps its type rather than being re-wrapped."""
+    client.retries_enabled = True
+    error = VortexApiError("Raised by an interceptor", status_code=common_pb2.StatusCode.ERROR)
+    mock_grpc_call.side_effect = error
+
+    with pytest.raises(VortexApiError) as exc_info:
+        client._execute_with_retry(mock_grpc_call, "test_op_vortex_err")
+    assert exc_info.value is error
+    mock_grpc_call.assert_called_once()
+
+def test_retry_backoff_capping(_no_sleep, client, mock_grpc_call):
     """Test that backoff duration is capped by max_backoff_ms."""
     client.retries_enabled = True
     client.max_retries = 3
@@ -511,8 +659,7 @@ def test_retry_backoff_capping(mock_sleep, client, mock_grpc_call):
     client.retry_jitter = False # Disable jitter for predictable sleep times
     client.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
 
-    mock_error = grpc.RpcError("Unavailable")
-    mock_error.code = lambda: grpc.StatusCode.UNAVAILABLE
+    mock_error = make_rpc_error(grpc.StatusCode.UNAVAILABLE)
     
     # Fail 3 times, succeed on 4th
     mock_grpc_call.side_effect = [mock_error, mock_error, mock_error, "success_capped_backoff"]
@@ -520,17 +667,37 @@ def test_retry_backoff_capping(mock_sleep, client, mock_grpc_call):
     client._execute_with_retry(mock_grpc_call, "test_op_capped")
     
     assert mock_grpc_call.call_count == 4
-    assert mock_sleep.call_count == 3
+    assert _no_sleep.call_count == 3
     
     # Expected sleep durations (no jitter):
     # 1st retry: initial_backoff_ms = 1000ms
     # 2nd retry: 1000 * 2.0 = 2000ms
     # 3rd retry: 2000 * 2.0 = 4000ms, but capped at max_backoff_ms = 2500ms
-    assert mock_sleep.call_args_list[0][0][0] == 1.0 # 1000ms
-    assert mock_sleep.call_args_list[1][0][0] == 2.0 # 2000ms
-    assert mock_sleep.call_args_list[2][0][0] == 2.5 # 2500ms (capped)
+    assert _no_sleep.call_args_list[0][0][0] == 1.0 # 1000ms
+    assert _no_sleep.call_args_list[1][0][0] == 2.0 # 2000ms
+    assert _no_sleep.call_args_list[2][0][0] == 2.5 # 2500ms (capped)
+
+def test_retry_respects_overall_timeout(_no_sleep, client, mock_grpc_call, mocker):
+    """Retries stop once the backoff would overrun the timeout; retries get the remaining budget."""
+    mocker.patch('time.monotonic', return_value=100.0)
+    client.retries_enabled = True
+    client.max_retries = 5
+    client.initial_backoff_ms = 800
+    client.backoff_multiplier = 1.5
+    client.retry_jitter = False
+    client.retryable_status_codes = [grpc.StatusCode.UNAVAILABLE]
+    mock_grpc_call.side_effect = make_rpc_error(grpc.StatusCode.UNAVAILABLE)
+
+    with pytest.raises(VortexApiError, match="UNAVAILABLE"):
+        client._execute_with_retry(mock_grpc_call, "test_op_deadline", timeout=1.0)
+
+    # 0.8s of backoff fits in the 1s budget, the next 1.2s does not
+    assert [c.args[0] for c in _no_sleep.call_args_list] == [0.8]
+    first, second = mock_grpc_call.call_args_list
+    assert first.kwargs["timeout"] == 1.0
+    assert second.kwargs["timeout"] == pytest.approx(0.2)
 
-def test_retry_with_custom_retryable_codes(client_fixture_factory, mock_grpc_call):
+def test_retry_with_custom_retryable_codes(client_fixture_factory, mock_grpc_call, _no_sleep):
     """Test retry logic with custom retryable status codes."""
     # Use a factory to create a client with specific retry config for this test
     custom_client = client_fixture_factory(
@@ -538,24 +705,19 @@ def test_retry_with_custom_retryable_codes(client_fixture_factory, mock_grpc_cal
         max_retries=1,
         retryable_status_codes=[grpc.StatusCode.INTERNAL, grpc.StatusCode.DATA_LOSS]
     )
+    assert custom_client.retryable_status_codes == frozenset({grpc.StatusCode.INTERNAL, grpc.StatusCode.DATA_LOSS})
     
-    mock_internal_error = grpc.RpcError("Internal Server Error")
-    mock_internal_error.code = lambda: grpc.StatusCode.INTERNAL
+    mock_grpc_call.side_effect = [make_rpc_error(grpc.StatusCode.INTERNAL), "success_custom_code"]
     
-    mock_grpc_call.side_effect = [mock_internal_error, "success_custom_code"]
-    
-    with patch('time.sleep', return_value=None) as mock_sleep_custom:
-        result = custom_client._execute_with_retry(mock_grpc_call, "test_op_custom_codes")
+    result = custom_client._execute_with_retry(mock_grpc_call, "test_op_custom_codes")
     
     assert result == "success_custom_code"
     assert mock_grpc_call.call_count == 2
-    mock_sleep_custom.assert_called_once()
+    _no_sleep.assert_called_once()
 
     # Now test that a default retryable code (UNAVAILABLE) is NOT retried
     mock_grpc_call.reset_mock()
-    mock_unavailable_error = grpc.RpcError("Unavailable")
-    mock_unavailable_error.code = lambda: grpc.StatusCode.UNAVAILABLE
-    mock_grpc_call.side_effect = mock_unavailable_error
+    mock_grpc_call.side_effect = make_rpc_error(grpc.StatusCode.UNAVAILABLE)
 
     with pytest.raises(VortexApiError, match="Failed to test_op_default_not_custom"):
         custom_client._execute_with_retry(mock_grpc_call, "test_op_default_not_custom")
@@ -565,19 +727,22 @@ def test_retry_with_custom_retryable_codes(client_fixture_factory, mock_grpc_cal
 # Helper fixture to create a client with specific retry parameters for certain tests
 @pytest.fixture
 def client_fixture_factory(mocker, mock_grpc_channel, mock_collections_stub, mock_points_stub):
+    # The stub classes are already patched for the module; only _connect needs mocking,
+    # and that does not depend on the retry settings.
+    mocker.patch('vortex_sdk.client.VortexClient._connect', MagicMock())
+    built = {}
+
     def _factory(**retry_kwargs):
-        # Ensure default mocks are in place
-        mocker.patch('grpc.insecure_channel', return_value=mock_grpc_channel)
-        mocker.patch('vortex_sdk._grpc.vortex.api.v1.collections_service_pb2_grpc.CollectionsServiceStub', return_value=mock_collections_stub)
-        mocker.patch('vortex_sdk._grpc.vortex.api.v1.points_service_pb2_grpc.PointsServiceStub', return_value=mock_points_stub)
-        mocker.patch('vortex_sdk.client.VortexClient._connect', MagicMock())
-
-        # Create client with specified retry_kwargs
-        vc = VortexClient(host="mockhost_factory", port=12345, **retry_kwargs)
-        vc._channel = mock_grpc_channel
-        vc._collections_stub = mock_collections_stub
-        vc._points_stub = mock_points_stub
-        return vc
+        # Repeated calls with the same settings return the same client. Lists are
+        # turned into tuples so the settings can be used as a cache key.
+        key = frozenset((k, tuple(v) if isinstance(v, list) else v) for k, v in retry_kwargs.items())
+        if key not in built:
+            vc = VortexClient(host="mockhost_factory", port=12345, **retry_kwargs)
+            vc._channel = mock_grpc_channel
+            vc._collections_stub = mock_collections_stub
+            vc._points_stub = mock_points_stub
+            built[key] = vc
+        return built[key]
     return _factory
 
 # TODO: Add more tests for edge cases, different parameter combinations, and error handling.
@@ -1,13 +1,28 @@
 """
 Unit tests for conversion functions in vortex_sdk.conversions.
 """
+import array
+import copy
+import enum
+
 import pytest
-from google.protobuf import struct_pb2
+from google.protobuf import json_format, struct_pb2
 
 from vortex_sdk import models
 from vortex_sdk import conversions
 from vortex_sdk._grpc.vortex.api.v1 import common_pb2
 from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2
+from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2
+
+def _as_float32(values):
+    # Vector elements and scores are float32 on the wire, so compare against the exact
+    # float32-rounded values instead of an element-by-element tolerance check.
+    return array.array("f", values).tolist()
+
+class _NdarrayLike(array.array):
+    """A float array that, like numpy.ndarray, refuses to be used as a bool."""
+    def __bool__(self):
+        raise ValueError("The truth value of an array with more than one element is ambiguous.")
 
 # --- Test Data ---
 
@@ -79,10 +94,58 @@ def get_sample_grpc_hnsw_config() -> common_pb2.HnswConfigParams:
 def test_vector_conversion():
     pydantic_vec = get_sample_pydantic_vector()
     grpc_vec = conversions.pydantic_to_grpc_vector(pydantic_vec)
-    assert list(grpc_vec.elements) == pytest.approx(pydantic_vec.elements)
+    assert list(grpc_vec.elements) == _as_float32(pydantic_vec.elements)
 
     pydantic_vec_converted_back = conversions.grpc_to_pydantic_vector(grpc_vec)
-    assert pydantic_vec_converted_back.elements == pytest.approx(pydantic_vec.elements)
+    assert pydantic_vec_converted_back.elements == _as_float32(pydantic_vec.elements)
+
+def test_vector_conversion_packed():
+    # The wire-level fast path in conversions assumes a packed float field
+    assert common_pb2.Vector.DESCRIPTOR.fields_by_name["elements"].is_packed
+
+    # 768 dims makes the packed length a multi-byte varint
+    elements = [i / 7.0 for i in range(768)]
+    pydantic_vec = models.Vector(elements=array.array("f", elements))
+    assert isinstance(pydantic_vec.elements, list)
+
+    grpc_vec = conversions.pydantic_to_grpc_vector(pydantic_vec)
+    assert grpc_vec == common_pb2.Vector(elements=elements)
+    assert conversions.grpc_to_pydantic_vector(grpc_vec).elements == list(grpc_vec.elements)
+
+    view = conversions.grpc_to_pydantic_vector_view(grpc_vec)
+    assert view.format == "f" and view.readonly
+    assert view.tolist() == list(grpc_vec.elements)
+
+    empty_vec = conversions.pydantic_to_grpc_vector(models.Vector())
+    assert len(empty_vec.elements) == 0
+    assert len(conversions.grpc_to_pydantic_vector_view(empty_vec)) == 0
+    assert conversions.grpc_to_pydantic_vector(empty_vec) == models.Vector()
+
+def test_vector_conversion_with_unknown_fields():
+    # A newer server may send fields this client doesn't know; they serialize after the
+    # elements and must not be read as float data
+    packed = common_pb2.Vector(elements=[1.0, 2.0]).SerializeToString()
+    for trailing in (b"\x10\x05", b"\x10\x05\x10\x05"):
+        grpc_vec = common_pb2.Vector.FromString(packed + trailing)
+        assert conversions.grpc_to_pydantic_vector(grpc_vec).elements == [1.0, 2.0]
+
+    only_unknown = common_pb2.Vector.FromString(b"\x10\x05")
+    assert conversions.grpc_to_pydantic_vector(only_unknown) == models.Vector()
+
+def test_vector_view_with_unknown_fields():
+    packed = common_pb2.Vector(elements=[1.0, 2.0]).SerializeToString()
+    grpc_vec = common_pb2.Vector.FromString(packed + b"\x10\x05\x10\x05")
+    view = conversions.grpc_to_pydantic_vector_view(grpc_vec)
+    assert view.format == "f" and view.readonly
+    assert view.tolist() == [1.0, 2.0]
+
+    # Unknown fields ahead of the elements on the wire are re-serialized after them
+    grpc_vec = common_pb2.Vector.FromString(b"\x10\x05" + packed)
+    assert conversions.grpc_to_pydantic_vector_view(grpc_vec).tolist() == [1.0, 2.0]
+
+    view = conversions.grpc_to_pydantic_vector_view(common_pb2.Vector.FromString(b"\x10\x05"))
+    assert view.format == "f" and view.readonly
+    assert len(view) == 0
 
 def test_payload_conversion():
     pydantic_payload = get_sample_pydantic_payload()
@@ -99,17 +162,38 @@ def test_payload_conversion():
     pydantic_payload_converted_back = conversions.grpc_to_pydantic_payload(grpc_payload)
     assert pydantic_payload_converted_back == pydantic_payload
 
+def test_payload_decode_matches_json_format():
+    # The hand-rolled decoder must agree with protobuf's own Struct-to-dict mapping
+    grpc_payload = get_sample_grpc_payload()
+    expected = json_format.MessageToDict(grpc_payload, preserving_proto_field_name=True)["fields"]
+    assert conversions.grpc_to_pydantic_payload(grpc_payload).fields == expected
+
+def test_payload_conversion_edge_cases():
+    # Empty payloads round-trip to an empty map
+    empty_pb = conversions.pydantic_to_grpc_payload(models.Payload())
+    assert len(empty_pb.fields) == 0
+    assert conversions.grpc_to_pydantic_payload(empty_pb) == models.Payload()
+
+    # Empty nested containers are kept, not dropped
+    nested_pb = conversions.pydantic_to_grpc_payload(models.Payload(fields={"d": {}, "l": []}))
+    assert nested_pb.fields["d"].HasField("struct_value")
+    assert nested_pb.fields["l"].HasField("list_value")
+
+    # Values Struct cannot hold fall back to their string form
+    odd_pb = conversions.pydantic_to_grpc_payload(models.Payload(fields={"d": {"b": b"raw"}}))
+    assert odd_pb.fields["d"].struct_value.fields["b"].string_value == "b'raw'"
+
 def test_point_struct_conversion():
     pydantic_point = get_sample_pydantic_point_struct()
     grpc_point = conversions.pydantic_to_grpc_point_struct(pydantic_point)
     assert grpc_point.id == pydantic_point.id
-    assert list(grpc_point.vector.elements) == pytest.approx(pydantic_point.vector.elements)
+    assert list(grpc_point.vector.elements) == _as_float32(pydantic_point.vector.elements)
     assert grpc_point.payload.fields["string_field"].string_value == "hello"
 
     pydantic_point_converted_back = conversions.grpc_to_pydantic_point_struct(grpc_point)
     # Compare fields individually due to potential float precision in payload
     assert pydantic_point_converted_back.id == pydantic_point.id
-    assert pydantic_point_converted_back.vector.elements == pytest.approx(pydantic_point.vector.elements)
+    assert pydantic_point_converted_back.vector.elements == _as_float32(pydantic_point.vector.elements)
     assert pydantic_point_converted_back.payload.fields["string_field"] == pydantic_point.payload.fields["string_field"]
     assert pydantic_point_converted_back.payload.fields["int_field"] == pydantic_point.payload.fields["int_field"]
     assert pydantic_point_converted_back.payload.fields["float_field"] == pytest.approx(pydantic_point.payload.fields["float_field"])
@@ -122,6 +206,77 @@ def test_point_struct_conversion():
     pydantic_point_np_back = conversions.grpc_to_pydantic_point_struct(grpc_point_no_payload)
     assert pydantic_point_np_back.payload is None
 
+def test_point_struct_serialized_cache():
+    point = get_sample_pydantic_point_struct()
+    first = conversions.pydantic_to_grpc_point_struct(point, cache_serialized=True)
+    assert point._pb_bytes == first.SerializeToString()
+    assert conversions.pydantic_to_grpc_point_struct(point) == first
+
+    # Empty payload presence survives the cached bytes
+    empty_payload_point = models.PointStruct(id="e", vector=models.Vector(), payload=models.Payload())
+    conversions.pydantic_to_grpc_point_struct(empty_payload_point, cache_serialized=True)
+    assert conversions.pydantic_to_grpc_point_struct(empty_payload_point).HasField("payload")
+
+    # Reassigning a field invalidates the cache
+    point.id = "renamed"
+    assert point._pb_bytes is None
+    assert conversions.pydantic_to_grpc_point_struct(point).id == "renamed"
+
+def test_point_struct_copy_drops_serialized_cache():
+    point = get_sample_pydantic_point_struct()
+    conversions.pydantic_to_grpc_point_struct(point, cache_serialized=True)
+    assert point._pb_bytes is not None
+
+    for deep in (False, True):
+        renamed = point.model_copy(update={"id": "copy"}, deep=deep)
+        assert renamed._pb_bytes is None
+        assert conversions.pydantic_to_grpc_point_struct(renamed).id == "copy"
+    assert copy.copy(point)._pb_bytes is None
+    assert copy.deepcopy(point)._pb_bytes is None
+    # The original keeps its cache
+    assert point._pb_bytes is not None
+
+def test_batch_point_conversion():
+    points = [
+        get_sample_pydantic_point_struct(),
+        models.PointStruct(id="p2", vector=get_sample_pydantic_vector()),
+        models.PointStruct(id="p3", vector=models.Vector(), payload=models.Payload()),
+    ]
+    request = points_service_pb2.UpsertPointsRequest(collection_name="c")
+    conversions.pydantic_batch_to_grpc_points(points, request.points)
+
+    assert list(request.points) == [conversions.pydantic_to_grpc_point_struct(p) for p in points]
+    assert not request.points[1].HasField("payload")
+    # An empty payload is still sent, so it is not confused with "no payload"
+    assert request.points[2].HasField("payload")
+    assert request.points[2].HasField("vector")
+
+    upsert_request = conversions.pydantic_to_grpc_upsert_request("c", iter(points), wait_flush=True)
+    assert upsert_request.points == request.points
+    assert upsert_request.wait_flush is True
+    assert not conversions.pydantic_to_grpc_upsert_request("c", points).HasField("wait_flush")
+
+
+def test_point_batch_conversion():
+    batch = models.PointBatch(
+        ids=["a", "b"],
+        vectors=[[0.5, 1.5], [2.5, 3.5]],
+        payload_columns={"user_id": [1, 2], "tag": ["x", "y"], "active": [True, False]},
+    )
+    rows = [
+        models.PointStruct(
+            id=point_id,
+            vector=models.Vector(elements=elements),
+            payload=models.Payload(fields={k: column[i] for k, column in batch.payload_columns.items()}),
+        )
+        for i, (point_id, elements) in enumerate(zip(batch.ids, batch.vectors))
+    ]
+    assert conversions.pydantic_to_grpc_upsert_request("c", batch) == conversions.pydantic_to_grpc_upsert_request("c", rows)
+
+    # No columns means no payloads
+    no_payload = conversions.pydantic_to_grpc_upsert_request("c", models.PointBatch(ids=["a"], vectors=[[1.0]]))
+    assert not no_payload.points[0].HasField("payload")
+
 
 def test_scored_point_conversion():
     grpc_sp = common_pb2.ScoredPoint(
@@ -134,16 +289,16 @@ def test_scored_point_conversion():
     
     pydantic_sp = conversions.grpc_to_pydantic_scored_point(grpc_sp)
     assert pydantic_sp.id == "sp1"
-    assert pydantic_sp.score == pytest.approx(0.88)
+    assert pydantic_sp.score == _as_float32([0.88])[0]
     assert pydantic_sp.version == 10
-    assert pydantic_sp.vector.elements == pytest.approx([1.1, 2.2, 3.3])
+    assert pydantic_sp.vector.elements == _as_float32([1.1, 2.2, 3.3])
     assert pydantic_sp.payload.fields["string_field"] == "hello"
 
     # Test minimal ScoredPoint (no vector, payload, version)
     grpc_sp_minimal = common_pb2.ScoredPoint(id="sp2", score=0.77)
     pydantic_sp_minimal = conversions.grpc_to_pydantic_scored_point(grpc_sp_minimal)
     assert pydantic_sp_minimal.id == "sp2"
-    assert pydantic_sp_minimal.score == pytest.approx(0.77)
+    assert pydantic_sp_minimal.score == _as_float32([0.77])[0]
     assert pydantic_sp_minimal.vector is None
     assert pydantic_sp_minimal.payload is None
     assert pydantic_sp_minimal.version is None
@@ -168,6 +323,9 @@ def test_hnsw_config_conversion():
     pydantic_config_ns_back = conversions.grpc_to_pydantic_hnsw_config(grpc_config_no_seed)
     assert pydantic_config_ns_back.seed is None
 
+    # The hand-written field mapping has to track the proto message
+    assert set(common_pb2.HnswConfigParams.DESCRIPTOR.fields_by_name) == set(models.HnswConfigParams.model_fields)
+
 
 def test_distance_metric_conversion():
     assert conversions.pydantic_to_grpc_distance_metric(models.DistanceMetric.COSINE) == common_pb2.DistanceMetric.COSINE
@@ -217,6 +375,19 @@ def test_collection_description_conversion():
     assert pydantic_desc.dimensions == 128
     assert pydantic_desc.distance_metric == models.DistanceMetric.COSINE
 
+def test_filter_value_dispatch():
+    class Level(enum.IntEnum):
+        HIGH = 2
+
+    grpc_filter = conversions.pydantic_to_grpc_filter(
+        models.Filter(must_match_exact={"flag": True, "n": 1, "level": Level.HIGH, "tags": []})
+    )
+    assert grpc_filter.must_match_exact["flag"].WhichOneof("kind") == "bool_value"
+    assert grpc_filter.must_match_exact["n"].WhichOneof("kind") == "number_value"
+    # Subclasses of the dispatched types go through the isinstance fallback
+    assert grpc_filter.must_match_exact["level"].number_value == 2.0
+    assert grpc_filter.must_match_exact["tags"].WhichOneof("kind") == "list_value"
+
 def test_filter_conversion():
     pydantic_filter = models.Filter(must_match_exact={"key1": "value1", "key2": 123})
     grpc_filter = conversions.pydantic_to_grpc_filter(pydantic_filter)
@@ -271,6 +442,24 @@ def test_status_code_conversion():
     assert conversions.grpc_to_pydantic_status_code(common_pb2.StatusCode.NOT_FOUND) == models.StatusCode.NOT_FOUND
     assert conversions.grpc_to_pydantic_status_code(common_pb2.StatusCode.STATUS_CODE_UNSPECIFIED) == models.StatusCode.ERROR # Default
 
+@pytest.mark.parametrize(
+    "enum_pb, table",
+    [
+        (common_pb2.DistanceMetric, conversions._GRPC_TO_PYDANTIC_DISTANCE_METRIC_MAP),
+        (collections_service_pb2.CollectionStatus, conversions._GRPC_TO_PYDANTIC_COLLECTION_STATUS_MAP),
+        (common_pb2.StatusCode, conversions._GRPC_TO_PYDANTIC_STATUS_CODE_MAP),
+    ],
+    ids=["distance_metric", "collection_status", "status_code"],
+)
+def test_enum_tables_cover_proto(enum_pb, table):
+    # Every proto value gets an explicit table entry; only unknown (newer server) values hit the default
+    assert set(table) == set(enum_pb.values())
+
+def test_enum_conversion_unknown_values():
+    assert conversions.grpc_to_pydantic_distance_metric(999) == models.DistanceMetric.COSINE
+    assert conversions.grpc_to_pydantic_collection_status(999) == models.CollectionStatus.GREEN
+    assert conversions.grpc_to_pydantic_status_code(999) == models.StatusCode.ERROR
+
 def test_point_operation_status_conversion():
     grpc_pos = common_pb2.PointOperationStatus(
         point_id="p1_op",
@@ -306,3 +495,41 @@ def test_search_params_conversion():
     # Test with pydantic_sp itself being None
     grpc_sp_from_none_pydantic = conversions.pydantic_to_grpc_search_params(None)
     assert grpc_sp_from_none_pydantic is None
+
+def test_search_request_conversion():
+    """The search request builder matches a request assembled from the standalone converters."""
+    query = models.Vector(elements=[0.25, 0.5])
+    search_filter = models.Filter(must_match_exact={"color": "red", "year": 2020})
+    params = models.SearchParams(ef_search=64)
+
+    request = conversions.pydantic_to_grpc_search_request("c", query, 5, search_filter, True, False, params)
+    assert request == points_service_pb2.SearchPointsRequest(
+        collection_name="c",
+        query_vector=conversions.pydantic_to_grpc_vector(query),
+        k_limit=5,
+        filter=conversions.pydantic_to_grpc_filter(search_filter),
+        with_payload=True,
+        with_vector=False,
+        params=conversions.pydantic_to_grpc_search_params(params),
+    )
+
+    # Empty filters and params stay unset, and an empty query vector is still present
+    bare = conversions.pydantic_to_grpc_search_request(
+        "c", models.Vector(elements=[]), 1, models.Filter(), None, None, models.SearchParams()
+    )
+    assert bare.HasField("query_vector")
+    for field in ("filter", "params", "with_payload", "with_vector"):
+        assert not bare.HasField(field)
+
+def test_search_request_from_prefix():
+    """A prefix plus raw floats gives the same request as the full search request builder."""
+    search_filter = models.Filter(must_match_exact={"color": "red"})
+    params = models.SearchParams(ef_search=32)
+    prefix = conversions.pydantic_to_grpc_search_request_prefix("c", search_filter, False, True, params)
+
+    request = conversions.grpc_search_request_from_prefix(prefix, array.array("f", [0.25, 0.5]), 7)
+    assert request == conversions.pydantic_to_grpc_search_request(
+        "c", models.Vector(elements=[0.25, 0.5]), 7, search_filter, False, True, params
+    )
+    # numpy-style arrays can't be truth-tested, so emptiness must go through len()
+    assert conversions.grpc_search_request_from_prefix(prefix, _NdarrayLike("f", [0.25, 0.5]), 7) == request
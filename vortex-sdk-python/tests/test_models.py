@@ -66,6 +66,27 @@ def test_point_struct_creation():
     with pytest.raises(ValidationError):
         models.PointStruct(vector={"elements": [1.0]}) # Missing id
 
+def test_point_batch_creation():
+    """Test PointBatch model creation and column length checks."""
+    batch = models.PointBatch(
+        ids=["a", "b"],
+        vectors=[[0.1, 0.2], [0.3, 0.4]],
+        payload_columns={"user_id": [1, 2], "tag": ["x", "y"], "active": [True, False]},
+    )
+    assert batch.payload_columns["user_id"] == [1.0, 2.0]
+    assert batch.payload_columns["active"] == [True, False]
+
+    with pytest.raises(ValidationError): # One vector short
+        models.PointBatch(ids=["a", "b"], vectors=[[0.1]])
+
+    with pytest.raises(ValidationError): # Column length mismatch
+        models.PointBatch(ids=["a"], vectors=[[0.1]], payload_columns={"tag": ["x", "y"]})
+
+    # Mixed columns are rejected instead of being coerced to a single type
+    for mixed in ([1.0, True], [True, 1.0], ["x", 1], [1, "x"]):
+        with pytest.raises(ValidationError):
+            models.PointBatch(ids=["a", "b"], vectors=[[0.1], [0.2]], payload_columns={"c": mixed})
+
 def test_scored_point_creation():
     """Test ScoredPoint model creation."""
     sp_data = {
@@ -108,11 +129,10 @@ def test_hnsw_config_params_creation():
     config_with_seed = models.HnswConfigParams(**config_data, seed=42)
     assert config_with_seed.seed == 42
 
-    with pytest.raises(ValidationError): # m must be > 0
-        models.HnswConfigParams(**{**config_data, "m": 0})
-    
-    with pytest.raises(ValidationError): # vector_dim must be > 0
-        models.HnswConfigParams(**{**config_data, "vector_dim": 0})
+    # Every numeric parameter carries a gt=0 constraint
+    for field_name in config_data:
+        with pytest.raises(ValidationError):
+            models.HnswConfigParams(**{**config_data, field_name: 0})
 
 def test_collection_info_creation():
     """Test CollectionInfo model creation."""
@@ -3,7 +3,28 @@ Vortex Python SDK
 """
 __version__ = "0.1.0"
 
-from .client import VortexClient, AsyncVortexClient
+import importlib as _importlib
+import os as _os
+import warnings as _warnings
+
+# Conversions round-trip every request and response through protobuf messages, which
+# is far slower on the pure-Python runtime. Prefer upb unless the caller picked a
+# backend; this only takes effect if google.protobuf has not been imported yet.
+_os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.protobuf.internal import api_implementation as _api_implementation
+
+if _api_implementation.Type() not in ("upb", "cpp"):
+    _warnings.warn(
+        f"vortex_sdk is running on the '{_api_implementation.Type()}' protobuf backend; "
+        "install protobuf>=4.21 wheels and leave PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION "
+        "unset (or set it to 'upb') for much faster (de)serialization.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     VortexException,
     VortexConnectionError,
@@ -11,21 +32,57 @@ from .exceptions import (
     VortexApiError,
     VortexClientConfigurationError,
 )
-from .models import (
-    DistanceMetric,
-    CollectionStatus,
-    StatusCode,
-    Vector,
-    PayloadValue,
-    Payload,
-    PointStruct,
-    ScoredPoint,
-    Filter,
-    HnswConfigParams,
-    PointOperationStatus,
-    CollectionInfo,
-    CollectionDescription,
-)
+
+if TYPE_CHECKING:
+    from .client import VortexClient, AsyncVortexClient
+    from .models import (
+        DistanceMetric,
+        CollectionStatus,
+        StatusCode,
+        Vector,
+        PayloadValue,
+        Payload,
+        PointStruct,
+        PointBatch,
+        ScoredPoint,
+        Filter,
+        HnswConfigParams,
+        PointOperationStatus,
+        CollectionInfo,
+        CollectionDescription,
+    )
+
+# The clients (grpc, stubs and their descriptors) and the pydantic models are the
+# expensive parts of the import, so they are only loaded on first attribute access.
+_LAZY_ATTRS = {
+    "VortexClient": "client",
+    "AsyncVortexClient": "client",
+    "DistanceMetric": "models",
+    "CollectionStatus": "models",
+    "StatusCode": "models",
+    "Vector": "models",
+    "PayloadValue": "models",
+    "Payload": "models",
+    "PointStruct": "models",
+    "PointBatch": "models",
+    "ScoredPoint": "models",
+    "Filter": "models",
+    "HnswConfigParams": "models",
+    "PointOperationStatus": "models",
+    "CollectionInfo": "models",
+    "CollectionDescription": "models",
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     "VortexClient",
@@ -44,6 +101,7 @@ __all__ = [
     "PayloadValue",
     "Payload",
     "PointStruct",
+    "PointBatch",
     "ScoredPoint",
     "Filter",
     "HnswConfigParams",
@@ -0,0 +1,98 @@
+"""
+Process-wide cache of gRPC channels shared between synchronous clients.
+
+Clients created with `shared_channels=True` acquire their channels here instead of
+opening new ones, so short-lived clients reuse an established connection rather than
+paying the TCP/TLS/HTTP2 handshake each time. Channels are reference counted; once the
+last client releases one it stays open for `ttl` seconds in case another client wants
+it, after which a background reaper closes it.
+"""
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+import grpc # type: ignore
+
+DEFAULT_CHANNEL_TTL_SECONDS = 600.0
+
+
+class _Entry:
+    __slots__ = ("channel", "refcount", "idle_since")
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.refcount = 0
+        self.idle_since: Optional[float] = None
+
+
+class ChannelCache:
+    _instance: Optional["ChannelCache"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl: float = DEFAULT_CHANNEL_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "ChannelCache":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def acquire(self, key: Hashable, factory: Callable[[], grpc.Channel]) -> grpc.Channel:
+        """Returns the cached channel for `key`, creating it with `factory` on first use."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(factory())
+            entry.refcount += 1
+            entry.idle_since = None
+            return entry.channel
+
+    def release(self, key: Hashable) -> None:
+        """Drops one reference; an unreferenced channel is closed once it has been idle for `ttl`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            if entry.refcount == 0:
+                entry.idle_since = time.monotonic()
+                if self._reaper is None:
+                    self._reaper = threading.Thread(
+                        target=self._reap, name="vortex-channel-reaper", daemon=True
+                    )
+                    self._reaper.start()
+
+    def clear(self) -> None:
+        """Closes every cached channel, whether or not it is still referenced."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+        for entry in entries:
+            entry.channel.close()
+
+    def _close_expired(self, now: float) -> bool:
+        """Closes channels idle for longer than `ttl`; returns whether idle ones remain."""
+        expired: List[grpc.Channel] = []
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.idle_since is not None and now - entry.idle_since >= self.ttl:
+                    expired.append(entry.channel)
+                    del self._entries[key]
+            idle_left = any(entry.idle_since is not None for entry in self._entries.values())
+            if not idle_left:
+                self._reaper = None
+        for channel in expired:
+            channel.close()
+        return idle_left
+
+    def _reap(self) -> None:
+        # Runs only while there are idle channels, so an unused cache holds no thread.
+        while True:
+            time.sleep(min(self.ttl, 60.0))
+            if not self._close_expired(time.monotonic()):
+                return
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1avortex/api/v1/common.proto\x12\rvortex.api.v1\x1a\x1cgoogle/protobuf/struct.proto\"\x1a\n\x06Vector\x12\x10\n\x08\x65lements\x18\x01 \x03(\x02\"\x84\x01\n\x07Payload\x12\x32\n\x06\x66ields\x18\x01 \x03(\x0b\x32\".vortex.api.v1.Payload.FieldsEntry\x1a\x45\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value:\x02\x38\x01\"z\n\x0bPointStruct\x12\n\n\x02id\x18\x01 \x01(\t\x12%\n\x06vector\x18\x02 \x01(\x0b\x32\x15.vortex.api.v1.Vector\x12,\n\x07payload\x18\x03 \x01(\x0b\x32\x16.vortex.api.v1.PayloadH\x00\x88\x01\x01\x42\n\n\x08_payload\"\xbb\x01\n\x0bScoredPoint\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x06vector\x18\x02 \x01(\x0b\x32\x15.vortex.api.v1.VectorH\x00\x88\x01\x01\x12,\n\x07payload\x18\x03 \x01(\x0b\x32\x16.vortex.api.v1.PayloadH\x01\x88\x01\x01\x12\r\n\x05score\x18\x04 \x01(\x02\x12\x14\n\x07version\x18\x05 \x01(\x04H\x02\x88\x01\x01\x42\t\n\x07_vectorB\n\n\x08_payloadB\n\n\x08_version\"\x9c\x01\n\x06\x46ilter\x12\x43\n\x10must_match_exact\x18\x01 \x03(\x0b\x32).vortex.api.v1.Filter.MustMatchExactEntry\x1aM\n\x13MustMatchExactEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value:\x02\x38\x01\"\x95\x01\n\x10HnswConfigParams\x12\t\n\x01m\x18\x01 \x01(\r\x12\x17\n\x0f\x65\x66_construction\x18\x02 \x01(\r\x12\x11\n\tef_search\x18\x03 \x01(\r\x12\n\n\x02ml\x18\x04 \x01(\x01\x12\x11\n\x04seed\x18\x05 \x01(\x04H\x00\x88\x01\x01\x12\x12\n\nvector_dim\x18\x06 \x01(\r\x12\x0e\n\x06m_max0\x18\x07 \x01(\rB\x07\n\x05_seed\"4\n\x0cSearchParams\x12\x16\n\tef_search\x18\x01 \x01(\rH\x00\x88\x01\x01\x42\x0c\n\n_ef_search\"\x86\x01\n\x14PointOperationStatus\x12\x10\n\x08point_id\x18\x01 \x01(\t\x12.\n\x0bstatus_code\x18\x02 \x01(\x0e\x32\x19.vortex.api.v1.StatusCode\x12\x1a\n\rerror_message\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x10\n\x0e_error_message*O\n\x0e\x44istanceMetric\x12\x1f\n\x1b\x44ISTANCE_METRIC_UNSPECIFIED\x10\x00\x12\n\n\x06\x43OSINE\x10\x01\x12\x10\n\x0c\x45UCLIDEAN_L2\x10\x02*a\n\nStatusCode\x12\x1b\n\x17STATUS_CODE_UNSPECIFIED\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\r\n\tNOT_FOUND\x10\x03\x12\x14\n\x10INVALID_ARGUMENT\x10\x04\x42\x62\n\x12io.vortexdb.api.v1B\x0b\x43ommonProtoP\x01Z=github.com/vortex-db/vortex/proto/vortex/api/v1;vortex_api_v1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1avortex/api/v1/common.proto\x12\rvortex.api.v1\x1a\x1cgoogle/protobuf/struct.proto\"\x1e\n\x06Vector\x12\x14\n\x08\x65lements\x18\x01 \x03(\x02\x42\x02\x10\x01\"\x84\x01\n\x07Payload\x12\x32\n\x06\x66ields\x18\x01 \x03(\x0b\x32\".vortex.api.v1.Payload.FieldsEntry\x1a\x45\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value:\x02\x38\x01\"z\n\x0bPointStruct\x12\n\n\x02id\x18\x01 \x01(\t\x12%\n\x06vector\x18\x02 \x01(\x0b\x32\x15.vortex.api.v1.Vector\x12,\n\x07payload\x18\x03 \x01(\x0b\x32\x16.vortex.api.v1.PayloadH\x00\x88\x01\x01\x42\n\n\x08_payload\"\xbb\x01\n\x0bScoredPoint\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x06vector\x18\x02 \x01(\x0b\x32\x15.vortex.api.v1.VectorH\x00\x88\x01\x01\x12,\n\x07payload\x18\x03 \x01(\x0b\x32\x16.vortex.api.v1.PayloadH\x01\x88\x01\x01\x12\r\n\x05score\x18\x04 \x01(\x02\x12\x14\n\x07version\x18\x05 \x01(\x04H\x02\x88\x01\x01\x42\t\n\x07_vectorB\n\n\x08_payloadB\n\n\x08_version\"\x9c\x01\n\x06\x46ilter\x12\x43\n\x10must_match_exact\x18\x01 \x03(\x0b\x32).vortex.api.v1.Filter.MustMatchExactEntry\x1aM\n\x13MustMatchExactEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value:\x02\x38\x01\"\x95\x01\n\x10HnswConfigParams\x12\t\n\x01m\x18\x01 \x01(\r\x12\x17\n\x0f\x65\x66_construction\x18\x02 \x01(\r\x12\x11\n\tef_search\x18\x03 \x01(\r\x12\n\n\x02ml\x18\x04 \x01(\x01\x12\x11\n\x04seed\x18\x05 \x01(\x04H\x00\x88\x01\x01\x12\x12\n\nvector_dim\x18\x06 \x01(\r\x12\x0e\n\x06m_max0\x18\x07 \x01(\rB\x07\n\x05_seed\"4\n\x0cSearchParams\x12\x16\n\tef_search\x18\x01 \x01(\rH\x00\x88\x01\x01\x42\x0c\n\n_ef_search\"\x86\x01\n\x14PointOperationStatus\x12\x10\n\x08point_id\x18\x01 \x01(\t\x12.\n\x0bstatus_code\x18\x02 \x01(\x0e\x32\x19.vortex.api.v1.StatusCode\x12\x1a\n\rerror_message\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x10\n\x0e_error_message*O\n\x0e\x44istanceMetric\x12\x1f\n\x1b\x44ISTANCE_METRIC_UNSPECIFIED\x10\x00\x12\n\n\x06\x43OSINE\x10\x01\x12\x10\n\x0c\x45UCLIDEAN_L2\x10\x02*a\n\nStatusCode\x12\x1b\n\x17STATUS_CODE_UNSPECIFIED\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\r\n\tNOT_FOUND\x10\x03\x12\x14\n\x10INVALID_ARGUMENT\x10\x04\x42\x62\n\x12io.vortexdb.api.v1B\x0b\x43ommonProtoP\x01Z=github.com/vortex-db/vortex/proto/vortex/api/v1;vortex_api_v1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,32 +33,34 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'vortex.api.v1.common_pb2',
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\022io.vortexdb.api.v1B\013CommonProtoP\001Z=github.com/vortex-db/vortex/proto/vortex/api/v1;vortex_api_v1'
+  _globals['_VECTOR'].fields_by_name['elements']._loaded_options = None
+  _globals['_VECTOR'].fields_by_name['elements']._serialized_options = b'\020\001'
   _globals['_PAYLOAD_FIELDSENTRY']._loaded_options = None
   _globals['_PAYLOAD_FIELDSENTRY']._serialized_options = b'8\001'
   _globals['_FILTER_MUSTMATCHEXACTENTRY']._loaded_options = None
   _globals['_FILTER_MUSTMATCHEXACTENTRY']._serialized_options = b'8\001'
-  _globals['_DISTANCEMETRIC']._serialized_start=1054
-  _globals['_DISTANCEMETRIC']._serialized_end=1133
-  _globals['_STATUSCODE']._serialized_start=1135
-  _globals['_STATUSCODE']._serialized_end=1232
+  _globals['_DISTANCEMETRIC']._serialized_start=1058
+  _globals['_DISTANCEMETRIC']._serialized_end=1137
+  _globals['_STATUSCODE']._serialized_start=1139
+  _globals['_STATUSCODE']._serialized_end=1236
   _globals['_VECTOR']._serialized_start=75
-  _globals['_VECTOR']._serialized_end=101
-  _globals['_PAYLOAD']._serialized_start=104
-  _globals['_PAYLOAD']._serialized_end=236
-  _globals['_PAYLOAD_FIELDSENTRY']._serialized_start=167
-  _globals['_PAYLOAD_FIELDSENTRY']._serialized_end=236
-  _globals['_POINTSTRUCT']._serialized_start=238
-  _globals['_POINTSTRUCT']._serialized_end=360
-  _globals['_SCOREDPOINT']._serialized_start=363
-  _globals['_SCOREDPOINT']._serialized_end=550
-  _globals['_FILTER']._serialized_start=553
-  _globals['_FILTER']._serialized_end=709
-  _globals['_FILTER_MUSTMATCHEXACTENTRY']._serialized_start=632
-  _globals['_FILTER_MUSTMATCHEXACTENTRY']._serialized_end=709
-  _globals['_HNSWCONFIGPARAMS']._serialized_start=712
-  _globals['_HNSWCONFIGPARAMS']._serialized_end=861
-  _globals['_SEARCHPARAMS']._serialized_start=863
-  _globals['_SEARCHPARAMS']._serialized_end=915
-  _globals['_POINTOPERATIONSTATUS']._serialized_start=918
-  _globals['_POINTOPERATIONSTATUS']._serialized_end=1052
+  _globals['_VECTOR']._serialized_end=105
+  _globals['_PAYLOAD']._serialized_start=108
+  _globals['_PAYLOAD']._serialized_end=240
+  _globals['_PAYLOAD_FIELDSENTRY']._serialized_start=171
+  _globals['_PAYLOAD_FIELDSENTRY']._serialized_end=240
+  _globals['_POINTSTRUCT']._serialized_start=242
+  _globals['_POINTSTRUCT']._serialized_end=364
+  _globals['_SCOREDPOINT']._serialized_start=367
+  _globals['_SCOREDPOINT']._serialized_end=554
+  _globals['_FILTER']._serialized_start=557
+  _globals['_FILTER']._serialized_end=713
+  _globals['_FILTER_MUSTMATCHEXACTENTRY']._serialized_start=636
+  _globals['_FILTER_MUSTMATCHEXACTENTRY']._serialized_end=713
+  _globals['_HNSWCONFIGPARAMS']._serialized_start=716
+  _globals['_HNSWCONFIGPARAMS']._serialized_end=865
+  _globals['_SEARCHPARAMS']._serialized_start=867
+  _globals['_SEARCHPARAMS']._serialized_end=919
+  _globals['_POINTOPERATIONSTATUS']._serialized_start=922
+  _globals['_POINTOPERATIONSTATUS']._serialized_end=1056
 # @@protoc_insertion_point(module_scope)
@@ -1,10 +1,12 @@
 """
 Main client for interacting with the Vortex Vector Database.
 """
+import hashlib
+import itertools
 import time
 import random
 import asyncio # Added for async sleep
-from typing import Optional, Union, List, Dict, Any, Tuple, Callable, TypeVar, Awaitable
+from typing import Optional, Union, List, Any, Tuple, Callable, Awaitable, Iterable, Iterator, FrozenSet, Sequence
 import grpc # type: ignore
 import grpc.aio # For async client
 
@@ -18,14 +20,68 @@ from ._grpc.vortex.api.v1 import points_service_pb2 # For points request/respons
 # Pydantic models
 from . import models
 from . import conversions
+from ._channel_cache import ChannelCache
 
 # Custom exceptions
 from .exceptions import VortexConnectionError, VortexApiError, VortexClientConfigurationError, VortexException
 # VortexApiException was removed as it's not defined in exceptions.py
 
+# Applied to every channel unless overridden by the same key in `grpc_options`. Keepalive
+# pings stop idle connections from being dropped by NATs and proxies, which would otherwise
+# surface as UNAVAILABLE errors; the message limits leave room for large upsert batches.
+_DEFAULT_GRPC_OPTIONS: Tuple[Tuple[str, Any], ...] = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", 256 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 256 * 1024 * 1024),
+)
+
+def _channel_options(
+    grpc_options: Optional[List[Tuple[str, Any]]], pool_size: int
+) -> List[Tuple[str, Any]]:
+    """
+    Channel options for one channel of a pool: the defaults with `grpc_options` merged on
+    top. With more than one channel, each gets its own subchannel pool; otherwise gRPC
+    would share a single connection between them.
+    """
+    options = dict(_DEFAULT_GRPC_OPTIONS)
+    options.update(grpc_options or ())
+    if pool_size > 1:
+        options["grpc.use_local_subchannel_pool"] = 1
+    return list(options.items())
+
+_DEFAULT_RETRYABLE_STATUS_CODES: FrozenSet[grpc.StatusCode] = frozenset((
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+))
+
+def _retry_backoff_ms(
+    attempt: int, initial_ms: float, multiplier: float, max_ms: float, jitter: bool
+) -> float:
+    """
+    Backoff before retry number `attempt + 1`: exponential growth capped at `max_ms`, with
+    "full jitter" (uniform between 0 and that bound) so concurrent clients spread out
+    rather than retrying in lockstep.
+    """
+    bound = min(max_ms, initial_ms * multiplier ** attempt)
+    return random.uniform(0, bound) if jitter else bound
+
+def _convert_lazily(convert: Callable[[Any], Any], messages: Iterable[Any], action: str) -> Iterator[Any]:
+    """
+    Yields `convert(message)` for each message. Conversion runs after the calling method
+    has returned, outside its `try`, so failures are wrapped here instead.
+    """
+    for message in messages:
+        try:
+            yield convert(message)
+        except Exception as e:
+            raise VortexException(f"An unexpected error occurred while converting the result of {action}: {e}") from e
+
 class VortexClient:
     """
     The main synchronous client for interacting with a Vortex server.
+    A client can be shared between threads: gRPC channels are thread-safe.
     """
     def __init__(
         self,
@@ -45,6 +101,9 @@ class VortexClient:
         backoff_multiplier: float = 1.5,
         retry_jitter: bool = True,
         retryable_status_codes: Optional[List[grpc.StatusCode]] = None,
+        pool_size: int = 1,
+        shared_channels: bool = False,
+        compression: Optional[grpc.Compression] = None,
     ):
         self.host = host
         self.port = port
@@ -55,6 +114,14 @@ class VortexClient:
         self.private_key = private_key
         self.certificate_chain = certificate_chain
         self.grpc_options = grpc_options
+        if pool_size < 1:
+            raise VortexClientConfigurationError(f"pool_size must be at least 1, got {pool_size}")
+        # Number of channels (HTTP/2 connections) RPCs are spread over, round-robin
+        self.pool_size = pool_size
+        # Per-call compression, e.g. grpc.Compression.Gzip; pays off for string-heavy payloads
+        self.compression = compression
+        # Reuse channels from the process-wide ChannelCache across clients with the same config
+        self.shared_channels = shared_channels
 
         # Retry configuration
         self.retries_enabled = retries_enabled
@@ -63,24 +130,45 @@ class VortexClient:
         self.max_backoff_ms = max_backoff_ms
         self.backoff_multiplier = backoff_multiplier
         self.retry_jitter = retry_jitter
-        self.retryable_status_codes = retryable_status_codes or [
-            grpc.StatusCode.UNAVAILABLE,
-            grpc.StatusCode.RESOURCE_EXHAUSTED,
-        ]
+        self.retryable_status_codes = retryable_status_codes or _DEFAULT_RETRYABLE_STATUS_CODES
         
+        # _channel and the two stubs below belong to the first channel of the pool.
         self._channel: Optional[grpc.Channel] = None
         self._collections_stub: Optional[collections_service_pb2_grpc.CollectionsServiceStub] = None
         self._points_stub: Optional[points_service_pb2_grpc.PointsServiceStub] = None
+        self._channels: List[grpc.Channel] = []
+        self._stubs: List[Tuple[collections_service_pb2_grpc.CollectionsServiceStub, points_service_pb2_grpc.PointsServiceStub]] = []
+        # Rotates over _stubs when the pool has more than one channel; next() on a cycle is
+        # a single C call, so threads sharing the client need no lock.
+        self._stub_cycle: Optional[Iterator[Tuple[Any, Any]]] = None
+        self._channel_keys: List[Tuple[Any, ...]] = [] # ChannelCache keys held when shared_channels is set
 
         self._connect()
 
+    @property
+    def retryable_status_codes(self) -> FrozenSet[grpc.StatusCode]:
+        return self._retryable_status_codes
+
+    @retryable_status_codes.setter
+    def retryable_status_codes(self, codes: Iterable[grpc.StatusCode]) -> None:
+        # Kept as a frozenset, since every failed attempt checks membership
+        self._retryable_status_codes = frozenset(codes)
+
+    def _channel_cache_key(self, target: str, options: Optional[List[Tuple[str, Any]]], index: int) -> Tuple[Any, ...]:
+        # Credentials are fingerprinted so the process-wide cache does not hold key material.
+        creds_fingerprint = hashlib.sha256(
+            b"\0".join(part or b"" for part in (self.root_certs, self.private_key, self.certificate_chain))
+        ).hexdigest() if self.secure else None
+        return (target, self.secure, tuple(options or ()), creds_fingerprint, index)
+
     def _connect(self) -> None:
-        """Establishes the gRPC connection."""
-        if self._channel:
-            self._channel.close()
+        """Establishes the pool of gRPC connections."""
+        self._close_channels()
 
         target = f"{self.host}:{self.port}"
+        options = _channel_options(self.grpc_options, self.pool_size)
         try:
+            credentials = None
             if self.secure:
                 if self.root_certs is None and (self.private_key is not None or self.certificate_chain is not None):
                     pass 
@@ -90,25 +178,66 @@ class VortexClient:
                     private_key=self.private_key,
                     certificate_chain=self.certificate_chain
                 )
-                self._channel = grpc.secure_channel(target, credentials, options=self.grpc_options)
-            else:
-                self._channel = grpc.insecure_channel(target, options=self.grpc_options)
-            
-            self._collections_stub = collections_service_pb2_grpc.CollectionsServiceStub(self._channel)
-            self._points_stub = points_service_pb2_grpc.PointsServiceStub(self._channel)
+            def new_channel() -> grpc.Channel:
+                if credentials is not None:
+                    return grpc.secure_channel(target, credentials, options=options)
+                return grpc.insecure_channel(target, options=options)
+
+            for index in range(self.pool_size):
+                if self.shared_channels:
+                    key = self._channel_cache_key(target, options, index)
+                    channel = ChannelCache.instance().acquire(key, new_channel)
+                    self._channel_keys.append(key)
+                else:
+                    channel = new_channel()
+                self._channels.append(channel)
+                self._stubs.append((
+                    collections_service_pb2_grpc.CollectionsServiceStub(channel),
+                    points_service_pb2_grpc.PointsServiceStub(channel),
+                ))
+
+            self._channel = self._channels[0]
+            self._collections_stub, self._points_stub = self._stubs[0]
+            if len(self._stubs) > 1:
+                self._stub_cycle = itertools.cycle(self._stubs)
             
         except grpc.RpcError as e:
-            raise VortexConnectionError(f"Failed to connect to Vortex at {target}: {e}")
+            # Release what was already opened or acquired: a failed constructor leaves the
+            # caller nothing to close(), and shared channels would otherwise stay pinned.
+            self._close_channels()
+            raise VortexConnectionError(f"Failed to connect to Vortex at {target}: {e}") from e
         except Exception as e: 
-            raise VortexConnectionError(f"An unexpected error occurred while connecting to {target}: {e}")
+            self._close_channels()
+            raise VortexConnectionError(f"An unexpected error occurred while connecting to {target}: {e}") from e
 
     def close(self) -> None:
-        """Closes the gRPC connection."""
-        if self._channel:
-            self._channel.close()
-            self._channel = None
-            self._collections_stub = None
-            self._points_stub = None
+        """Closes the gRPC connections."""
+        self._close_channels()
+
+    def _close_channels(self) -> None:
+        if self._channel_keys:
+            # Shared channels are only closed by the cache once no client holds them.
+            cache = ChannelCache.instance()
+            for key in self._channel_keys:
+                cache.release(key)
+            self._channel_keys = []
+        else:
+            channels = self._channels or ([self._channel] if self._channel else [])
+            for channel in channels:
+                channel.close()
+        self._channels = []
+        self._stubs = []
+        self._stub_cycle = None
+        self._channel = None
+        self._collections_stub = None
+        self._points_stub = None
+
+    def _next_stubs(self) -> Tuple[Any, Any]:
+        """Returns the (collections, points) stubs of the next channel in the pool."""
+        stub_cycle = self._stub_cycle
+        if stub_cycle is None:
+            return self._collections_stub, self._points_stub
+        return next(stub_cycle)
 
     def __enter__(self):
         return self
@@ -121,44 +250,39 @@ class VortexClient:
         """
         Executes a gRPC call with retry logic for specific error codes.
         """
-        if not self.retries_enabled:
-            try:
-                return grpc_call(*args, **kwargs)
-            except grpc.RpcError as e:
-                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e)
-            except VortexApiError: # Changed from VortexApiException
-                raise
-            except Exception as e: 
-                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}")
-
-        last_exception = None
-        current_backoff_ms = self.initial_backoff_ms
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+        # With retries disabled the loop below makes exactly one attempt
+        last_attempt = self.max_retries if self.retries_enabled else 0
+        # A timeout bounds the whole call, retries and backoff included, not each attempt
+        timeout = kwargs.get("timeout")
+        deadline = time.monotonic() + timeout if timeout is not None else None
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(last_attempt + 1):
             try:
                 return grpc_call(*args, **kwargs)
             except grpc.RpcError as e:
-                last_exception = e
-                if hasattr(e, 'code') and callable(e.code) and e.code() in self.retryable_status_codes:
-                    if attempt < self.max_retries:
-                        sleep_duration_ms = current_backoff_ms
-                        if self.retry_jitter:
-                            sleep_duration_ms *= (1 + random.uniform(-0.1, 0.1))
-                        
-                        time.sleep(sleep_duration_ms / 1000.0)
-                        
-                        current_backoff_ms = min(self.max_backoff_ms, current_backoff_ms * self.backoff_multiplier)
-                        continue 
-                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e) 
-            except VortexApiError: # Changed from VortexApiException
+                # A bare RpcError (e.g. raised by an interceptor) has no status code
+                code = e.code() if hasattr(e, "code") else None
+                if code in self.retryable_status_codes and attempt < last_attempt:
+                    sleep_s = _retry_backoff_ms(
+                        attempt, self.initial_backoff_ms, self.backoff_multiplier,
+                        self.max_backoff_ms, self.retry_jitter,
+                    ) / 1000.0
+                    remaining = deadline - time.monotonic() - sleep_s if deadline is not None else None
+                    if remaining is None or remaining > 0:
+                        time.sleep(sleep_s)
+                        if remaining is not None:
+                            kwargs["timeout"] = remaining
+                        continue
+                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e) from e
+            except VortexException:
                 raise
-            except Exception as e: 
-                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}")
-        
-        if last_exception:
-            raise VortexApiError(f"Failed to {operation_name} after {self.max_retries} retries", grpc_error=last_exception)
-        
-        raise VortexException(f"Failed to {operation_name} after all retries, but no gRPC exception was captured.")
+            except Exception as e:
+                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}") from e
+
+        # Only reached when max_retries is negative, so no attempt was made
+        raise VortexException(f"Failed to {operation_name}: no attempt was made (max_retries={self.max_retries})")
 
 
     # --- Collection Methods ---
@@ -186,18 +310,15 @@ class VortexClient:
             request = collections_service_pb2.CreateCollectionRequest(**request_args)
             
             self._execute_with_retry(
-                self._collections_stub.CreateCollection,
+                self._next_stubs()[0].CreateCollection,
                 f"create collection '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-        except VortexClientConfigurationError: 
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)): 
-                 raise VortexException(f"An unexpected pre-call error occurred while creating collection '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while creating collection '{collection_name}': {e}") from e
 
     def get_collection_info(self, collection_name: str) -> models.CollectionInfo:
         if not self._collections_stub:
@@ -206,40 +327,43 @@ class VortexClient:
         try:
             request = collections_service_pb2.GetCollectionInfoRequest(collection_name=collection_name)
             response = self._execute_with_retry(
-                self._collections_stub.GetCollectionInfo,
+                self._next_stubs()[0].GetCollectionInfo,
                 f"get collection info for '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
             return conversions.grpc_to_pydantic_collection_info(response)
-        except VortexClientConfigurationError: 
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while getting collection info for '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while getting collection info for '{collection_name}': {e}") from e
 
     def list_collections(self) -> List[models.CollectionDescription]:
+        return list(self.iter_collections())
+
+    def iter_collections(self) -> Iterator[models.CollectionDescription]:
+        """
+        Lists collections, converting each description only as the iterator reaches it.
+        The RPC itself runs (and raises) when this is called.
+        """
         if not self._collections_stub:
             raise VortexConnectionError("Client not connected.")
 
         try:
             request = collections_service_pb2.ListCollectionsRequest()
             response = self._execute_with_retry(
-                self._collections_stub.ListCollections,
+                self._next_stubs()[0].ListCollections,
                 "list collections",
                 request,
                 timeout=self.timeout
             )
-            return [conversions.grpc_to_pydantic_collection_description(desc) for desc in response.collections]
-        except VortexClientConfigurationError: 
+            return _convert_lazily(
+                conversions.grpc_to_pydantic_collection_description, response.collections, "listing collections"
+            )
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while listing collections: {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while listing collections: {e}") from e
 
     def delete_collection(self, collection_name: str) -> None:
         if not self._collections_stub:
@@ -248,42 +372,31 @@ class VortexClient:
         try:
             request = collections_service_pb2.DeleteCollectionRequest(collection_name=collection_name)
             self._execute_with_retry(
-                self._collections_stub.DeleteCollection,
+                self._next_stubs()[0].DeleteCollection,
                 f"delete collection '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-        except VortexClientConfigurationError: 
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while deleting collection '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while deleting collection '{collection_name}': {e}") from e
 
     # --- Point Methods ---
     def upsert_points(
         self,
         collection_name: str,
-        points: List[models.PointStruct],
+        points: Union[List[models.PointStruct], models.PointBatch],
         wait_flush: Optional[bool] = None,
     ) -> List[models.PointOperationStatus]:
         if not self._points_stub:
             raise VortexConnectionError("Client not connected.")
 
         try:
-            grpc_points = [conversions.pydantic_to_grpc_point_struct(p) for p in points]
-            request_args = {
-                "collection_name": collection_name,
-                "points": grpc_points,
-            }
-            if wait_flush is not None:
-                request_args["wait_flush"] = wait_flush
-            
-            request = points_service_pb2.UpsertPointsRequest(**request_args)
+            request = conversions.pydantic_to_grpc_upsert_request(collection_name, points, wait_flush)
             
             response = self._execute_with_retry(
-                self._points_stub.UpsertPoints,
+                self._next_stubs()[1].UpsertPoints,
                 f"upsert points in '{collection_name}'",
                 request,
                 timeout=self.timeout
@@ -293,15 +406,10 @@ class VortexClient:
                  raise VortexApiError(f"Overall error during upsert: {response.overall_error}", status_code=common_pb2.StatusCode.ERROR)
 
             return [conversions.grpc_to_pydantic_point_operation_status(s) for s in response.statuses]
-        except VortexClientConfigurationError: 
-            raise
-        except VortexApiError: 
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while upserting points in '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while upserting points in '{collection_name}': {e}") from e
 
     def get_points(
         self,
@@ -310,6 +418,20 @@ class VortexClient:
         with_payload: Optional[bool] = True, 
         with_vector: Optional[bool] = False, 
     ) -> List[models.PointStruct]:
+        return list(self.iter_points(collection_name, ids, with_payload, with_vector))
+
+    def iter_points(
+        self,
+        collection_name: str,
+        ids: List[str],
+        with_payload: Optional[bool] = True, 
+        with_vector: Optional[bool] = False, 
+    ) -> Iterator[models.PointStruct]:
+        """
+        Fetches points, converting each one only as the iterator reaches it, so callers that
+        process points one at a time never hold the whole list of models at once. The RPC
+        itself runs (and raises) when this is called.
+        """
         if not self._points_stub:
             raise VortexConnectionError("Client not connected.")
 
@@ -325,19 +447,18 @@ class VortexClient:
 
             request = points_service_pb2.GetPointsRequest(**request_args)
             response = self._execute_with_retry(
-                self._points_stub.GetPoints,
+                self._next_stubs()[1].GetPoints,
                 f"get points from '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-            return [conversions.grpc_to_pydantic_point_struct(p) for p in response.points]
-        except VortexClientConfigurationError: 
+            return _convert_lazily(
+                conversions.grpc_to_pydantic_point_struct, response.points, f"getting points from '{collection_name}'"
+            )
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while getting points from '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while getting points from '{collection_name}': {e}") from e
 
     def delete_points(
         self,
@@ -358,7 +479,7 @@ class VortexClient:
             
             request = points_service_pb2.DeletePointsRequest(**request_args)
             response = self._execute_with_retry(
-                self._points_stub.DeletePoints,
+                self._next_stubs()[1].DeletePoints,
                 f"delete points from '{collection_name}'",
                 request,
                 timeout=self.timeout
@@ -368,15 +489,10 @@ class VortexClient:
                  raise VortexApiError(f"Overall error during delete: {response.overall_error}", status_code=common_pb2.StatusCode.ERROR)
 
             return [conversions.grpc_to_pydantic_point_operation_status(s) for s in response.statuses]
-        except VortexClientConfigurationError: 
+        except VortexException:
             raise
-        except VortexApiError: 
-            raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while deleting points from '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while deleting points from '{collection_name}': {e}") from e
 
     def search_points(
         self,
@@ -392,43 +508,36 @@ class VortexClient:
             raise VortexConnectionError("Client not connected.")
 
         try:
-            grpc_query_vector = conversions.pydantic_to_grpc_vector(query_vector)
-            
-            request_args: Dict[str, Any] = {
-                "collection_name": collection_name,
-                "query_vector": grpc_query_vector,
-                "k_limit": k_limit,
-            }
-            if filter:
-                grpc_filter = conversions.pydantic_to_grpc_filter(filter)
-                if grpc_filter: 
-                    request_args["filter"] = grpc_filter
-            
-            if with_payload is not None:
-                request_args["with_payload"] = with_payload
-            if with_vector is not None:
-                request_args["with_vector"] = with_vector
-            
-            if search_params:
-                grpc_search_params = conversions.pydantic_to_grpc_search_params(search_params)
-                if grpc_search_params: 
-                    request_args["params"] = grpc_search_params
-
-            request = points_service_pb2.SearchPointsRequest(**request_args)
+            request = conversions.pydantic_to_grpc_search_request(
+                collection_name, query_vector, k_limit, filter, with_payload, with_vector, search_params
+            )
             response = self._execute_with_retry(
-                self._points_stub.SearchPoints,
+                self._next_stubs()[1].SearchPoints,
                 f"search points in '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
             return [conversions.grpc_to_pydantic_scored_point(r) for r in response.results]
-        except VortexClientConfigurationError: 
+        except VortexException:
             raise
-        except Exception as e: 
-            if not isinstance(e, (VortexApiError, VortexException)):
-                 raise VortexException(f"An unexpected pre-call error occurred while searching points in '{collection_name}': {e}")
-            else:
-                raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while searching points in '{collection_name}': {e}") from e
+
+    def bind_search(
+        self,
+        collection_name: str,
+        dim: int,
+        filter: Optional[models.Filter] = None,
+        with_payload: Optional[bool] = True,
+        with_vector: Optional[bool] = False,
+        search_params: Optional[models.SearchParams] = None,
+    ) -> "BoundSearch":
+        """
+        Returns a callable that searches `collection_name` with these options fixed. The
+        static part of the request is serialized once here, and each call takes the query
+        as plain floats (a list or array), skipping the Vector model and its validation.
+        """
+        return BoundSearch(self, collection_name, dim, filter, with_payload, with_vector, search_params)
 
 class AsyncVortexClient:
     """
@@ -452,6 +561,8 @@ class AsyncVortexClient:
         backoff_multiplier: float = 1.5,
         retry_jitter: bool = True,
         retryable_status_codes: Optional[List[grpc.StatusCode]] = None,
+        pool_size: int = 1,
+        compression: Optional[grpc.Compression] = None,
     ):
         self.host = host
         self.port = port
@@ -462,6 +573,12 @@ class AsyncVortexClient:
         self.private_key = private_key
         self.certificate_chain = certificate_chain
         self.grpc_options = grpc_options
+        if pool_size < 1:
+            raise VortexClientConfigurationError(f"pool_size must be at least 1, got {pool_size}")
+        # Number of channels (HTTP/2 connections) RPCs are spread over, round-robin
+        self.pool_size = pool_size
+        # Per-call compression, e.g. grpc.Compression.Gzip; pays off for string-heavy payloads
+        self.compression = compression
 
         self.retries_enabled = retries_enabled
         self.max_retries = max_retries
@@ -469,45 +586,97 @@ class AsyncVortexClient:
         self.max_backoff_ms = max_backoff_ms
         self.backoff_multiplier = backoff_multiplier
         self.retry_jitter = retry_jitter
-        self.retryable_status_codes = retryable_status_codes or [
-            grpc.StatusCode.UNAVAILABLE,
-            grpc.StatusCode.RESOURCE_EXHAUSTED,
-        ]
+        self.retryable_status_codes = retryable_status_codes or _DEFAULT_RETRYABLE_STATUS_CODES
         
+        # _channel and the two stubs below belong to the first channel of the pool.
         self._channel: Optional[grpc.aio.Channel] = None
         self._collections_stub: Optional[collections_service_pb2_grpc.CollectionsServiceStub] = None
         self._points_stub: Optional[points_service_pb2_grpc.PointsServiceStub] = None
+        self._channels: List[grpc.aio.Channel] = []
+        self._stubs: List[Tuple[collections_service_pb2_grpc.CollectionsServiceStub, points_service_pb2_grpc.PointsServiceStub]] = []
+        self._stub_cycle: Optional[Iterator[Tuple[Any, Any]]] = None
+        # Serializes the connect() a method makes on first use, so concurrent first calls share one.
+        # Created in _ensure_connected: before 3.10 an asyncio.Lock binds to the event loop
+        # current at construction, which may not be the loop the client is used on.
+        self._connect_lock: Optional[asyncio.Lock] = None
         
+    @property
+    def retryable_status_codes(self) -> FrozenSet[grpc.StatusCode]:
+        return self._retryable_status_codes
+
+    @retryable_status_codes.setter
+    def retryable_status_codes(self, codes: Iterable[grpc.StatusCode]) -> None:
+        # Kept as a frozenset, since every failed attempt checks membership
+        self._retryable_status_codes = frozenset(codes)
+
+    async def _ensure_connected(self) -> None:
+        """Connects on first use (or after close()); a no-op once the stubs exist."""
+        if self._collections_stub is not None and self._points_stub is not None:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._collections_stub is None or self._points_stub is None:
+                await self.connect()
+        if self._collections_stub is None or self._points_stub is None:
+            raise VortexConnectionError("Client not connected after connect attempt.")
+
     async def connect(self) -> None:
-        if self._channel:
-            await self._channel.close()
+        await self._close_channels()
 
         target = f"{self.host}:{self.port}"
+        options = _channel_options(self.grpc_options, self.pool_size)
         try:
+            credentials = None
             if self.secure:
                 credentials = grpc.ssl_channel_credentials( 
                     root_certificates=self.root_certs,
                     private_key=self.private_key,
                     certificate_chain=self.certificate_chain
                 )
-                self._channel = grpc.aio.secure_channel(target, credentials, options=self.grpc_options)
-            else:
-                self._channel = grpc.aio.insecure_channel(target, options=self.grpc_options)
-            
-            self._collections_stub = collections_service_pb2_grpc.CollectionsServiceStub(self._channel)
-            self._points_stub = points_service_pb2_grpc.PointsServiceStub(self._channel)
+            for _ in range(self.pool_size):
+                if credentials is not None:
+                    channel = grpc.aio.secure_channel(target, credentials, options=options)
+                else:
+                    channel = grpc.aio.insecure_channel(target, options=options)
+                self._channels.append(channel)
+                self._stubs.append((
+                    collections_service_pb2_grpc.CollectionsServiceStub(channel),
+                    points_service_pb2_grpc.PointsServiceStub(channel),
+                ))
+
+            self._channel = self._channels[0]
+            self._collections_stub, self._points_stub = self._stubs[0]
+            if len(self._stubs) > 1:
+                self._stub_cycle = itertools.cycle(self._stubs)
             
         except grpc.aio.AioRpcError as e: 
-            raise VortexConnectionError(f"Failed to connect to Vortex at {target}: {e}")
+            await self._close_channels()
+            raise VortexConnectionError(f"Failed to connect to Vortex at {target}: {e}") from e
         except Exception as e:
-            raise VortexConnectionError(f"An unexpected error occurred while connecting to {target}: {e}")
+            await self._close_channels()
+            raise VortexConnectionError(f"An unexpected error occurred while connecting to {target}: {e}") from e
 
     async def close(self) -> None:
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._collections_stub = None
-            self._points_stub = None
+        await self._close_channels()
+
+    async def _close_channels(self) -> None:
+        channels = self._channels or ([self._channel] if self._channel else [])
+        for channel in channels:
+            await channel.close()
+        self._channels = []
+        self._stubs = []
+        self._stub_cycle = None
+        self._channel = None
+        self._collections_stub = None
+        self._points_stub = None
+
+    def _next_stubs(self) -> Tuple[Any, Any]:
+        """Returns the (collections, points) stubs of the next channel in the pool."""
+        stub_cycle = self._stub_cycle
+        if stub_cycle is None:
+            return self._collections_stub, self._points_stub
+        return next(stub_cycle)
 
     async def __aenter__(self):
         await self.connect()
@@ -521,44 +690,38 @@ class AsyncVortexClient:
         """
         Executes an asynchronous gRPC call with retry logic.
         """
-        if not self.retries_enabled:
-            try:
-                return await async_grpc_call(*args, **kwargs)
-            except grpc.aio.AioRpcError as e:
-                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e)
-            except VortexApiError: # Changed from VortexApiException
-                raise
-            except Exception as e:
-                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}")
-
-        last_exception = None
-        current_backoff_ms = self.initial_backoff_ms
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+        # With retries disabled the loop below makes exactly one attempt
+        last_attempt = self.max_retries if self.retries_enabled else 0
+        # A timeout bounds the whole call, retries and backoff included, not each attempt
+        loop = asyncio.get_running_loop()
+        timeout = kwargs.get("timeout")
+        deadline = loop.time() + timeout if timeout is not None else None
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(last_attempt + 1):
             try:
                 return await async_grpc_call(*args, **kwargs)
-            except grpc.aio.AioRpcError as e: 
-                last_exception = e
-                if hasattr(e, 'code') and callable(e.code) and e.code() in self.retryable_status_codes:
-                    if attempt < self.max_retries:
-                        sleep_duration_ms = current_backoff_ms
-                        if self.retry_jitter:
-                            sleep_duration_ms *= (1 + random.uniform(-0.1, 0.1))
-                        
-                        await asyncio.sleep(sleep_duration_ms / 1000.0) 
-                        
-                        current_backoff_ms = min(self.max_backoff_ms, current_backoff_ms * self.backoff_multiplier)
+            except grpc.aio.AioRpcError as e:
+                if e.code() in self.retryable_status_codes and attempt < last_attempt:
+                    sleep_s = _retry_backoff_ms(
+                        attempt, self.initial_backoff_ms, self.backoff_multiplier,
+                        self.max_backoff_ms, self.retry_jitter,
+                    ) / 1000.0
+                    remaining = deadline - loop.time() - sleep_s if deadline is not None else None
+                    if remaining is None or remaining > 0:
+                        await asyncio.sleep(sleep_s)
+                        if remaining is not None:
+                            kwargs["timeout"] = remaining
                         continue
-                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e) 
-            except VortexApiError: # Changed from VortexApiException
+                raise VortexApiError(f"Failed to {operation_name}", grpc_error=e) from e
+            except VortexException:
                 raise
             except Exception as e:
-                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}")
-        
-        if last_exception:
-            raise VortexApiError(f"Failed to {operation_name} after {self.max_retries} retries", grpc_error=last_exception)
-        
-        raise VortexException(f"Failed to {operation_name} after all retries, but no gRPC exception was captured (async).")
+                raise VortexException(f"An unexpected error occurred during {operation_name}: {e}") from e
+
+        # Only reached when max_retries is negative, so no attempt was made
+        raise VortexException(f"Failed to {operation_name}: no attempt was made (max_retries={self.max_retries})")
 
     # --- Async Collection Methods ---
     async def create_collection(
@@ -568,10 +731,7 @@ class AsyncVortexClient:
         distance_metric: models.DistanceMetric,
         hnsw_config: Optional[models.HnswConfigParams] = None,
     ) -> None:
-        if not self._collections_stub:
-            await self.connect() 
-            if not self._collections_stub: 
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
 
         try:
             grpc_distance_metric = conversions.pydantic_to_grpc_distance_metric(distance_metric)
@@ -585,106 +745,83 @@ class AsyncVortexClient:
             request = collections_service_pb2.CreateCollectionRequest(**request_args)
             
             await self._execute_with_retry_async(
-                self._collections_stub.CreateCollection,
+                self._next_stubs()[0].CreateCollection,
                 f"create collection '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-        except VortexClientConfigurationError:
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while creating collection '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while creating collection '{collection_name}': {e}") from e
 
     async def get_collection_info(self, collection_name: str) -> models.CollectionInfo:
-        if not self._collections_stub:
-            await self.connect()
-            if not self._collections_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
         try:
             request = collections_service_pb2.GetCollectionInfoRequest(collection_name=collection_name)
             response = await self._execute_with_retry_async(
-                self._collections_stub.GetCollectionInfo,
+                self._next_stubs()[0].GetCollectionInfo,
                 f"get collection info for '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
             return conversions.grpc_to_pydantic_collection_info(response)
-        except VortexClientConfigurationError:
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while getting collection info for '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while getting collection info for '{collection_name}': {e}") from e
 
     async def list_collections(self) -> List[models.CollectionDescription]:
-        if not self._collections_stub:
-            await self.connect()
-            if not self._collections_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        return list(await self.iter_collections())
+
+    async def iter_collections(self) -> Iterator[models.CollectionDescription]:
+        """
+        Lists collections, converting each description only as the returned iterator reaches it.
+        """
+        await self._ensure_connected()
         try:
             request = collections_service_pb2.ListCollectionsRequest()
             response = await self._execute_with_retry_async(
-                self._collections_stub.ListCollections,
+                self._next_stubs()[0].ListCollections,
                 "list collections",
                 request,
                 timeout=self.timeout
             )
-            return [conversions.grpc_to_pydantic_collection_description(desc) for desc in response.collections]
-        except VortexClientConfigurationError:
+            return _convert_lazily(
+                conversions.grpc_to_pydantic_collection_description, response.collections, "listing collections"
+            )
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while listing collections: {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while listing collections: {e}") from e
 
     async def delete_collection(self, collection_name: str) -> None:
-        if not self._collections_stub:
-            await self.connect()
-            if not self._collections_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
         try:
             request = collections_service_pb2.DeleteCollectionRequest(collection_name=collection_name)
             await self._execute_with_retry_async(
-                self._collections_stub.DeleteCollection,
+                self._next_stubs()[0].DeleteCollection,
                 f"delete collection '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-        except VortexClientConfigurationError:
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while deleting collection '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while deleting collection '{collection_name}': {e}") from e
 
     # --- Async Point Methods ---
     async def upsert_points(
         self,
         collection_name: str,
-        points: List[models.PointStruct],
+        points: Union[List[models.PointStruct], models.PointBatch],
         wait_flush: Optional[bool] = None,
     ) -> List[models.PointOperationStatus]:
-        if not self._points_stub:
-            await self.connect()
-            if not self._points_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
         try:
-            grpc_points = [conversions.pydantic_to_grpc_point_struct(p) for p in points]
-            request_args = {
-                "collection_name": collection_name,
-                "points": grpc_points,
-            }
-            if wait_flush is not None:
-                request_args["wait_flush"] = wait_flush
-            request = points_service_pb2.UpsertPointsRequest(**request_args)
+            request = conversions.pydantic_to_grpc_upsert_request(collection_name, points, wait_flush)
             response = await self._execute_with_retry_async(
-                self._points_stub.UpsertPoints,
+                self._next_stubs()[1].UpsertPoints,
                 f"upsert points in '{collection_name}'",
                 request,
                 timeout=self.timeout
@@ -692,15 +829,44 @@ class AsyncVortexClient:
             if response.overall_error:
                  raise VortexApiError(f"Overall error during upsert: {response.overall_error}", status_code=common_pb2.StatusCode.ERROR)
             return [conversions.grpc_to_pydantic_point_operation_status(s) for s in response.statuses]
-        except VortexClientConfigurationError:
-            raise
-        except VortexApiError: 
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while upserting points in '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while upserting points in '{collection_name}': {e}") from e
+
+    async def upsert_points_many(
+        self,
+        collection_name: str,
+        batches: Iterable[Union[List[models.PointStruct], models.PointBatch]],
+        max_in_flight: int = 32,
+        wait_flush: Optional[bool] = None,
+    ) -> List[List[models.PointOperationStatus]]:
+        """
+        Upserts each batch as its own UpsertPoints RPC, with up to `max_in_flight` of them
+        outstanding at once, and returns the statuses per batch in input order. Overlapping
+        many small requests keeps memory and server latency lower than one huge request;
+        combine with `pool_size` to spread them over several connections. The first failed
+        batch raises after cancelling the batches still queued or in flight; batches that
+        already completed are not rolled back.
+        """
+        if max_in_flight < 1:
+            raise VortexClientConfigurationError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        await self._ensure_connected()
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def upsert_batch(batch: Union[List[models.PointStruct], models.PointBatch]) -> List[models.PointOperationStatus]:
+            async with semaphore:
+                return await self.upsert_points(collection_name, batch, wait_flush)
+
+        tasks = [asyncio.ensure_future(upsert_batch(batch)) for batch in batches]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # gather() leaves the other batches running; stop them before raising
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def get_points(
         self,
@@ -709,10 +875,19 @@ class AsyncVortexClient:
         with_payload: Optional[bool] = True,
         with_vector: Optional[bool] = False,
     ) -> List[models.PointStruct]:
-        if not self._points_stub:
-            await self.connect()
-            if not self._points_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        return list(await self.iter_points(collection_name, ids, with_payload, with_vector))
+
+    async def iter_points(
+        self,
+        collection_name: str,
+        ids: List[str],
+        with_payload: Optional[bool] = True,
+        with_vector: Optional[bool] = False,
+    ) -> Iterator[models.PointStruct]:
+        """
+        Fetches points, converting each one only as the returned iterator reaches it.
+        """
+        await self._ensure_connected()
         try:
             request_args = {
                 "collection_name": collection_name,
@@ -724,19 +899,18 @@ class AsyncVortexClient:
                 request_args["with_vector"] = with_vector
             request = points_service_pb2.GetPointsRequest(**request_args)
             response = await self._execute_with_retry_async(
-                self._points_stub.GetPoints,
+                self._next_stubs()[1].GetPoints,
                 f"get points from '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
-            return [conversions.grpc_to_pydantic_point_struct(p) for p in response.points]
-        except VortexClientConfigurationError:
+            return _convert_lazily(
+                conversions.grpc_to_pydantic_point_struct, response.points, f"getting points from '{collection_name}'"
+            )
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while getting points from '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while getting points from '{collection_name}': {e}") from e
 
     async def delete_points(
         self,
@@ -744,10 +918,7 @@ class AsyncVortexClient:
         ids: List[str],
         wait_flush: Optional[bool] = None,
     ) -> List[models.PointOperationStatus]:
-        if not self._points_stub:
-            await self.connect()
-            if not self._points_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
         try:
             request_args = {
                 "collection_name": collection_name,
@@ -757,7 +928,7 @@ class AsyncVortexClient:
                 request_args["wait_flush"] = wait_flush
             request = points_service_pb2.DeletePointsRequest(**request_args)
             response = await self._execute_with_retry_async(
-                self._points_stub.DeletePoints,
+                self._next_stubs()[1].DeletePoints,
                 f"delete points from '{collection_name}'",
                 request,
                 timeout=self.timeout
@@ -765,15 +936,10 @@ class AsyncVortexClient:
             if response.overall_error:
                  raise VortexApiError(f"Overall error during delete: {response.overall_error}", status_code=common_pb2.StatusCode.ERROR)
             return [conversions.grpc_to_pydantic_point_operation_status(s) for s in response.statuses]
-        except VortexClientConfigurationError:
-            raise
-        except VortexApiError: 
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while deleting points from '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while deleting points from '{collection_name}': {e}") from e
 
     async def search_points(
         self,
@@ -785,43 +951,117 @@ class AsyncVortexClient:
         with_vector: Optional[bool] = False,
         search_params: Optional[models.SearchParams] = None,
     ) -> List[models.ScoredPoint]:
-        if not self._points_stub:
-            await self.connect()
-            if not self._points_stub:
-                 raise VortexConnectionError("Client not connected after connect attempt.")
+        await self._ensure_connected()
         try:
-            grpc_query_vector = conversions.pydantic_to_grpc_vector(query_vector)
-            request_args: Dict[str, Any] = {
-                "collection_name": collection_name,
-                "query_vector": grpc_query_vector,
-                "k_limit": k_limit,
-            }
-            if filter:
-                grpc_filter = conversions.pydantic_to_grpc_filter(filter)
-                if grpc_filter:
-                    request_args["filter"] = grpc_filter
-            if with_payload is not None:
-                request_args["with_payload"] = with_payload
-            if with_vector is not None:
-                request_args["with_vector"] = with_vector
-            
-            if search_params:
-                grpc_search_params = conversions.pydantic_to_grpc_search_params(search_params)
-                if grpc_search_params:
-                    request_args["params"] = grpc_search_params
-            
-            request = points_service_pb2.SearchPointsRequest(**request_args)
+            request = conversions.pydantic_to_grpc_search_request(
+                collection_name, query_vector, k_limit, filter, with_payload, with_vector, search_params
+            )
             response = await self._execute_with_retry_async(
-                self._points_stub.SearchPoints,
+                self._next_stubs()[1].SearchPoints,
                 f"search points in '{collection_name}'",
                 request,
                 timeout=self.timeout
             )
             return [conversions.grpc_to_pydantic_scored_point(r) for r in response.results]
-        except VortexClientConfigurationError:
+        except VortexException:
             raise
         except Exception as e:
-            if not isinstance(e, (VortexApiError, VortexException)):
-                raise VortexException(f"An unexpected pre-call error occurred while searching points in '{collection_name}': {e}")
-            else:
-                raise
+            raise VortexException(f"An unexpected pre-call error occurred while searching points in '{collection_name}': {e}") from e
+
+    def bind_search(
+        self,
+        collection_name: str,
+        dim: int,
+        filter: Optional[models.Filter] = None,
+        with_payload: Optional[bool] = True,
+        with_vector: Optional[bool] = False,
+        search_params: Optional[models.SearchParams] = None,
+    ) -> "AsyncBoundSearch":
+        """
+        Returns a callable that searches `collection_name` with these options fixed. The
+        static part of the request is serialized once here, and each call takes the query
+        as plain floats (a list or array), skipping the Vector model and its validation.
+        """
+        return AsyncBoundSearch(self, collection_name, dim, filter, with_payload, with_vector, search_params)
+
+
+class BoundSearch:
+    """A search with a fixed collection and options; see VortexClient.bind_search."""
+    def __init__(
+        self,
+        client: VortexClient,
+        collection_name: str,
+        dim: int,
+        filter: Optional[models.Filter],
+        with_payload: Optional[bool],
+        with_vector: Optional[bool],
+        search_params: Optional[models.SearchParams],
+    ):
+        self._client = client
+        self.collection_name = collection_name
+        self.dim = dim
+        self._prefix = conversions.pydantic_to_grpc_search_request_prefix(
+            collection_name, filter, with_payload, with_vector, search_params
+        )
+        self._operation_name = f"search points in '{collection_name}'"
+
+    def __call__(self, query_vector: Sequence[float], k_limit: int) -> List[models.ScoredPoint]:
+        client = self._client
+        if not client._points_stub:
+            raise VortexConnectionError("Client not connected.")
+        if len(query_vector) != self.dim:
+            raise VortexException(f"Query vector has {len(query_vector)} dimensions, expected {self.dim}")
+
+        try:
+            request = conversions.grpc_search_request_from_prefix(self._prefix, query_vector, k_limit)
+            response = client._execute_with_retry(
+                client._next_stubs()[1].SearchPoints,
+                self._operation_name,
+                request,
+                timeout=client.timeout
+            )
+            return [conversions.grpc_to_pydantic_scored_point(r) for r in response.results]
+        except VortexException:
+            raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while searching points in '{self.collection_name}': {e}") from e
+
+class AsyncBoundSearch:
+    """A search with a fixed collection and options; see AsyncVortexClient.bind_search."""
+    def __init__(
+        self,
+        client: AsyncVortexClient,
+        collection_name: str,
+        dim: int,
+        filter: Optional[models.Filter],
+        with_payload: Optional[bool],
+        with_vector: Optional[bool],
+        search_params: Optional[models.SearchParams],
+    ):
+        self._client = client
+        self.collection_name = collection_name
+        self.dim = dim
+        self._prefix = conversions.pydantic_to_grpc_search_request_prefix(
+            collection_name, filter, with_payload, with_vector, search_params
+        )
+        self._operation_name = f"search points in '{collection_name}'"
+
+    async def __call__(self, query_vector: Sequence[float], k_limit: int) -> List[models.ScoredPoint]:
+        client = self._client
+        await client._ensure_connected()
+        if len(query_vector) != self.dim:
+            raise VortexException(f"Query vector has {len(query_vector)} dimensions, expected {self.dim}")
+
+        try:
+            request = conversions.grpc_search_request_from_prefix(self._prefix, query_vector, k_limit)
+            response = await client._execute_with_retry_async(
+                client._next_stubs()[1].SearchPoints,
+                self._operation_name,
+                request,
+                timeout=client.timeout
+            )
+            return [conversions.grpc_to_pydantic_scored_point(r) for r in response.results]
+        except VortexException:
+            raise
+        except Exception as e:
+            raise VortexException(f"An unexpected pre-call error occurred while searching points in '{self.collection_name}': {e}") from e
@@ -1,13 +1,15 @@
 """
 Conversion utilities between Pydantic models and gRPC messages.
 """
-from typing import Dict, Any, List, Optional
+import array
+import sys
+from typing import Dict, Any, Iterable, List, MutableSequence, Optional, Sequence, Union
 from google.protobuf import struct_pb2
 
 from vortex_sdk import models
 from vortex_sdk._grpc.vortex.api.v1 import common_pb2
 from vortex_sdk._grpc.vortex.api.v1 import collections_service_pb2
-# from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2 # For future use
+from vortex_sdk._grpc.vortex.api.v1 import points_service_pb2
 
 # --- Enum Mappings ---
 
@@ -43,77 +45,271 @@ _GRPC_TO_PYDANTIC_STATUS_CODE_MAP: Dict[common_pb2.StatusCode.ValueType, models.
 # --- Helper for google.protobuf.Value ---
 
 def _grpc_value_to_pydantic(grpc_val: struct_pb2.Value) -> models.PayloadValue:
-    if grpc_val.HasField("null_value"):
-        return None
-    if grpc_val.HasField("number_value"):
+    # One WhichOneof call instead of a HasField name lookup per candidate field
+    kind = grpc_val.WhichOneof("kind")
+    if kind == "number_value":
         return grpc_val.number_value
-    if grpc_val.HasField("string_value"):
+    if kind == "string_value":
         return grpc_val.string_value
-    if grpc_val.HasField("bool_value"):
+    if kind == "bool_value":
         return grpc_val.bool_value
-    if grpc_val.HasField("struct_value"):
+    if kind == "struct_value":
         return {k: _grpc_value_to_pydantic(v) for k, v in grpc_val.struct_value.fields.items()}
-    if grpc_val.HasField("list_value"):
+    if kind == "list_value":
         return [_grpc_value_to_pydantic(v) for v in grpc_val.list_value.values]
-    return None # Should not happen for a valid Value
-
-def _pydantic_value_to_grpc(pydantic_val: models.PayloadValue) -> struct_pb2.Value:
-    grpc_val = struct_pb2.Value()
-    if pydantic_val is None:
-        grpc_val.null_value = struct_pb2.NULL_VALUE
-    elif isinstance(pydantic_val, bool):
-        grpc_val.bool_value = pydantic_val
-    elif isinstance(pydantic_val, (int, float)):
-        grpc_val.number_value = float(pydantic_val)
-    elif isinstance(pydantic_val, str):
-        grpc_val.string_value = pydantic_val
-    elif isinstance(pydantic_val, list):
-        for item in pydantic_val:
-            grpc_val.list_value.values.add().CopyFrom(_pydantic_value_to_grpc(item))
-    elif isinstance(pydantic_val, dict):
-        for k, v in pydantic_val.items():
-            grpc_val.struct_value.fields[k].CopyFrom(_pydantic_value_to_grpc(v))
-    else:
-        # This case should ideally not be reached if PayloadValue is used correctly
-        grpc_val.string_value = str(pydantic_val)
-    return grpc_val
+    return None # null_value, or an unset Value
+
+# Hoisted so setting a null is a global load rather than a module attribute lookup.
+_NULL_VALUE = struct_pb2.NULL_VALUE
+
+def _set_null(grpc_val: struct_pb2.Value, _: None) -> None:
+    grpc_val.null_value = _NULL_VALUE
+
+def _set_bool(grpc_val: struct_pb2.Value, v: bool) -> None:
+    grpc_val.bool_value = v
+
+def _set_number(grpc_val: struct_pb2.Value, v: float) -> None:
+    grpc_val.number_value = float(v)
+
+def _set_string(grpc_val: struct_pb2.Value, v: str) -> None:
+    grpc_val.string_value = v
+
+def _set_list(grpc_val: struct_pb2.Value, v: List[Any]) -> None:
+    list_value = grpc_val.list_value
+    list_value.SetInParent()  # Keeps empty lists as list_value
+    add = list_value.values.add
+    for item in v:
+        _set_grpc_value(add(), item)
+
+def _set_struct(grpc_val: struct_pb2.Value, v: Dict[str, Any]) -> None:
+    fields = grpc_val.struct_value.fields
+    if not v:
+        grpc_val.struct_value.SetInParent()
+    for k, item in v.items():
+        _set_grpc_value(fields[k], item)
+
+# Keyed by exact type, so bool never falls into the int/float branch.
+_PAYLOAD_VALUE_DISPATCH = {
+    type(None): _set_null,
+    bool: _set_bool,
+    int: _set_number,
+    float: _set_number,
+    str: _set_string,
+    list: _set_list,
+    dict: _set_struct,
+}
+
+def _set_grpc_value(grpc_val: struct_pb2.Value, pydantic_val: Any) -> None:
+    try:
+        setter = _PAYLOAD_VALUE_DISPATCH[type(pydantic_val)]
+    except KeyError:
+        # Subclasses (IntEnum, OrderedDict, ...) still go by isinstance
+        if isinstance(pydantic_val, bool):
+            setter = _set_bool
+        elif isinstance(pydantic_val, (int, float)):
+            setter = _set_number
+        elif isinstance(pydantic_val, str):
+            setter = _set_string
+        elif isinstance(pydantic_val, list):
+            setter = _set_list
+        elif isinstance(pydantic_val, dict):
+            setter = _set_struct
+        else:
+            # This case should ideally not be reached if PayloadValue is used correctly
+            grpc_val.string_value = str(pydantic_val)
+            return
+    setter(grpc_val, pydantic_val)
 
 # --- Conversion Functions ---
+#
+# The grpc_to_pydantic_* converters build models with model_construct(): the field
+# types are already guaranteed by the protobuf message, so pydantic's validation pass
+# is pure overhead on responses. HnswConfigParams is the exception, since its gt=0
+# constraints are not expressed in the proto.
+
+# Vector.elements is a packed `repeated float` (field 1), so its wire form is the tag
+# byte, a varint byte length and the raw little-endian float32 values.
+_VECTOR_ELEMENTS_TAG = b"\x0a"
+_BYTESWAP_FLOATS = sys.byteorder != "little"
+
+def _encode_varint(n: int) -> bytes:
+    out = bytearray()
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+def _packed_vector_bytes(elements: Sequence[float]) -> bytes:
+    # Packing the floats with array and parsing the wire bytes in one go is much
+    # cheaper than having protobuf append the elements one Python float at a time.
+    # len(), not truthiness: a numpy array refuses to be used as a bool
+    if len(elements) == 0:
+        return b""
+    floats = array.array("f", elements)
+    if _BYTESWAP_FLOATS:
+        floats.byteswap()
+    buf = floats.tobytes()
+    return _VECTOR_ELEMENTS_TAG + _encode_varint(len(buf)) + buf
+
+# PointStruct.vector is field 2; merging the Vector as a length-delimited field of the
+# point skips touching the sub-message from Python, and an empty vector still ends up set.
+_POINT_VECTOR_TAG = b"\x12"
+
+def _point_vector_field_bytes(elements: List[float]) -> bytes:
+    vector_bytes = _packed_vector_bytes(elements)
+    return _POINT_VECTOR_TAG + _encode_varint(len(vector_bytes)) + vector_bytes
 
 def pydantic_to_grpc_vector(vector: models.Vector) -> common_pb2.Vector:
-    return common_pb2.Vector(elements=vector.elements)
+    return common_pb2.Vector.FromString(_packed_vector_bytes(vector.elements))
+
+def grpc_to_pydantic_vector_view(vector_pb: common_pb2.Vector) -> memoryview:
+    """
+    Returns the vector's elements as a read-only float32 memoryview over its packed
+    wire bytes, without creating a Python float per element. Wrap it with
+    `numpy.frombuffer(view, dtype=numpy.float32)` for a no-copy array.
+    """
+    data = vector_pb.SerializeToString()
+    if not data:
+        return memoryview(b"").cast("f")
+    # Known fields serialize first, so a non-empty vector starts with the packed elements
+    # field: the tag byte, a varint byte length, then exactly that many bytes of floats.
+    # Anything after them (e.g. unknown fields from a newer server) is not float data.
+    if data[0] == _VECTOR_ELEMENTS_TAG[0]:
+        length = shift = 0
+        pos = 1
+        while pos < len(data):
+            byte = data[pos]
+            pos += 1
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                end = pos + length
+                if end <= len(data) and length % 4 == 0:
+                    if _BYTESWAP_FLOATS:
+                        floats = array.array("f", data[pos:end])
+                        floats.byteswap()
+                        return memoryview(floats.tobytes()).cast("f")
+                    return memoryview(data)[pos:end].cast("f")
+                break
+    # No packed elements up front (e.g. only unknown fields): go through the repeated field
+    return memoryview(array.array("f", vector_pb.elements).tobytes()).cast("f")
 
 def grpc_to_pydantic_vector(vector_pb: common_pb2.Vector) -> models.Vector:
-    return models.Vector(elements=list(vector_pb.elements))
+    return models.Vector.model_construct(elements=grpc_to_pydantic_vector_view(vector_pb).tolist())
+
+def _fill_grpc_value_map(value_map: Any, values: Dict[str, Any]) -> None:
+    # Each Value is written in place in the target map<string, Value>; this beats
+    # Struct.update, whose list/struct handling runs in Python and copies the result.
+    for k, v in values.items():
+        _set_grpc_value(value_map[k], v)
+
+def _fill_grpc_payload(payload_pb: common_pb2.Payload, payload: models.Payload) -> None:
+    _fill_grpc_value_map(payload_pb.fields, payload.fields)
 
 def pydantic_to_grpc_payload(payload: models.Payload) -> common_pb2.Payload:
-    return common_pb2.Payload(
-        fields={k: _pydantic_value_to_grpc(v) for k, v in payload.fields.items()}
-    )
+    payload_pb = common_pb2.Payload()
+    _fill_grpc_payload(payload_pb, payload)
+    return payload_pb
 
 def grpc_to_pydantic_payload(payload_pb: common_pb2.Payload) -> models.Payload:
-    return models.Payload(
-        fields={k: _grpc_value_to_pydantic(v) for k, v in payload_pb.fields.items()}
+    fields_pb = payload_pb.fields
+    if not fields_pb:
+        # A present-but-empty payload stays an (unshared, mutable) empty Payload, not None
+        return models.Payload.model_construct(fields={})
+    return models.Payload.model_construct(
+        fields={k: _grpc_value_to_pydantic(v) for k, v in fields_pb.items()}
     )
 
-def pydantic_to_grpc_point_struct(point: models.PointStruct) -> common_pb2.PointStruct:
-    point_pb = common_pb2.PointStruct(
-        id=point.id,
-        vector=pydantic_to_grpc_vector(point.vector)
-    )
+def _fill_grpc_point_struct(point_pb: common_pb2.PointStruct, point: models.PointStruct) -> None:
+    cached = point._pb_bytes
+    if cached is not None:
+        point_pb.MergeFromString(cached)
+        return
+    point_pb.id = point.id
+    point_pb.MergeFromString(_point_vector_field_bytes(point.vector.elements))
     if point.payload is not None:
-        point_pb.payload.CopyFrom(pydantic_to_grpc_payload(point.payload))
+        point_pb.payload.SetInParent()
+        _fill_grpc_payload(point_pb.payload, point.payload)
+
+def pydantic_to_grpc_point_struct(
+    point: models.PointStruct, cache_serialized: bool = False
+) -> common_pb2.PointStruct:
+    """
+    With `cache_serialized=True` the point's wire bytes are kept on the model, so later
+    conversions of the same point (e.g. re-sending it in another upsert) parse them back
+    instead of re-marshalling the vector and payload. Only use it for points that are not
+    mutated in place afterwards.
+    """
+    point_pb = common_pb2.PointStruct()
+    _fill_grpc_point_struct(point_pb, point)
+    if cache_serialized and point._pb_bytes is None:
+        point._pb_bytes = point_pb.SerializeToString()
     return point_pb
 
+def pydantic_batch_to_grpc_points(
+    points: Iterable[models.PointStruct],
+    out_points: MutableSequence[common_pb2.PointStruct],
+) -> None:
+    """
+    Converts points straight into a repeated PointStruct field (e.g. `request.points`),
+    filling each element added in place rather than building and copying a message per point.
+    """
+    for point in points:
+        _fill_grpc_point_struct(out_points.add(), point)
+
+def pydantic_point_batch_to_grpc_points(
+    batch: models.PointBatch,
+    out_points: MutableSequence[common_pb2.PointStruct],
+) -> None:
+    """
+    Converts a column-oriented PointBatch into a repeated PointStruct field. Payloads are
+    written one column at a time with the value type resolved once per column.
+    """
+    points_pb = [out_points.add() for _ in batch.ids]
+    for point_pb, point_id, elements in zip(points_pb, batch.ids, batch.vectors):
+        point_pb.id = point_id
+        point_pb.MergeFromString(_point_vector_field_bytes(elements))
+    for key, column in batch.payload_columns.items():
+        if not column:
+            continue
+        first = column[0]
+        if isinstance(first, bool):
+            for point_pb, v in zip(points_pb, column):
+                point_pb.payload.fields[key].bool_value = v
+        elif isinstance(first, str):
+            for point_pb, v in zip(points_pb, column):
+                point_pb.payload.fields[key].string_value = v
+        else:
+            for point_pb, v in zip(points_pb, column):
+                point_pb.payload.fields[key].number_value = v
+
+def pydantic_to_grpc_upsert_request(
+    collection_name: str,
+    points: Union[Iterable[models.PointStruct], models.PointBatch],
+    wait_flush: Optional[bool] = None,
+) -> points_service_pb2.UpsertPointsRequest:
+    """
+    Builds an UpsertPointsRequest with every point converted directly into `request.points`,
+    so the batch is a single message serialized once, rather than a list of PointStructs
+    copied into the request.
+    """
+    request = points_service_pb2.UpsertPointsRequest(collection_name=collection_name, wait_flush=wait_flush)
+    if isinstance(points, models.PointBatch):
+        pydantic_point_batch_to_grpc_points(points, request.points)
+    else:
+        pydantic_batch_to_grpc_points(points, request.points)
+    return request
+
 def grpc_to_pydantic_point_struct(point_pb: common_pb2.PointStruct) -> models.PointStruct:
-    return models.PointStruct(
+    return models.PointStruct.model_construct(
         id=point_pb.id,
         vector=grpc_to_pydantic_vector(point_pb.vector),
         payload=grpc_to_pydantic_payload(point_pb.payload) if point_pb.HasField("payload") else None
     )
 
 def grpc_to_pydantic_scored_point(scored_point_pb: common_pb2.ScoredPoint) -> models.ScoredPoint:
-    return models.ScoredPoint(
+    return models.ScoredPoint.model_construct(
         id=scored_point_pb.id,
         vector=grpc_to_pydantic_vector(scored_point_pb.vector) if scored_point_pb.HasField("vector") else None,
         payload=grpc_to_pydantic_payload(scored_point_pb.payload) if scored_point_pb.HasField("payload") else None,
@@ -122,17 +318,16 @@ def grpc_to_pydantic_scored_point(scored_point_pb: common_pb2.ScoredPoint) -> mo
     )
 
 def pydantic_to_grpc_hnsw_config(config: models.HnswConfigParams) -> common_pb2.HnswConfigParams:
-    hnsw_config_pb = common_pb2.HnswConfigParams(
+    # One constructor call; a None seed leaves the optional field unset.
+    return common_pb2.HnswConfigParams(
         m=config.m,
         ef_construction=config.ef_construction,
         ef_search=config.ef_search,
         ml=config.ml,
+        seed=config.seed,
         vector_dim=config.vector_dim,
         m_max0=config.m_max0
     )
-    if config.seed is not None:
-        hnsw_config_pb.seed = config.seed
-    return hnsw_config_pb
 
 def grpc_to_pydantic_hnsw_config(config_pb: common_pb2.HnswConfigParams) -> models.HnswConfigParams:
     return models.HnswConfigParams(
@@ -155,7 +350,7 @@ def grpc_to_pydantic_collection_status(status_pb: collections_service_pb2.Collec
     return _GRPC_TO_PYDANTIC_COLLECTION_STATUS_MAP.get(status_pb, models.CollectionStatus.GREEN) # Default
 
 def grpc_to_pydantic_collection_info(info_pb: collections_service_pb2.GetCollectionInfoResponse) -> models.CollectionInfo:
-    return models.CollectionInfo(
+    return models.CollectionInfo.model_construct(
         collection_name=info_pb.collection_name,
         status=grpc_to_pydantic_collection_status(info_pb.status),
         vector_count=info_pb.vector_count,
@@ -167,7 +362,7 @@ def grpc_to_pydantic_collection_info(info_pb: collections_service_pb2.GetCollect
     )
 
 def grpc_to_pydantic_collection_description(desc_pb: collections_service_pb2.CollectionDescription) -> models.CollectionDescription:
-    return models.CollectionDescription(
+    return models.CollectionDescription.model_construct(
         name=desc_pb.name,
         vector_count=desc_pb.vector_count,
         status=grpc_to_pydantic_collection_status(desc_pb.status),
@@ -176,16 +371,13 @@ def grpc_to_pydantic_collection_description(desc_pb: collections_service_pb2.Col
     )
 
 def pydantic_to_grpc_filter(filter_model: Optional[models.Filter]) -> Optional[common_pb2.Filter]:
-    if filter_model is None or \
-       filter_model.must_match_exact is None or \
-       not filter_model.must_match_exact: # Also return None if the dict is empty
+    # No filter, Filter() and Filter(must_match_exact={}) all mean "no filter": bail out
+    # before any message is built. A None or empty dict are both falsy.
+    if filter_model is None or not filter_model.must_match_exact:
         return None
-    
+
     grpc_filter = common_pb2.Filter()
-    # No need to check if filter_model.must_match_exact is True here,
-    # as the check above ensures it's not None and not empty.
-    for k, v_pydantic in filter_model.must_match_exact.items():
-        grpc_filter.must_match_exact[k].CopyFrom(_pydantic_value_to_grpc(v_pydantic))
+    _fill_grpc_value_map(grpc_filter.must_match_exact, filter_model.must_match_exact)
     return grpc_filter
 
 def grpc_to_pydantic_filter(filter_pb: common_pb2.Filter) -> models.Filter:
@@ -195,35 +387,83 @@ def grpc_to_pydantic_filter(filter_pb: common_pb2.Filter) -> models.Filter:
             k: _grpc_value_to_pydantic(v_grpc)
             for k, v_grpc in filter_pb.must_match_exact.items()
         }
-    return models.Filter(must_match_exact=must_match_exact_pydantic)
+    return models.Filter.model_construct(must_match_exact=must_match_exact_pydantic)
 
 
 def grpc_to_pydantic_status_code(status_code_pb: common_pb2.StatusCode.ValueType) -> models.StatusCode:
     return _GRPC_TO_PYDANTIC_STATUS_CODE_MAP.get(status_code_pb, models.StatusCode.ERROR) # Default
 
 def grpc_to_pydantic_point_operation_status(status_pb: common_pb2.PointOperationStatus) -> models.PointOperationStatus:
-    return models.PointOperationStatus(
+    return models.PointOperationStatus.model_construct(
         point_id=status_pb.point_id,
         status_code=grpc_to_pydantic_status_code(status_pb.status_code),
         error_message=status_pb.error_message if status_pb.HasField("error_message") else None
     )
 
 def pydantic_to_grpc_search_params(params: Optional[models.SearchParams]) -> Optional[common_pb2.SearchParams]:
-    if params is None:
+    # ef_search is the only (optional) field, so SearchParams without it is
+    # equivalent to not sending SearchParams at all.
+    if params is None or params.ef_search is None:
         return None
-    
-    grpc_params = common_pb2.SearchParams()
-    if params.ef_search is not None:
-        grpc_params.ef_search = params.ef_search
-    
-    # Only return the object if it has at least one field set,
-    # otherwise, an empty SearchParams might be sent, which could be
-    # misinterpreted by the server or is simply unnecessary.
-    # The proto defines ef_search as optional uint32.
-    # If no fields are set, it's equivalent to not sending SearchParams.
-    if not grpc_params.HasField("ef_search"): # Check if any optional field was actually set
-        return None
-        
-    return grpc_params
+    return common_pb2.SearchParams(ef_search=params.ef_search)
+
+# SearchPointsRequest.query_vector is field 2, like PointStruct.vector
+_SEARCH_QUERY_VECTOR_TAG = b"\x12"
+
+def pydantic_to_grpc_search_request(
+    collection_name: str,
+    query_vector: models.Vector,
+    k_limit: int,
+    filter_model: Optional[models.Filter] = None,
+    with_payload: Optional[bool] = None,
+    with_vector: Optional[bool] = None,
+    search_params: Optional[models.SearchParams] = None,
+) -> points_service_pb2.SearchPointsRequest:
+    """
+    Builds a SearchPointsRequest with the query vector, filter and search params written
+    straight into the request, instead of building each as its own message and copying it in.
+    Empty filters and search params are left unset, as with the standalone converters.
+    """
+    request = points_service_pb2.SearchPointsRequest(
+        collection_name=collection_name, k_limit=k_limit,
+        with_payload=with_payload, with_vector=with_vector,
+    )
+    vector_bytes = _packed_vector_bytes(query_vector.elements)
+    request.MergeFromString(_SEARCH_QUERY_VECTOR_TAG + _encode_varint(len(vector_bytes)) + vector_bytes)
+    if filter_model is not None and filter_model.must_match_exact:
+        _fill_grpc_value_map(request.filter.must_match_exact, filter_model.must_match_exact)
+    if search_params is not None and search_params.ef_search is not None:
+        request.params.ef_search = search_params.ef_search
+    return request
+
+_SEARCH_K_LIMIT_TAG = b"\x18"
+
+def pydantic_to_grpc_search_request_prefix(
+    collection_name: str,
+    filter_model: Optional[models.Filter] = None,
+    with_payload: Optional[bool] = None,
+    with_vector: Optional[bool] = None,
+    search_params: Optional[models.SearchParams] = None,
+) -> bytes:
+    """
+    Serializes the fields of a SearchPointsRequest that stay the same from query to query.
+    `grpc_search_request_from_prefix` appends the query vector and k_limit to complete it.
+    """
+    request = pydantic_to_grpc_search_request(
+        collection_name, models.Vector.model_construct(elements=[]), 0,
+        filter_model, with_payload, with_vector, search_params,
+    )
+    request.ClearField("query_vector")
+    return request.SerializeToString()
+
+def grpc_search_request_from_prefix(
+    prefix: bytes, elements: Sequence[float], k_limit: int
+) -> points_service_pb2.SearchPointsRequest:
+    """Builds a SearchPointsRequest from a prefix plus raw query floats, with no Vector model in between."""
+    vector_bytes = _packed_vector_bytes(elements)
+    return points_service_pb2.SearchPointsRequest.FromString(
+        prefix + _SEARCH_QUERY_VECTOR_TAG + _encode_varint(len(vector_bytes)) + vector_bytes
+        + _SEARCH_K_LIMIT_TAG + _encode_varint(k_limit)
+    )
 
 # TODO: Add conversions for PointsService specific messages as they are implemented.
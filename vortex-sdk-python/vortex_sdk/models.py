@@ -5,9 +5,9 @@ These models provide Pythonic, type-hinted representations of the
 data structures used in the Vortex gRPC API. They are used for
 both request and response validation and serialization.
 """
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Mapping, Optional, Union
 from enum import Enum
-from pydantic import BaseModel, Field # type: ignore
+from pydantic import BaseModel, Field, PrivateAttr, StrictBool, StrictFloat, StrictStr, field_validator, model_validator # type: ignore
 
 # --- Enums ---
 
@@ -43,6 +43,12 @@ class Vector(BaseModel):
     """Represents a dense vector."""
     elements: List[float] = Field(default_factory=list)
 
+    @field_validator("elements", mode="before")
+    @classmethod
+    def _elements_from_array(cls, v: Any) -> Any:
+        # numpy arrays and array.array are accepted and stored as plain lists
+        return v.tolist() if hasattr(v, "tolist") else v
+
 # google.protobuf.Value can be null, number, string, boolean, struct (object), or list.
 PayloadValue = Union[None, float, str, bool, Dict[str, Any], List[Any]]
 
@@ -58,6 +64,53 @@ class PointStruct(BaseModel):
     vector: Vector
     payload: Optional[Payload] = None
 
+    # Wire form cached by conversions.pydantic_to_grpc_point_struct(..., cache_serialized=True).
+    # Reassigning a field or copying the point drops it (model_copy(update=...) writes the
+    # copy's fields directly); in-place edits of the nested vector/payload do not.
+    _pb_bytes: Optional[bytes] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in type(self).model_fields:
+            self._pb_bytes = None
+        super().__setattr__(name, value)
+
+    def __copy__(self) -> "PointStruct":
+        copied = super().__copy__()
+        copied._pb_bytes = None
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "PointStruct":
+        copied = super().__deepcopy__(memo)
+        copied._pb_bytes = None
+        return copied
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "PointStruct":
+        copied = super().model_copy(update=update, deep=deep)
+        copied._pb_bytes = None
+        return copied
+
+class PointBatch(BaseModel):
+    """
+    A column-oriented batch of points whose payloads all share the same keys, each key
+    holding a single primitive type (e.g. `user_id`, `ts`, `tag` across every point).
+    Upserting it writes each payload column in one typed loop instead of converting a
+    Payload per point. Columns must be homogeneous: a mixed column such as `[1.0, True]`
+    is rejected rather than coerced to one type (ints are still accepted as floats).
+    """
+    ids: List[str]
+    vectors: List[List[float]]
+    payload_columns: Dict[str, Union[List[StrictBool], List[StrictFloat], List[StrictStr]]] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _check_lengths(self) -> "PointBatch":
+        n = len(self.ids)
+        if len(self.vectors) != n:
+            raise ValueError(f"Expected {n} vectors, got {len(self.vectors)}")
+        for key, column in self.payload_columns.items():
+            if len(column) != n:
+                raise ValueError(f"Payload column '{key}' has {len(column)} values, expected {n}")
+        return self
+
 class ScoredPoint(BaseModel):
     """Represents a point returned from a search query, including its score."""
     id: str
@@ -136,6 +189,7 @@ __all__ = [
     "PayloadValue",
     "Payload",
     "PointStruct",
+    "PointBatch",
     "ScoredPoint",
     "Filter",
     "HnswConfigParams",